@@ -0,0 +1,42 @@
+import glob
+import io
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import ezdxf
+
+from drawscaffold.utils.dxf_export import DXF_FORMATS, write_dxf
+
+
+def best_time(doc, output_format, repeat):
+    timings = []
+    for _ in range(repeat):
+        buffer = io.BytesIO()
+        start = time.perf_counter()
+        write_dxf(doc, buffer, output_format)
+        timings.append(time.perf_counter() - start)
+    return min(timings), len(buffer.getvalue())
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    # the sample drawings kept in the repository root
+    for path in sorted(glob.glob(os.path.join(ROOT, "project_*.dxf"))):
+        doc = ezdxf.readfile(path)
+        print(os.path.basename(path))
+
+        ascii_size = None
+        for output_format in DXF_FORMATS:
+            try:
+                elapsed, size = best_time(doc, output_format, repeat)
+            except ImportError as e:
+                print(f'  {output_format:7s}  skipped, {e}')
+                continue
+            ascii_size = ascii_size or size
+            print(f'  {output_format:7s}  {elapsed * 1000:8.2f} ms  {size / 1024:9.1f} KiB  '
+                  f'{size / ascii_size:6.1%} of ascii')
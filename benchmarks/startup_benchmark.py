@@ -0,0 +1,83 @@
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+HEAVY_MODULES = ['ezdxf', 'cairosvg', 'PIL']
+
+FACADES = [
+    '--facade', 'inset,300,2000,250,F',
+    '--facade', 'outset,700,2000,250,F',
+    '--facade', 'outset,350,1200,400,R',
+    '--facade', 'inset,600,1200,400,R',
+    '--facade', 'inset,400,2000,250,B',
+    '--facade', 'inset,400,1200,400,L',
+    '--facade', 'outset,600,1200,500,L',
+    '--facade', 'inset,850,1200,100,L',
+]
+
+CASES = {
+    'top_down --calculate': ['top_down_main.py'] + FACADES + ['--height-in-cm', '2000', '--surface-slope', '12', '--calculate'],
+    'top_down --calculate-price': ['top_down_main.py'] + FACADES + ['--height-in-cm', '2000', '--surface-slope', '12', '--calculate-price'],
+    '2d --calculate': ['main.py', '--height-in-cm', '2000', '--width-in-cm', '1200', '--surface-slope', '12', '--calculate'],
+    '2d --calculate-price': ['main.py', '--height-in-cm', '2000', '--width-in-cm', '1200', '--surface-slope', '12', '--calculate-price'],
+}
+
+# runs the entry point in-process with its own argv, the modules to look for come on stdin; reports the exit code
+# and which of them were loaded by the end of the run
+LOADED_MODULES_SCRIPT = """
+import json, runpy, sys
+modules = json.loads(sys.stdin.read())
+sys.argv = json.loads(sys.argv[1])
+code = 0
+try:
+    runpy.run_path(sys.argv[0], run_name='__main__')
+except SystemExit as e:
+    code = e.code if isinstance(e.code, int) else (0 if e.code is None else 1)
+sys.stdout.flush()
+sys.stderr.write(json.dumps({'exit_code': code, 'loaded': [m for m in modules if m in sys.modules]}))
+"""
+
+
+def probe_entry_point(argv):
+    """Exit code, stdout and the heavy modules loaded by one run of an entry point."""
+    result = subprocess.run(
+        [sys.executable, '-c', LOADED_MODULES_SCRIPT, json.dumps(argv)],
+        cwd=ROOT, capture_output=True, text=True, input=json.dumps(HEAVY_MODULES)
+    )
+    probe = json.loads(result.stderr.strip().splitlines()[-1])
+    return probe['exit_code'], result.stdout, probe['loaded']
+
+
+def wall_time(argv, repeat):
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        subprocess.run([sys.executable] + argv, cwd=ROOT, capture_output=True, check=True)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def import_time(module):
+    start = time.perf_counter()
+    subprocess.run([sys.executable, '-c', f'import {module}'], cwd=ROOT, capture_output=True, check=True)
+    return time.perf_counter() - start
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    baseline = min(wall_time(['-c', 'pass'], repeat))
+    print(f'interpreter startup: {baseline * 1000:.1f} ms')
+    print(f'import ezdxf + drawing addon: {import_time("ezdxf.addons.drawing") * 1000:.1f} ms')
+    print()
+
+    for name, argv in CASES.items():
+        timings = wall_time(argv, repeat)
+        _, _, heavy = probe_entry_point(argv)
+        print(f'{name:28s} min {min(timings) * 1000:7.1f} ms  '
+              f'median {statistics.median(timings) * 1000:7.1f} ms  '
+              f'heavy modules loaded: {heavy or "none"}')
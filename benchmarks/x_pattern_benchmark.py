@@ -0,0 +1,48 @@
+import os
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from drawscaffold.calculate import MaterialCounter
+from drawscaffold.const.conts import HORIZONTAL_PART, VERTICAL_PART
+from drawscaffold.diagonal.patterns.x_pattern import draw_x_diagonal_pattern
+
+# (modules, floors): tall, wide and both
+GRIDS = [
+    (4, 50), (4, 200), (4, 800),
+    (50, 10), (200, 10), (800, 10),
+    (50, 50), (100, 100), (200, 200),
+]
+
+
+def connection_centers(module_count, floor_count, slope_rows=3):
+    # flat top rows over a few extra foot rows on the left, like a frame on a slope
+    columns = []
+    for module in range(module_count + 1):
+        extra = max(0, slope_rows - module)
+        ys = [-(extra - i) * (VERTICAL_PART - 20) for i in range(extra)]
+        ys += [floor * (VERTICAL_PART - 20) for floor in range(floor_count + 1)]
+        columns.append([(module * HORIZONTAL_PART, y) for y in ys])
+    return columns
+
+
+def best_time(module_count, floor_count, repeat):
+    centers = connection_centers(module_count, floor_count)
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        draw_x_diagonal_pattern(centers, None, module_count, floor_count, MaterialCounter())
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+if __name__ == "__main__":
+    repeat = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    for module_count, floor_count in GRIDS:
+        nodes = (module_count + 1) * (floor_count + 1)
+        elapsed = best_time(module_count, floor_count, repeat)
+        print(f'{module_count:4d} modules x {floor_count:4d} floors  {nodes:7d} nodes  '
+              f'{elapsed * 1000:8.2f} ms  {elapsed * 1e6 / nodes:6.2f} us/node')
@@ -0,0 +1,94 @@
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from drawscaffold.calculate_top_down import top_down_calc
+from drawscaffold.calculator.price_calculator import calculate_price
+from drawscaffold.utils.facades import build_facade_set
+from drawscaffold.utils.preview import DEFAULT_PREVIEW
+
+
+def available_workers() -> int:
+    if hasattr(os, "sched_getaffinity"):
+        return len(os.sched_getaffinity(0))
+    return os.cpu_count() or 1
+
+
+def run_job(job: dict) -> dict:
+    """Runs one top-down project, job keys follow the top_down_main.py flags."""
+    result = {"id": job.get("id")}
+
+    try:
+        facade_set = build_facade_set(job["facades"])
+        h = float(job["height_in_cm"])
+        slope = float(job["surface_slope"])
+        toe_board = bool(job.get("toe_board_text", False))
+        x_pattern = bool(job.get("use_x_pattern", False))
+        zigzag_pattern = bool(job.get("use_zigzag_pattern", False))
+
+        if job.get("calculate", True) or job.get("calculate_price", True):
+            material_dict = top_down_calc(False, facade_set, h, slope, toe_board, x_pattern, zigzag_pattern)
+            result["materials"] = material_dict
+
+            if job.get("calculate_price", True):
+                price, currency, symbol = calculate_price(material_dict)
+                result["price"] = {"price": price, "currency": currency, "symbol": symbol}
+
+        if job.get("image") or job.get("svg") or job.get("dxf"):
+            from drawscaffold.drawer_top_down import top_down_drawer
+
+            result["paths"] = top_down_drawer(False, facade_set, bool(job.get("image")), bool(job.get("dxf")),
+                                              bool(job.get("svg")), job.get("project_name", "project"),
+                                              job.get("output_id"),
+                                              dxf_text_paths=bool(job.get("dxf_text_paths")),
+                                              dxf_format=job.get("dxf_format", "ascii"),
+                                              use_cache=not job.get("no_cache"),
+                                              image_dpi=int(job.get("image_dpi", 300)),
+                                              preview=job.get("preview", DEFAULT_PREVIEW))
+    except Exception as e:
+        result["ok"] = False
+        result["error"] = f"{type(e).__name__}: {e}"
+        return result
+
+    result["ok"] = True
+    return result
+
+
+def run_batch(lines, out=sys.stdout, workers: int | None = None) -> int:
+    """Fans the JSONL jobs out over a process pool and writes one JSONL result per job as it finishes.
+
+    Returns the number of failed jobs.
+    """
+    failed = 0
+
+    def emit(result: dict):
+        nonlocal failed
+        if not result["ok"]:
+            failed += 1
+        out.write(json.dumps(result) + "\n")
+        out.flush()
+
+    with ProcessPoolExecutor(max_workers=workers or available_workers()) as executor:
+        futures = {}
+        for line_no, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+
+            try:
+                job = json.loads(line)
+            except json.JSONDecodeError as e:
+                emit({"id": None, "line": line_no, "ok": False, "error": f"invalid json: {e}"})
+                continue
+
+            job.setdefault("id", line_no)
+            futures[executor.submit(run_job, job)] = job["id"]
+
+        for future in as_completed(futures):
+            try:
+                emit(future.result())
+            except Exception as e:
+                # the worker itself died, only this job is lost
+                emit({"id": futures[future], "ok": False, "error": f"{type(e).__name__}: {e}"})
+
+    return failed
@@ -2,6 +2,11 @@ from typing import Sequence
 
 from drawscaffold.const.conts import VERTICAL_PART, HALF_VERTICAL_PART, HORIZONTAL_PART
 
+# material names are fixed, build them once instead of on every part
+_VERTICAL_NAMES = {False: f"vert_{int(VERTICAL_PART)}cm", True: f"vert_{int(HALF_VERTICAL_PART)}cm"}
+_PLATFORM_NAME = f"PLATFORM_{int(HORIZONTAL_PART)}"
+_SUPPORT_NAME = f"SUPPORT_{int(HORIZONTAL_PART)}"
+
 
 class Calculator2D:
     def L_part(self, start_point: Sequence[float]):
@@ -22,18 +27,16 @@ class Calculator2D:
     def vertical(self, start_point: Sequence[float], half_vertical: bool = False):
         x, y = start_point
         height = HALF_VERTICAL_PART if half_vertical else VERTICAL_PART
-        name = f"vert_{int(height)}cm"
+        name = _VERTICAL_NAMES[half_vertical]
         conn_center = (x, y + ((height-24) + (height-21)) / 2)
         return conn_center, name
 
     def horizontal(self):
-        L = HORIZONTAL_PART
-        name = f"PLATFORM_{int(L)}"
+        name = _PLATFORM_NAME
         return None, name
 
     def support(self):
-        L = HORIZONTAL_PART
-        name = f"SUPPORT_{int(L)}"
+        name = _SUPPORT_NAME
         return None, name
 
     def foot(self, start_point: Sequence[float],
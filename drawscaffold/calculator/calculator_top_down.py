@@ -2,6 +2,11 @@ from typing import Sequence
 
 from drawscaffold.const.conts import VERTICAL_PART, HALF_VERTICAL_PART, HORIZONTAL_PART, SMALL_HORIZONTAL_PART
 
+# material names are fixed, build them once instead of on every part
+_VERTICAL_NAMES = {False: f"vert_{int(VERTICAL_PART)}cm", True: f"vert_{int(HALF_VERTICAL_PART)}cm"}
+_PLATFORM_NAMES = {False: f"PLATFORM_{int(HORIZONTAL_PART)}", True: f"PLATFORM_{int(SMALL_HORIZONTAL_PART)}"}
+_SUPPORT_NAMES = {False: f"SUPPORT_{int(HORIZONTAL_PART)}", True: f"SUPPORT_{int(SMALL_HORIZONTAL_PART)}"}
+
 
 class CalculatorTopDown:
     def L_part(self, start_point: Sequence[float]):
@@ -22,23 +27,16 @@ class CalculatorTopDown:
     def vertical(self, start_point: Sequence[float], half_vertical: bool = False):
         x, y = start_point
         height = HALF_VERTICAL_PART if half_vertical else VERTICAL_PART
-        name = f"vert_{int(height)}cm"
+        name = _VERTICAL_NAMES[half_vertical]
         conn_center = (x, y + ((height-24) + (height-21)) / 2)
         return conn_center, name
 
     def horizontal(self, small: bool):
-        L = HORIZONTAL_PART
-        if small:
-            L = SMALL_HORIZONTAL_PART
-
-        name = f"PLATFORM_{int(L)}"
+        name = _PLATFORM_NAMES[small]
         return None, name
 
     def support(self, small: bool):
-        L = HORIZONTAL_PART
-        if small:
-            L = SMALL_HORIZONTAL_PART
-        name = f"SUPPORT_{int(L)}"
+        name = _SUPPORT_NAMES[small]
         return None, name
 
     def foot(self, start_point: Sequence[float],
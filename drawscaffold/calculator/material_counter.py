@@ -0,0 +1,94 @@
+from array import array
+
+
+class MaterialRegistry:
+    """Interns the material names of the catalogue to small integer ids.
+
+    Names made from user text, like the sign of a toe board text, are not interned: the registry lives as long as
+    the process and would grow with every distinct text.
+    """
+
+    def __init__(self):
+        self._ids = dict()
+        self._names = []
+
+    def id(self, material_name: str) -> int:
+        material_id = self._ids.get(material_name)
+        if material_id is None:
+            material_id = len(self._names)
+            self._ids[material_name] = material_id
+            self._names.append(material_name)
+
+        return material_id
+
+    def name(self, material_id: int) -> str:
+        return self._names[material_id]
+
+    def __len__(self):
+        return len(self._names)
+
+
+MATERIALS = MaterialRegistry()
+
+
+class ArrayMaterialCounter:
+    """Counts materials by id in a flat array, the name keyed dict is only built for the output.
+
+    Materials named after user text are counted in a dict of their own, see text_material_add.
+    """
+
+    def __init__(self, registry: MaterialRegistry = MATERIALS):
+        self.registry = registry
+        size = max(len(registry), 32)
+        self._counts = array('q', bytes(8 * size))
+        self._present = bytearray(size)
+        self._order = [] # ids, or names of text materials, in the order they were first added; the output keeps it
+        self._text_counts = dict()
+
+    def _grow(self, material_id: int):
+        extra = max(material_id + 1, 2 * len(self._counts)) - len(self._counts)
+        self._counts.extend(array('q', bytes(8 * extra)))
+        self._present.extend(bytes(extra))
+
+    def add_many(self, material_id: int, count: int):
+        if material_id >= len(self._counts):
+            self._grow(material_id)
+
+        if not self._present[material_id]:
+            self._present[material_id] = 1
+            self._order.append(material_id)
+
+        self._counts[material_id] += count
+
+    def material_add(self, material_name: str, count: int = 1):
+        self.add_many(self.registry.id(material_name), count)
+
+    def text_material_add(self, material_name: str, count: int = 1):
+        """Counts a material named after user text without interning its name."""
+        if material_name not in self._text_counts:
+            self._text_counts[material_name] = 0
+            self._order.append(material_name)
+
+        self._text_counts[material_name] += count
+
+    def scale(self, factor: int):
+        for material_id in self._order:
+            if isinstance(material_id, str):
+                self._text_counts[material_id] *= factor
+            else:
+                self._counts[material_id] *= factor
+
+    def items_by_id(self) -> list[tuple[int, int]]:
+        if self._text_counts:
+            raise ValueError("text materials have no id")
+        return [(material_id, self._counts[material_id]) for material_id in self._order]
+
+    @property
+    def counter_dict(self) -> dict:
+        counts = dict()
+        for material_id in self._order:
+            if isinstance(material_id, str):
+                counts[material_id] = self._text_counts[material_id]
+            else:
+                counts[self.registry.name(material_id)] = self._counts[material_id]
+        return counts
@@ -1,3 +1,5 @@
+from bisect import bisect_right
+
 pricing_list = [
     {"start": 1, "end": 20, "price": 5_000, "m2": None, "currency": "TRY", "symbol": "₺"},
     {"start": 20, "end": 50, "price": 10_000, "m2": None, "currency": "TRY", "symbol": "₺"},
@@ -16,17 +18,6 @@ one_time_pricing_list = {
 
 MATERIAL_M2 = 5
 
-def _total_pricing_materials(material_list: dict) -> int:
-    total = 0
-    for material_name in material_list.keys():
-        if not material_name in pricing_materials:
-            continue
-
-        count = material_list[material_name]
-        total += count
-
-    return total
-
 def _total_one_time_pricing(material_list: dict) -> int:
     total = 0
     for material_name in one_time_pricing_list.keys():
@@ -38,31 +29,57 @@ def _total_one_time_pricing(material_list: dict) -> int:
 
     return total
 
-def calculate_price(material_list: dict):
-    total_count = _total_pricing_materials(material_list)
 
-    pricing_method = {}
-    for pricing in pricing_list:
-        if pricing["end"] > total_count:
-            pricing_method = pricing
-            break
+class PriceTable:
+    """The pricing tiers compiled once: tier ends sorted for bisect and the priced materials as a tuple.
 
-    if not pricing_method:
-        return -1, "-1", "-1"
+    Built from the module lists at import, make a new one after changing them.
+    """
 
-    if pricing_method["price"]:
-        return pricing_method["price"], pricing_method["currency"], pricing_method["symbol"]
+    def __init__(self, tiers: list[dict] = pricing_list, materials: list[str] = pricing_materials,
+                 material_m2: float = MATERIAL_M2):
+        self.materials = tuple(dict.fromkeys(materials))
+        self._missing = (0,) * len(self.materials)
+        self.material_m2 = material_m2
 
-    m2_price = pricing_method["m2"]
-    total_price = 0
-    for material_name in material_list.keys():
-        if not material_name in pricing_materials:
-            continue
+        # the first tier whose end is past the count wins, so a tier ending before an earlier one never does
+        self.ends, self.tiers = [], []
+        for tier in tiers:
+            if not self.ends or tier["end"] > self.ends[-1]:
+                self.ends.append(tier["end"])
+                self.tiers.append(tier)
 
-        count = material_list[material_name]
-        total_m2 = count * MATERIAL_M2
-        price = total_m2 * m2_price
+    def priced_count(self, material_list: dict) -> int:
+        return sum(map(material_list.get, self.materials, self._missing))
+
+    def tier(self, total_count: int) -> dict | None:
+        i = bisect_right(self.ends, total_count)
+        return self.tiers[i] if i < len(self.tiers) else None
+
+    def price(self, material_list: dict):
+        return self._price(self.priced_count(material_list))
+
+    def prices(self, batch) -> list[tuple]:
+        """Prices many material dicts in one pass, one (price, currency, symbol) each."""
+        return [self._price(total_count) for total_count in map(self.priced_count, batch)]
+
+    def _price(self, total_count: int):
+        tier = self.tier(total_count)
+        if tier is None:
+            return -1, "-1", "-1"
+
+        if tier["price"]:
+            return tier["price"], tier["currency"], tier["symbol"]
+
+        return total_count * self.material_m2 * tier["m2"], tier["currency"], tier["symbol"]
+
+
+PRICE_TABLE = PriceTable()
+
+
+def calculate_price(material_list: dict):
+    return PRICE_TABLE.price(material_list)
 
-        total_price += price
 
-    return total_price, pricing_method["currency"], pricing_method["symbol"]
+def calculate_prices(batch) -> list[tuple]:
+    return PRICE_TABLE.prices(batch)
@@ -0,0 +1,258 @@
+from bisect import bisect_left
+from math import inf, radians, tan
+from typing import Callable, NamedTuple
+
+from drawscaffold.const.conts import VERTICAL_PART, HALF_VERTICAL_PART, HORIZONTAL_PART, FOOT_PART, FOOT_INSIDE_PART, \
+    HALF_FOOT_PART, COMPLETE_FOOT_PART, ADJUSTMENT_SHAFT1, ADJUSTMENT_SHAFT2, ADJUSTMENT_SHAFT3
+
+# columns from which the selection runs on numpy arrays, below that the import costs more than the loop
+VECTOR_MIN_COLUMNS = 128
+
+_STEP = VERTICAL_PART - 20
+_HALF_STEP = HALF_VERTICAL_PART - 20
+_FOOT = FOOT_PART - FOOT_INSIDE_PART
+_HALF_FOOT = HALF_FOOT_PART - FOOT_INSIDE_PART
+_COMPLETE_FOOT = COMPLETE_FOOT_PART - FOOT_INSIDE_PART
+_VERTICAL_LOCK = ((VERTICAL_PART - 24) + (VERTICAL_PART - 21)) / 2
+
+
+class BaseKit(NamedTuple):
+    """What stands under a column whose surface is `value` below the highest one.
+
+    `lock` and `top` take the surface height and `value` (scalars or numpy arrays) and give the lock center of the
+    base and the height the verticals start from; the same expressions as the drawer so the floats match.
+    """
+    limit: float                  # chosen when value <= limit, the first kit of the ladder wins
+    base: str                     # foot, half_foot, complete_foot or adjustment
+    lock: Callable
+    top: Callable | None = None
+    shaft: float | None = None    # adjustment height
+    extra: str | None = None      # half_vertical or vertical put on the base
+
+
+def _foot_lock(sp, v):
+    return (sp + v) - 2.0
+
+
+def _low_foot_lock(sp, v):
+    return (sp + (v - _HALF_STEP)) - 2.0
+
+
+def _slid_foot_lock(sp, v):
+    # foot() without lock_start_y
+    return 0.0 - 2.0
+
+
+def _slid_adjustment_lock(shaft):
+    def lock(sp, v):
+        return ((sp - (shaft * 0.8 - v)) + (v - 0.5)) - 2.0
+    return lock
+
+
+def _adjustment_lock(sp, v):
+    return (sp + (v - 0.5)) - 2.0
+
+
+def _top(sp, v):
+    return sp + v
+
+
+def _low_top(sp, v):
+    return sp + (v - _HALF_STEP)
+
+
+def _slid_top(sp, v):
+    return (sp + (v - _COMPLETE_FOOT)) + _COMPLETE_FOOT
+
+
+FLAT_KIT = BaseKit(0.0, "foot", lambda sp, v: (sp + 0.5) - 2.0)
+
+# surface less than a floor below the highest one, value is the difference
+SHORT_KITS = (
+    BaseKit(_FOOT, "foot", _foot_lock),
+    BaseKit(ADJUSTMENT_SHAFT1 * 0.8, "adjustment", _slid_adjustment_lock(ADJUSTMENT_SHAFT1), shaft=ADJUSTMENT_SHAFT1),
+    BaseKit(ADJUSTMENT_SHAFT2 * 0.8, "adjustment", _slid_adjustment_lock(ADJUSTMENT_SHAFT2), shaft=ADJUSTMENT_SHAFT2),
+    BaseKit(_HALF_FOOT, "half_foot", _foot_lock),
+    BaseKit(ADJUSTMENT_SHAFT3 * 0.8, "adjustment", _slid_adjustment_lock(ADJUSTMENT_SHAFT3), shaft=ADJUSTMENT_SHAFT3),
+    BaseKit(_COMPLETE_FOOT, "complete_foot", _foot_lock),
+    BaseKit(inf, "complete_foot", _slid_foot_lock),
+)
+
+# a floor or more below, value is what is left over the whole verticals
+TALL_KITS = (
+    BaseKit(_FOOT, "foot", _foot_lock, _top),
+    BaseKit(ADJUSTMENT_SHAFT1 * 0.8, "adjustment", _adjustment_lock, _top, shaft=ADJUSTMENT_SHAFT1),
+    BaseKit(ADJUSTMENT_SHAFT2 * 0.8, "adjustment", _adjustment_lock, _top, shaft=ADJUSTMENT_SHAFT2),
+    BaseKit(_HALF_FOOT, "half_foot", _foot_lock, _top),
+    BaseKit(ADJUSTMENT_SHAFT3 * 0.8, "adjustment", _adjustment_lock, _top, shaft=ADJUSTMENT_SHAFT3),
+    BaseKit(_HALF_STEP + _FOOT, "foot", _low_foot_lock, _low_top, extra="half_vertical"),
+    BaseKit(_HALF_STEP + _HALF_FOOT, "half_foot", _low_foot_lock, _low_top, extra="half_vertical"),
+    BaseKit(_COMPLETE_FOOT, "complete_foot", _foot_lock, _top),
+    BaseKit(inf, "complete_foot", _slid_foot_lock, _slid_top, extra="vertical"),
+)
+
+
+def _threshold_table(ladder):
+    # kits shadowed by an earlier, larger limit never match, the rest cover consecutive ranges
+    limits, kits = [], []
+    for kit in ladder:
+        if not limits or kit.limit > limits[-1]:
+            limits.append(kit.limit)
+            kits.append(kit)
+    return limits, kits
+
+
+_SHORT_LIMITS, _SHORT_TABLE = _threshold_table(SHORT_KITS)
+_TALL_LIMITS, _TALL_TABLE = _threshold_table(TALL_KITS)
+
+# kit ids of a selection index this tuple: flat, short then tall
+KITS = (FLAT_KIT, *_SHORT_TABLE, *_TALL_TABLE)
+_SHORT_FIRST = 1
+_TALL_FIRST = _SHORT_FIRST + len(_SHORT_TABLE)
+
+
+def _numpy():
+    try:
+        import numpy
+    except ImportError:
+        return None
+    return numpy
+
+
+def surface_start_points(column_count: int, width_cm: float, slope_deg: float):
+    """Surface height under every column of a frame standing on a slope, the frame centered on `width_cm`."""
+    x0 = width_cm / 2.0
+    m = tan(radians(slope_deg))
+
+    np = _numpy() if column_count >= VECTOR_MIN_COLUMNS else None
+    if np is not None:
+        return 0 - m * (np.arange(column_count) * HORIZONTAL_PART - x0)
+
+    return [0 - m * (i * HORIZONTAL_PART - x0) for i in range(column_count)]
+
+
+class SurfaceBases:
+    """The base kit chosen under every column, with its lock height and the verticals stacked on it."""
+
+    def __init__(self, start_points: list[float], kits: list[int], locks: list[float], tops: list[float],
+                 vertical_counts: list[int]):
+        self.start_points = start_points
+        self.kits = kits
+        self.locks = locks
+        self.tops = tops
+        self.vertical_counts = vertical_counts
+
+    @property
+    def biggest_point(self) -> float:
+        return max(self.start_points)
+
+    def add_materials(self, material_counter, calculator):
+        """Adds the bases and verticals, each material once with its total, in the order a column walk adds them."""
+        counts = {} # keeps the order the materials first show up in
+
+        def add(name, count):
+            counts[name] = counts.get(name, 0) + count
+
+        stacked = sum(self.vertical_counts)
+        stack_column = next(i for i, n in enumerate(self.vertical_counts) if n) if stacked else None
+        _, vertical_name = calculator.vertical((0, 0))
+
+        # every kit in the order of the column it is first used in, the verticals come after the kit of their column
+        for kit_id in dict.fromkeys(self.kits):
+            kit = KITS[kit_id]
+            if stack_column is not None and self.kits.index(kit_id) > stack_column:
+                add(vertical_name, stacked)
+                stack_column = None
+
+            count = self.kits.count(kit_id)
+            add(_base_name(calculator, kit), count)
+            if kit.extra:
+                add(calculator.vertical((0, 0), half_vertical=kit.extra == "half_vertical")[1], count)
+
+        if stack_column is not None:
+            add(vertical_name, stacked)
+
+        for name, count in counts.items():
+            material_counter.material_add(name, count)
+
+    def connection_centers(self) -> list[list[tuple]]:
+        """Lock centers of the bases and of the verticals under the lowest floor, one list per column."""
+        columns = []
+        for i, (kit_id, lock, top, n) in enumerate(zip(self.kits, self.locks, self.tops, self.vertical_counts)):
+            x = i * HORIZONTAL_PART
+            kit = KITS[kit_id]
+            centers = [(x, lock)]
+
+            if kit.extra == "half_vertical":
+                top += _HALF_STEP
+            elif kit.extra == "vertical":
+                centers.append((x, top + _VERTICAL_LOCK))
+                top += _STEP
+
+            for _ in range(n):
+                centers.append((x, top + _VERTICAL_LOCK))
+                top += _STEP
+
+            columns.append(centers)
+        return columns
+
+
+def _base_name(calculator, kit: BaseKit) -> str:
+    if kit.base == "adjustment":
+        return calculator.adjustment((0, 0), kit.shaft, 0)[1]
+    return calculator.foot((0, 0), half_foot=kit.base == "half_foot", complete_foot=kit.base == "complete_foot")[1]
+
+
+def select_bases(start_points) -> SurfaceBases:
+    """Picks the base kit of every column from the threshold tables, on numpy arrays for long frames."""
+    np = _numpy() if len(start_points) >= VECTOR_MIN_COLUMNS else None
+    if np is not None:
+        return _select_vectorized(np, np.asarray(start_points, dtype=float))
+
+    biggest_point = max(start_points)
+    kits, locks, tops, vertical_counts = [], [], [], []
+    for sp in start_points:
+        difference = biggest_point - sp
+        vertical_count = 0
+        if difference == 0:
+            kit_id, value = 0, difference
+        elif difference >= _STEP:
+            value = difference % _STEP
+            vertical_count = int(difference // _STEP)
+            kit_id = _TALL_FIRST + bisect_left(_TALL_LIMITS, value)
+        else:
+            value = difference
+            kit_id = _SHORT_FIRST + bisect_left(_SHORT_LIMITS, value)
+
+        kit = KITS[kit_id]
+        kits.append(kit_id)
+        locks.append(kit.lock(sp, value))
+        tops.append(kit.top(sp, value) if kit.top else None)
+        vertical_counts.append(vertical_count)
+
+    return SurfaceBases(list(start_points), kits, locks, tops, vertical_counts)
+
+
+def _select_vectorized(np, start_points) -> SurfaceBases:
+    difference = start_points.max() - start_points
+    tall = difference >= _STEP
+    flat = difference == 0
+
+    value = np.where(tall, difference % _STEP, difference)
+    vertical_counts = np.where(tall, difference // _STEP, 0).astype(np.int64)
+    kits = np.where(tall, _TALL_FIRST + np.searchsorted(_TALL_LIMITS, value),
+                    _SHORT_FIRST + np.searchsorted(_SHORT_LIMITS, value))
+    kits[flat] = 0
+
+    locks = np.empty_like(start_points)
+    tops = np.full_like(start_points, np.nan)
+    for kit_id in np.unique(kits).tolist():
+        kit = KITS[kit_id]
+        mask = kits == kit_id
+        locks[mask] = kit.lock(start_points[mask], value[mask])
+        if kit.top:
+            tops[mask] = kit.top(start_points[mask], value[mask])
+
+    return SurfaceBases(start_points.tolist(), kits.tolist(), locks.tolist(),
+                        [top if kit_id >= _TALL_FIRST else None for kit_id, top in zip(kits.tolist(), tops.tolist())],
+                        vertical_counts.tolist())
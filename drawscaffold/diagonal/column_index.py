@@ -0,0 +1,95 @@
+import math
+from bisect import bisect_left, bisect_right
+
+
+class ColumnIndex:
+    """The connection centers of every column sorted by height, built once per diagonal pattern.
+
+    Answers "which node of a column is closest to a given distance from a point" by bisecting on the height that
+    distance puts the node at, instead of scanning the column.
+    """
+
+    def __init__(self, connection_centers, drop_top: bool = False):
+        self.columns = []
+        self.ys = []
+
+        for col in connection_centers:
+            points = sorted(col, key=lambda p: p[1])
+            if drop_top and points:
+                # the top row of a column carries no diagonal
+                top_y = points[-1][1]
+                points = [p for p in points if p[1] != top_y]
+
+            self.columns.append(points)
+            self.ys.append([p[1] for p in points])
+
+    def __len__(self):
+        return len(self.columns)
+
+    def __getitem__(self, k: int) -> list:
+        return self.columns[k]
+
+    def within_distance(self, k: int, from_pt, distance: float, tolerance: float) -> list:
+        """Nodes of column `k` whose distance to `from_pt` is within `tolerance` of `distance`, lowest first."""
+        col = self.columns[k]
+        ys = self.ys[k]
+        if not col:
+            return []
+
+        x0, y0 = from_pt
+        dx = abs(col[0][0] - x0)
+        # the two height bands that distance allows, widened a little and checked exactly below
+        inner = math.sqrt(max((distance - tolerance) ** 2 - dx * dx, 0.0)) - 1.0
+        outer = math.sqrt(max((distance + tolerance) ** 2 - dx * dx, 0.0)) + 1.0
+
+        bands = [(bisect_left(ys, y0 - outer), bisect_right(ys, y0 - inner))]
+        if inner > 0:
+            bands.append((bisect_left(ys, y0 + inner), bisect_right(ys, y0 + outer)))
+        else:
+            bands = [(bands[0][0], bisect_right(ys, y0 + outer))]
+
+        return [col[j] for lo, hi in bands for j in range(lo, hi)
+                if abs(math.hypot(col[j][0] - x0, col[j][1] - y0) - distance) < tolerance]
+
+    def nearest_at_distance(self, k: int, from_pt, distance: float, direction: str = "down", min_idx: int | None = None,
+                            min_dy: float = 0.0, min_angle_deg: float | None = None) -> int | None:
+        """Index of the node of column `k` whose distance to `from_pt` is closest to `distance`.
+
+        Only nodes below (`down`, larger y) or above (`up`) `from_pt`, past `min_idx`, at least `min_dy` away in
+        height and steeper than `min_angle_deg` are considered. Ties go to the node met first in that direction.
+        """
+        col = self.columns[k]
+        ys = self.ys[k]
+        if not col:
+            return None
+
+        x0, y0 = from_pt
+        dx = abs(col[0][0] - x0)
+
+        # diagonals flatter than the angle limit are as invalid as ones shorter than min_dy
+        min_height = min_dy
+        if min_angle_deg is not None:
+            min_height = max(min_height, math.tan(math.radians(min_angle_deg)) * (dx if dx != 0 else 1e-9))
+
+        target = math.sqrt(max(distance * distance - dx * dx, 0.0))
+        first = 0 if min_idx is None else min_idx + 1
+
+        if direction == "down":
+            lo = max(first, bisect_left(ys, y0 + min_height), bisect_left(ys, y0))
+            hi = len(ys)
+            pos = bisect_left(ys, y0 + target, lo, hi)
+            candidates = (pos - 1, pos)
+        else:
+            lo = first
+            hi = min(bisect_right(ys, y0 - min_height), bisect_right(ys, y0))
+            pos = bisect_right(ys, y0 - target, lo, hi)
+            candidates = (pos, pos - 1)
+
+        best_j, best_err = None, float('inf')
+        for j in candidates:
+            if lo <= j < hi:
+                err = abs(math.hypot(col[j][0] - x0, col[j][1] - y0) - distance)
+                if err < best_err:
+                    best_err, best_j = err, j
+
+        return best_j
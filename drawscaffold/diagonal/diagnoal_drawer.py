@@ -29,7 +29,6 @@ def draw_x_diagonal_pattern(connection_centers, drawer, module_count,
             VERTICAL_PART=VERTICAL_PART,
             start_side=side,
             start_left_idx=0,
-            tol=10.0,
             min_angle_deg=20
         )
 
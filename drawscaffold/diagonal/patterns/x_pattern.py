@@ -1,9 +1,14 @@
 import math
 from enum import Enum
+from typing import TYPE_CHECKING
 
 from drawscaffold.calculator.calculator_2d import Calculator2D
 from drawscaffold.const.conts import DIAGONAL_PART
-from drawscaffold.shapes.shapes_2d import Drawer2D
+from drawscaffold.diagonal.column_index import ColumnIndex
+
+if TYPE_CHECKING:
+    # shapes_2d pulls in ezdxf, the calculation-only path must not pay for it
+    from drawscaffold.shapes.shapes_2d import Drawer2D
 
 
 class SIDE(Enum):
@@ -26,6 +31,13 @@ def _estimate_vstep(column_points):
         return None
     ys = [p[1] for p in column_points]
     ys.sort()
+    return _median_step(ys)
+
+
+def _median_step(ys):
+    # ys sıralı olmalı
+    if len(ys) < 2:
+        return None
     diffs = [abs(ys[i + 1] - ys[i]) for i in range(len(ys) - 1)]
     diffs = [d for d in diffs if d > 1e-6]
     if not diffs:
@@ -37,7 +49,8 @@ def _estimate_vstep(column_points):
     return 0.5 * (diffs[mid - 1] + diffs[mid])
 
 
-def _find_next(centers, module_idx, bottom_side, value, max_y, tolerance=5.0, module_add_num=1):
+def _find_next(centers, module_idx, bottom_side, value, max_y, tolerance=5.0, module_add_num=1,
+               index: ColumnIndex | None = None, vsteps: list | None = None):
     if not centers[module_idx]:
         return None, bottom_side
 
@@ -49,17 +62,24 @@ def _find_next(centers, module_idx, bottom_side, value, max_y, tolerance=5.0, mo
         return None, bottom_side
 
     target_col = centers[target_idx]
-    vstep = _estimate_vstep(centers[module_idx]) or _estimate_vstep(target_col)
+    if vsteps is not None:
+        vstep = vsteps[module_idx] or vsteps[target_idx]
+    else:
+        vstep = _estimate_vstep(centers[module_idx]) or _estimate_vstep(target_col)
 
-    for point in target_col:
+    if index is not None:
+        # sadece çapraz boyu mesafesindeki iki yükseklik bandına bakılır
+        in_reach = index.within_distance(target_idx, value, DIAGONAL_PART, tolerance)
+    else:
+        in_reach = [point for point in target_col if abs(dist2d(point, value) - DIAGONAL_PART) < tolerance]
+
+    for point in in_reach:
         if point[1] > max_y + tolerance:
             continue
-        d = dist2d(point, value)
-        if abs(d - DIAGONAL_PART) < tolerance:
-            if vstep is not None:
-                if abs(abs(point[1] - y_value) - vstep) > max(8.0, tolerance):
-                    continue
-            candidates.append(point)
+        if vstep is not None:
+            if abs(abs(point[1] - y_value) - vstep) > max(8.0, tolerance):
+                continue
+        candidates.append(point)
 
     if not candidates:
         return None, bottom_side
@@ -81,11 +101,14 @@ def _find_next(centers, module_idx, bottom_side, value, max_y, tolerance=5.0, mo
     return the_one, new_direction
 
 
-def draw_x_diagonal_pattern(connection_centers, drawer: Drawer2D | None, module_count, vertical_count,
+def draw_x_diagonal_pattern(connection_centers, drawer: 'Drawer2D | None', module_count, vertical_count,
                             material_counter=None):
     calculator = Calculator2D()
-    max_y_per_col = [max(p[1] for p in col) if col else None for col in connection_centers]
-    min_y_per_col = [min(p[1] for p in col) if col else None for col in connection_centers]
+
+    # kolon istatistikleri yürüyüşten önce bir kere hesaplanır
+    index = ColumnIndex(connection_centers)
+    vsteps = [_median_step(ys) for ys in index.ys]
+    min_y_per_col = [ys[0] if ys else None for ys in index.ys]
 
     vert_idx = 0
     vert_add_num = 1
@@ -146,7 +169,7 @@ def draw_x_diagonal_pattern(connection_centers, drawer: Drawer2D | None, module_
             s_top_vert_add_num = 1 if s_top_side == SIDE.BOTTOM else -1
 
         B_R, s_bottom_side = _find_next(connection_centers, s_mod_idx, s_bottom_side, B_L, b_top_y_point,
-                                        module_add_num=s_add_module_num)
+                                        module_add_num=s_add_module_num, index=index, vsteps=vsteps)
 
         if B_R and b_top_y_point - B_R[1] >= -3 and b_top_y_point - B_L[1] >= -3:
             if drawer:
@@ -170,7 +193,7 @@ def draw_x_diagonal_pattern(connection_centers, drawer: Drawer2D | None, module_
 
         if s_use_both_side:
             T_R, s_top_side = _find_next(connection_centers, s_mod_idx, s_top_side, T_L, b_top_y_point,
-                                         module_add_num=s_add_module_num)
+                                         module_add_num=s_add_module_num, index=index, vsteps=vsteps)
 
             if T_R and b_top_y_point - T_R[1] >= -3 and b_top_y_point - T_L[1] >= -3:
                 if drawer:
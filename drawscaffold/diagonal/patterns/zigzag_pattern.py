@@ -1,80 +1,49 @@
 import math
+from bisect import bisect_left
 
 from drawscaffold.calculator.calculator_2d import Calculator2D
-
-
-def _is_valid_diagonal(a, b, min_dy=0.0, min_angle_deg=None):
-    x1, y1 = a
-    x2, y2 = b
-    dx = abs(x2 - x1)
-    dy = abs(y2 - y1)
-    if dy < min_dy:
-        return False
-    if min_angle_deg is not None:
-        angle = math.degrees(math.atan2(dy, dx if dx != 0 else 1e-9))
-        if angle < min_angle_deg:
-            return False
-    return True
-
-
-def _best_index_by_length(from_pt, target_col, guess_idx, D, tol,
-                          min_idx_strict=None,
-                          min_dy=0.0, min_angle_deg=None, direction="down"):
-    xL, yL = from_pt
-    best_j, best_err = None, float('inf')
-
-    search_range = 2  # ±2'lik pencere
-
-    # Arama aralığını belirle ve sadece doğru yönde olanları değerlendir
-    start_j = max(0, guess_idx - search_range)
-    end_j = min(len(target_col), guess_idx + search_range + 1)
-
-    # Doğru yönde arama yapmak için sıralamayı ayarla
-    indices_to_check = range(start_j, end_j)
-    if direction == "up":
-        indices_to_check = reversed(indices_to_check)
-
-    for j in indices_to_check:
-        if (min_idx_strict is not None) and (j <= min_idx_strict):
-            continue
-
-        cand = target_col[j]
-
-        # Yön kontrolü: 'from_pt' noktasından 'cand' noktasına doğru gidiliyor mu?
-        if direction == "down" and cand[1] < from_pt[1]:
-            continue
-        if direction == "up" and cand[1] > from_pt[1]:
-            continue
-
-        if not _is_valid_diagonal(from_pt, cand, min_dy=min_dy, min_angle_deg=min_angle_deg):
-            continue
-
-        dist = math.hypot(cand[0] - xL, cand[1] - yL)
-        err = abs(dist - D)
-
-        if err < best_err:
-            best_err, best_j = err, j
-
-    return best_j
+from drawscaffold.diagonal.column_index import ColumnIndex
 
 
 def draw_zigzag_pair_length_constrained(left_col, right_col, drawer,
                                         DIAGONAL_PART, VERTICAL_PART,
                                         start_side="left", start_left_idx=0, start_right_idx=0,
-                                        tol=10.0,
                                         min_dy=None, min_angle_deg=None, material_count=None):
+    if not left_col or not right_col:
+        return
+
+    _draw_zigzag_pair(ColumnIndex([left_col, right_col]), 0, drawer, DIAGONAL_PART, VERTICAL_PART,
+                      start_side, start_left_idx, start_right_idx, min_dy, min_angle_deg, material_count)
+
+
+def _draw_zigzag_pair(index: ColumnIndex, k: int, drawer,
+                      DIAGONAL_PART, VERTICAL_PART,
+                      start_side="left", start_left_idx=0, start_right_idx=0,
+                      min_dy=None, min_angle_deg=None, material_count=None):
     calculator = Calculator2D()
 
+    left_col, right_col = index[k], index[k + 1]
     if not left_col or not right_col:
         return
 
     if min_dy is None:
         min_dy = 0.7 * VERTICAL_PART
 
-    dx = abs(right_col[0][0] - left_col[0][0])
-    dy_target = math.sqrt(max(DIAGONAL_PART * DIAGONAL_PART - dx * dx, 0.0))
-    step = int(round(dy_target / VERTICAL_PART))
-    base = int(round((right_col[0][1] - left_col[0][1]) / VERTICAL_PART))
+    def diagonal(a, b):
+        if drawer:
+            drawer.draw_diagonal(a, b)
+        else:
+            _, name = calculator.diagonal()
+            material_count.material_add(name)
+
+    # sonraki düğüm, çaprazın boyuna en yakın mesafedeki aşağı doğru düğüm
+    def next_right(i, last_R):
+        return index.nearest_at_distance(k + 1, left_col[i], DIAGONAL_PART, "down", min_idx=last_R,
+                                         min_dy=min_dy, min_angle_deg=min_angle_deg)
+
+    def next_left(j, last_L):
+        return index.nearest_at_distance(k, right_col[j], DIAGONAL_PART, "down", min_idx=last_L,
+                                         min_dy=min_dy, min_angle_deg=min_angle_deg)
 
     last_L, last_R = start_left_idx - 1, start_right_idx - 1
 
@@ -83,34 +52,16 @@ def draw_zigzag_pair_length_constrained(left_col, right_col, drawer,
         while True:
             if i >= len(left_col): break
 
-            j_guess = int(round(i - base + step))
-            j = _best_index_by_length(
-                left_col[i], right_col, j_guess,
-                DIAGONAL_PART, tol, min_idx_strict=last_R,
-                min_dy=min_dy, min_angle_deg=min_angle_deg, direction="down"
-            )
+            # L[i] -> R[j] ( / )
+            j = next_right(i, last_R)
             if j is None: break
-            if drawer:
-                drawer.draw_diagonal(left_col[i], right_col[j])
-            else:
-                _, name = calculator.diagonal()
-                material_count.material_add(name)
-
+            diagonal(left_col[i], right_col[j])
             last_L, last_R = i, j
 
             # R[j] -> L[i2] ( \ ) - Aşağı doğru çizim
-            i2_guess = int(round(j + base + step))
-            i2 = _best_index_by_length(
-                right_col[j], left_col, i2_guess,
-                DIAGONAL_PART, tol, min_idx_strict=last_L,
-                min_dy=min_dy, min_angle_deg=min_angle_deg, direction="down"
-            )
+            i2 = next_left(j, last_L)
             if i2 is None: break
-            if drawer:
-                drawer.draw_diagonal(right_col[j], left_col[i2])
-            else:
-                _, name = calculator.diagonal()
-                material_count.material_add(name)
+            diagonal(right_col[j], left_col[i2])
             last_L = i2
             i = i2
     else:  # start_side == "right"
@@ -119,43 +70,22 @@ def draw_zigzag_pair_length_constrained(left_col, right_col, drawer,
             if j >= len(right_col): break
 
             # R[j] -> L[i] ( \ ) - Aşağı doğru çizim
-            i_guess = int(round(j + base + step))
-            i = _best_index_by_length(
-                right_col[j], left_col, i_guess,
-                DIAGONAL_PART, tol, min_idx_strict=last_L,
-                min_dy=min_dy, min_angle_deg=min_angle_deg, direction="down"
-            )
+            i = next_left(j, last_L)
             if i is None: break
-            if drawer:
-                drawer.draw_diagonal(right_col[j], left_col[i])
-            else:
-                _, name = calculator.diagonal()
-                material_count.material_add(name)
+            diagonal(right_col[j], left_col[i])
             last_R, last_L = j, i
 
             # L[i] -> R[j2] ( / ) - Aşağı doğru çizim
-            j2_guess = int(round(i - base + step))
-            j2 = _best_index_by_length(
-                left_col[i], right_col, j2_guess,
-                DIAGONAL_PART, tol, min_idx_strict=last_R,
-                min_dy=min_dy, min_angle_deg=min_angle_deg, direction="down"
-            )
+            j2 = next_right(i, last_R)
             if j2 is None: break
-            if drawer:
-                drawer.draw_diagonal(left_col[i], right_col[j2])
-            else:
-                _, name = calculator.diagonal()
-                material_count.material_add(name)
+            diagonal(left_col[i], right_col[j2])
             last_R = j2
             j = j2
 
 
-def draw_zigzag_diagonal_pattern(connection_centers, drawer, module_count,
-                                 DIAGONAL_PART, VERTICAL_PART, r_diagonal, material_count=None):
+def _diagonal_indexes(module_count, material_count=None):
     calculator = Calculator2D()
 
-    max_y_per_col = [max(p[1] for p in col) if col else None for col in connection_centers]
-
     diagonal_indexes = []
     group_size = 5
     for i in range(0, module_count, group_size):
@@ -177,41 +107,137 @@ def draw_zigzag_diagonal_pattern(connection_centers, drawer, module_count,
         starter = calculator.start()
         material_count.material_add(starter)
 
+    return sorted(set(diagonal_indexes))
 
-    diagonal_indexes = sorted(set(diagonal_indexes))
+
+def draw_zigzag_diagonal_pattern(connection_centers, drawer, module_count,
+                                 DIAGONAL_PART, VERTICAL_PART, r_diagonal, material_count=None):
+    diagonal_indexes = _diagonal_indexes(module_count, material_count)
 
     side = "right"
     if r_diagonal:
         side = "left"
 
+    # her kolon bir kere sıralanır, en üst sıra çaprazsız kalır
+    index = ColumnIndex(connection_centers, drop_top=True)
+    diagonal_columns = set(diagonal_indexes)
+
     for k in range(len(connection_centers) - 1):
-        if k not in diagonal_indexes:
+        if k not in diagonal_columns:
             continue
 
-        L_raw = connection_centers[k]
-        R_raw = connection_centers[k + 1]
-
-        max_y_L = max_y_per_col[k]
-        max_y_R = max_y_per_col[k + 1]
-
-        L = [p for p in L_raw if p[1] != max_y_L]
-        R = [p for p in R_raw if p[1] != max_y_R]
-
-        if not L or not R:
+        if not index[k] or not index[k + 1]:
             continue
 
-        draw_zigzag_pair_length_constrained(
-            L, R, drawer,
+        _draw_zigzag_pair(
+            index, k, drawer,
             DIAGONAL_PART=DIAGONAL_PART,
             VERTICAL_PART=VERTICAL_PART,
             start_side=side,
             start_left_idx=0,
             start_right_idx=0,
-            tol=10.0,
             min_angle_deg=20,
             material_count=material_count,
         )
 
         side = "right" if side == "left" else "left"
 
-    return diagonal_indexes
\ No newline at end of file
+    return diagonal_indexes
+
+
+def _split_column(col, floor_y0):
+    # alttaki ayak/ayar düğümleri ile kat sıraları, en üst sıra çaprazsız kalır
+    floor_start = bisect_left(col, floor_y0, key=lambda p: p[1])
+    floor_rows = len(col) - floor_start
+    if floor_rows:
+        return col[:floor_start], floor_rows - 1
+
+    top_y = col[-1][1] if col else None
+    return [p for p in col if p[1] != top_y], 0
+
+
+def _count_zigzag_pair(left, right, floor_y0, DIAGONAL_PART, VERTICAL_PART, start_side, min_angle_deg=20):
+    floor_step = VERTICAL_PART - 20
+    min_dy = 0.7 * VERTICAL_PART
+
+    (bottom_L, rows_L), (bottom_R, rows_R) = _split_column(left, floor_y0), _split_column(right, floor_y0)
+    if not (bottom_L or rows_L) or not (bottom_R or rows_R):
+        return None
+
+    dx = abs(right[0][0] - left[0][0])
+    min_height = max(min_dy, math.tan(math.radians(min_angle_deg)) * (dx if dx != 0 else 1e-9))
+    # kat sıralarında her çapraz aynı sayıda sıra çıkar
+    row_step = min((t for t in range(1, int(DIAGONAL_PART // floor_step) + 3) if t * floor_step >= min_height),
+                   key=lambda t: abs(math.hypot(dx, t * floor_step) - DIAGONAL_PART), default=None)
+
+    # the nodes below the first floor are searched like the walker does, a few floor rows cover its reach
+    reach = int(DIAGONAL_PART // floor_step) + 2
+    index = ColumnIndex([bottom_L + left[len(bottom_L):len(bottom_L) + min(rows_L, reach)],
+                         bottom_R + right[len(bottom_R):len(bottom_R) + min(rows_R, reach)]])
+    bottoms = (len(bottom_L), len(bottom_R))
+    rows = (rows_L, rows_R)
+
+    side = 0 if start_side == "left" else 1
+    node = 0
+    last = [-1, -1]
+    count = 0
+    while node < bottoms[side]:
+        other = 1 - side
+        target = index.nearest_at_distance(other, index[side][node], DIAGONAL_PART, "down", min_idx=last[other],
+                                           min_dy=min_dy, min_angle_deg=min_angle_deg)
+        if target is None:
+            return count
+
+        count += 1
+        last[side] = node
+        side, node = other, target
+
+    if row_step is None:
+        return count
+
+    # kat sırasındaki r'den sonra adımlar diğer kolon, aynı kolon, ... şeklinde row_step sıra çıkar
+    row = node - bottoms[side]
+    first_odd = max(1, -(-(rows[1 - side] - row) // row_step))
+    if first_odd % 2 == 0:
+        first_odd += 1
+    first_even = max(2, -(-(rows[side] - row) // row_step))
+    if first_even % 2 == 1:
+        first_even += 1
+
+    return count + min(first_odd, first_even) - 1
+
+
+def count_zigzag_diagonal_pattern(connection_centers, module_count, floor_count,
+                                  DIAGONAL_PART, VERTICAL_PART, r_diagonal, material_count):
+    """Counts the starters and diagonals draw_zigzag_diagonal_pattern would add, without walking the floors.
+
+    The floor rows (the last `floor_count` nodes of the first column) sit at the same heights in every column, so
+    above the first floor every diagonal climbs the same number of rows and a column pair is counted arithmetically.
+    Only the foot and adjustment nodes below it are searched.
+    """
+    diagonal_indexes = _diagonal_indexes(module_count, material_count)
+
+    floor_y0 = connection_centers[0][-floor_count][1] if floor_count and connection_centers[0] else float('inf')
+
+    side = "right"
+    if r_diagonal:
+        side = "left"
+
+    diagonal_count = 0
+    for k in diagonal_indexes:
+        if k < 0 or k >= len(connection_centers) - 1:
+            continue
+
+        count = _count_zigzag_pair(connection_centers[k], connection_centers[k + 1], floor_y0,
+                                   DIAGONAL_PART, VERTICAL_PART, side)
+        if count is None:
+            continue
+
+        diagonal_count += count
+        side = "right" if side == "left" else "left"
+
+    if diagonal_count:
+        _, name = Calculator2D().diagonal()
+        material_count.material_add(name, diagonal_count)
+
+    return diagonal_indexes
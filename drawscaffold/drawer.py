@@ -1,19 +1,13 @@
 import os
+import time
 from datetime import datetime
 from typing import Sequence
 
 import ezdxf
-from ezdxf import units, bbox
-from ezdxf.addons import MTextExplode, text2path
-from ezdxf.addons.drawing.config import Configuration, ColorPolicy
+from ezdxf import units
 from ezdxf.math import Vec3
-from ezdxf.addons.drawing import RenderContext, Frontend, layout
-from ezdxf.addons.drawing.svg import SVGBackend
-import cairosvg
 from math import radians, cos, sin, tan
 
-from PIL import Image
-
 from drawscaffold.const.conts import HORIZONTAL_PART, VERTICAL_PART, SURFACE_COLOR, FOOT_PART, FOOT_INSIDE_PART, \
     ADJUSTMENT_SHAFT1, ADJUSTMENT_SHAFT2, HALF_FOOT_PART, ADJUSTMENT_SHAFT3, COMPLETE_FOOT_PART, HALF_VERTICAL_PART, \
     SUPPORT_SPACE, DIAGONAL_PART
@@ -21,13 +15,48 @@ from drawscaffold.diagonal.patterns.x_pattern import draw_x_diagonal_pattern
 from drawscaffold.diagonal.patterns.zigzag_pattern import draw_zigzag_diagonal_pattern
 from drawscaffold.shapes.shapes_2d import Drawer2D
 from drawscaffold.utils.debug_printer import DebugPrinter
+from drawscaffold.utils.dxf_export import dxf_extension, prepare_dxf
+from drawscaffold.utils.output_cache import output_cache, output_key
+from drawscaffold.utils.preview import DEFAULT_PREVIEW, PreviewProfile, preview_profile
+from drawscaffold.utils.render_pipeline import RenderPipeline, OutputCollector, run_exports
 
 
 def two_d_drawer(verbose:bool, h: float, w: float, slope: float, toe_text: str | None,
                  r_diagonal: bool, surface_line: bool, biggest_surface_line: bool,
                  use_x_pattern: bool, use_zigzag_pattern: bool, use_best_pattern: bool,
-                 svg: bool, image: bool, dxf: bool, project_name: str):
+                 svg: bool, image: bool, dxf: bool, project_name: str, return_bytes: bool = False,
+                 dxf_text_paths: bool = False, dxf_format: str = "ascii", use_cache: bool = True,
+                 image_dpi: int = 300, preview: str | PreviewProfile = DEFAULT_PREVIEW):
     d = DebugPrinter(verbose)
+    preview = preview_profile(preview)
+
+    outputs = OutputCollector(return_bytes)
+    timestamp = datetime.now().timestamp()
+    project_name_parts = project_name.split(' ')
+    project_name = "_".join(project_name_parts)
+
+    paths = {}
+    if image:
+        paths["png"] = os.path.abspath(f"{project_name}_{timestamp}.png")
+    if svg:
+        paths["svg"] = os.path.abspath(f"{project_name}_{timestamp}.svg")
+    if dxf:
+        paths["dxf"] = os.path.abspath(f"{project_name}_{timestamp}{dxf_extension(dxf_format)}")
+    if paths:
+        # for thumbnail
+        paths["jpg"] = os.path.abspath(f"{project_name}_{timestamp}.jpg")
+
+    cache = output_cache(use_cache) if paths else None
+    if cache is not None:
+        key = output_key("2d", h=float(h), w=float(w), slope=float(slope), toe_text=toe_text, r_diagonal=r_diagonal,
+                         surface_line=surface_line, biggest_surface_line=biggest_surface_line,
+                         use_x_pattern=use_x_pattern, use_zigzag_pattern=use_zigzag_pattern,
+                         use_best_pattern=use_best_pattern, image=image, dxf=dxf, svg=svg, project_name=project_name,
+                         dxf_text_paths=dxf_text_paths, dxf_format=dxf_format, image_dpi=image_dpi,
+                         preview=preview)
+        if cache.restore(key, outputs, paths, reuse_paths=True):
+            d.print(f"outputs from the cache {key}")
+            return outputs.result()
 
     floor_count = int(h // (VERTICAL_PART - 20))
     floor_gap = h % (VERTICAL_PART - 20)
@@ -290,82 +319,29 @@ def two_d_drawer(verbose:bool, h: float, w: float, slope: float, toe_text: str |
     if use_x_pattern:
         draw_x_diagonal_pattern(connection_centers, drawer, module_count, floor_count)
 
-    file_paths = []
-    timestamp = datetime.now().timestamp()
-    project_name_parts = project_name.split(' ')
-    project_name = "_".join(project_name_parts)
-
-    if image:
-        context = RenderContext(doc)
-        backend = SVGBackend()
-        Frontend(context, backend).draw_layout(msp, finalize=True)
-
-        page = layout.Page(210, 297, layout.Units.mm, margins=layout.Margins.all(20))
-        svg_path = os.path.abspath(f"{project_name}_{timestamp}.svg")
-        png_path = os.path.abspath(f"{project_name}_{timestamp}.png")
+    if not paths:
+        return outputs.result()
 
-        with open(svg_path, "wt", encoding="utf-8") as f:
-            f.write(backend.get_string(page))
+    render_start = time.perf_counter()
+    renderer = RenderPipeline(doc, msp)
+    d.print(f"render: {(time.perf_counter() - render_start) * 1000:.1f} ms")
 
-        cairosvg.svg2png(url=svg_path, write_to=png_path, dpi=300)
-        os.remove(svg_path)
-        file_paths.append(png_path)
+    # everything below only reads the recording or the document, the outputs are made side by side
+    exports = {}
+    if image:
+        exports["png"] = lambda: outputs.add("png", paths["png"], renderer.png_bytes(dpi=image_dpi))
     if svg:
-        context = RenderContext(doc)
-        backend = SVGBackend()
-        Frontend(context, backend, Configuration(color_policy=ColorPolicy.COLOR_SWAP_BW)).draw_layout(msp, finalize=True)
-
-        page = layout.Page(210, 297, layout.Units.mm, margins=layout.Margins.all(20))
-        svg_path = os.path.abspath(f"{project_name}_{timestamp}.svg")
-
-        with open(svg_path, "wt", encoding="utf-8") as f:
-            f.write(backend.get_string(page))
-
-        file_paths.append(svg_path)
-
+        exports["svg"] = lambda: outputs.add("svg", paths["svg"], renderer.svg_bytes(color_swap=True))
     if dxf:
-        ext = bbox.extents(msp)
-        if ext is not None:
-            (xmin, ymin, _), (xmax, ymax, _) = ext.extmin, ext.extmax
-
-            msp.dxf_layout.dxf.extmin = ezdxf.math.Vec3(xmin, ymin, 0)
-            msp.dxf_layout.dxf.extmax = ezdxf.math.Vec3(xmax, ymax, 0)
-            doc.header["$EXTMIN"] = msp.dxf_layout.dxf.extmin
-            doc.header["$EXTMAX"] = msp.dxf_layout.dxf.extmax
-
-        with MTextExplode(msp) as xpl:
-            for m in list(msp.query("MTEXT")):
-                xpl.explode(m)
-
-        for t in list(msp.query("TEXT")):
-            text2path.explode(t, target=msp)
-
-        dxf_path = os.path.abspath(f"{project_name}_{timestamp}.dxf")
-        doc.saveas(dxf_path)
-        file_paths.append(dxf_path)
-
+        def export_dxf():
+            prepare_dxf(doc, msp, dxf_text_paths)
+            outputs.add_dxf(paths["dxf"], doc, dxf_format)
+        exports["dxf"] = export_dxf
     # for thumbnail
-    if dxf or image or svg:
-        context = RenderContext(doc)
-        backend = SVGBackend()
-        Frontend(context, backend).draw_layout(msp, finalize=True)
-
-        page = layout.Page(210, 297, layout.Units.mm, margins=layout.Margins.all(20))
-        svg_path = os.path.abspath(f"{project_name}_temp_{timestamp}.svg")
-        png_path = os.path.abspath(f"{project_name}_temp_{timestamp}.png")
-        jpg_path = os.path.abspath(f"{project_name}_{timestamp}.jpg")
-
-        with open(svg_path, "wt", encoding="utf-8") as f:
-            f.write(backend.get_string(page))
-
-        cairosvg.svg2png(url=svg_path, write_to=png_path, dpi=300)
-
-        png_image = Image.open(png_path)
-        rgb_im = png_image.convert("RGB")
-        rgb_im.save(jpg_path)
+    exports["jpg"] = lambda: outputs.add("jpg", paths["jpg"], renderer.thumbnail_bytes(preview))
+    run_exports(exports, d)
 
-        os.remove(svg_path)
-        os.remove(png_path)
-        file_paths.append(jpg_path)
+    if cache is not None:
+        cache.store(key, outputs)
 
-    return file_paths
+    return outputs.result()
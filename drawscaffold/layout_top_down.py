@@ -0,0 +1,1194 @@
+from dataclasses import dataclass
+
+from drawscaffold.const.top_down_enum import ScaffoldSide
+from drawscaffold.utils.bay_packing import pack_bays
+from drawscaffold.utils.debug_printer import DebugPrinter
+from drawscaffold.utils.facades import FacadeSet
+
+
+@dataclass(frozen=True, slots=True)
+class Bay:
+    start_point: tuple
+    length: int
+    side: ScaffoldSide
+    console_count: int
+
+    @property
+    def small(self) -> bool:
+        return self.length == 150
+
+
+@dataclass(frozen=True, slots=True)
+class Run:
+    bays: tuple[Bay, ...]
+    sloped: bool # whether the surface slope applies, the depth runs are counted flat
+
+    @property
+    def lengths(self) -> list[int]:
+        return [bay.length for bay in self.bays]
+
+
+# The counter and the drawer walk the facades separately: the quote walk packs the leftovers with 150 cm bays and
+# the drawing walk rounds them up to 250 cm bays, with corner offsets of its own, so they share no geometry.
+
+def quote_runs(facades: FacadeSet, d: DebugPrinter, gap: int = 25) -> list[Run]:
+    runs = []
+
+    facade_keys = ['F', 'R', 'B', 'L'] # it is the order don't touch
+
+    last_x = 0
+    last_y = 0
+    for key in facade_keys:
+        if len(facades[key]) <= 0:
+            continue
+
+        last_pos = (last_x, last_y)
+
+        if key == 'F':
+            add_gap_value = (0, -gap)
+        elif key == 'R':
+            add_gap_value = (gap, 0)
+        elif key == 'B':
+            add_gap_value = (0, gap)
+        else: # key == 'L'
+            add_gap_value = (-gap, 0)
+
+        last_pos = (last_pos[0] + add_gap_value[0], last_pos[1] + add_gap_value[1])
+
+        total_length = facades.length(key)
+        total_cumulative_outset = facades.cumulative_outsets[key]
+        console_count = 0
+        for item in facades[key]:
+            func = item.kind
+            pos = item.start
+            depth = item.depth
+
+            d.print(f'pos: {pos}')
+            d.print(f'depth: {depth}')
+
+            if func == 'inset' and pos != 0:
+                if key == 'F':
+                    last_x = pos
+                    pos = abs(pos - last_pos[0])
+
+                    packing = pack_bays(pos, close_leftover=(1, 80))
+                    big_parts, after_gap = packing.big, packing.small
+                    leftover, overshoot = packing.leftover, packing.overshoot
+
+                    if depth <= 80 and overshoot:
+                        last_x = pos + last_pos[0]
+                        last_pos = (last_pos[0] - overshoot, last_pos[1])
+
+                    else:
+                        if leftover <= 80:
+                            d.print(f'lastx değeri: {last_x}')
+
+                            # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                            # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                            last_pos = (last_pos[0] - (leftover + 70 + gap) + 70, last_pos[1])
+
+                    new_y = last_pos[1] - (console_count * 35 + gap) if console_count!=0 else last_pos[1]
+                    last_pos = (last_pos[0], new_y)
+
+                    scaffs = []
+
+                    for b_part in range(big_parts):
+                        last_pos = (last_pos[0] + 250, last_pos[1]) # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.FRONT, console_count))
+
+                    for s_part in range(after_gap):
+                        last_pos = (last_pos[0] + 150, last_pos[1])  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.FRONT, console_count))
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    runs.append(Run(tuple(scaffs), sloped=True))
+                    scaffs = []
+
+                    if last_x == 0:
+                        last_x = last_pos[0]
+
+                    start_x_for_depth = last_x + gap
+                    last_pos = (start_x_for_depth, last_pos[1])
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        last_pos = (last_pos[0], last_pos[1] + 250) # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.LEFT, console_count))
+
+                    for s_part in range(depth_after_gap):
+                        last_pos = (last_pos[0], last_pos[1] + 150)  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.LEFT, console_count))
+
+                    # kendisi default 70 cm her bir console 35 cm
+                    last_pos = (last_pos[0] + console_count * 35 + 70, last_pos[1])
+                    last_x = 0
+                    d.print(f'son kalan nokta: {last_pos}')
+                    console_count = 0
+
+                    runs.append(Run(tuple(scaffs), sloped=False))
+
+                if key == 'R':
+                    last_y = pos
+                    pos = abs(pos - last_pos[1] + total_cumulative_outset)
+
+                    packing = pack_bays(pos, close_leftover=(1, 80))
+                    big_parts, after_gap = packing.big, packing.small
+                    leftover, overshoot = packing.leftover, packing.overshoot
+
+                    if depth <= 80 and overshoot:
+                        last_y = pos + last_pos[1]
+                        last_pos = (last_pos[0], last_pos[1] - overshoot)
+
+                    else:
+                        if leftover <= 80:
+                            d.print(f'lasty değeri: {last_y}')
+
+                            # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                            # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                            last_pos = (last_pos[0], last_pos[1] - (leftover + 70 + gap) + 70)
+
+                    new_x = last_pos[0] - (console_count * 35 + gap) if console_count!=0 else last_pos[0]
+                    last_pos = (new_x, last_pos[1])
+
+                    scaffs = []
+
+                    for b_part in range(big_parts):
+                        last_pos = (last_pos[0], last_pos[1] + 250) # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.LEFT, console_count))
+
+                    for s_part in range(after_gap):
+                        last_pos = (last_pos[0], last_pos[1] + 150)  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.LEFT, console_count))
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_y == 0:
+                        last_y = last_pos[1]
+
+                    start_y_for_depth = last_y + gap
+                    last_pos = (last_pos[0], start_y_for_depth)
+
+                    runs.append(Run(tuple(scaffs), sloped=False))
+                    scaffs = []
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        last_pos = (last_pos[0] - 250, last_pos[1]) # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.BACK, console_count))
+
+                    for s_part in range(depth_after_gap):
+                        last_pos = (last_pos[0] - 150, last_pos[1])  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.BACK, console_count))
+
+                    # kendisi default 70 cm her bir console 35 cm
+                    last_pos = (last_pos[0], last_pos[1]  + console_count * 35 + 70)
+                    last_y = 0
+                    d.print(f'son kalan nokta: {last_pos}')
+                    console_count = 0
+
+                    runs.append(Run(tuple(scaffs), sloped=True))
+
+                if key == 'B':
+                    last_x = last_pos[0] - pos - 70
+
+                    packing = pack_bays(pos, close_leftover=(1, 80))
+                    big_parts, after_gap = packing.big, packing.small
+                    leftover, overshoot = packing.leftover, packing.overshoot
+
+                    if depth <= 80 and overshoot:
+                        last_x = pos + last_pos[0]
+                        last_pos = (last_pos[0] + overshoot, last_pos[1])
+
+                    else:
+                        if leftover <= 80:
+                            d.print(f'lastx değeri: {last_x}')
+
+                            # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                            # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                            last_pos = (last_pos[0] - (leftover + 70 + gap) + 70, last_pos[1])
+
+                    new_y = last_pos[1] - (console_count * 35 + gap) if console_count!=0 else last_pos[1]
+                    last_pos = (last_pos[0], new_y)
+
+                    scaffs = []
+
+                    for b_part in range(big_parts):
+                        last_pos = (last_pos[0] - 250, last_pos[1]) # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.BACK, console_count))
+
+                    for s_part in range(after_gap):
+                        last_pos = (last_pos[0] - 150, last_pos[1])  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.BACK, console_count))
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_x == 0:
+                        last_x = last_pos[0]
+
+                    start_x_for_depth = last_x - gap * 2 + 70
+                    last_pos = (start_x_for_depth, last_pos[1])
+
+                    runs.append(Run(tuple(scaffs), sloped=True))
+                    scaffs = []
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        last_pos = (last_pos[0], last_pos[1] - 250) # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.RIGHT, console_count))
+
+                    for s_part in range(depth_after_gap):
+                        last_pos = (last_pos[0], last_pos[1] - 150)  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.RIGHT, console_count))
+
+                    last_pos = (last_pos[0] - console_count * 35 - 70, last_pos[1])
+                    last_x = 0
+                    d.print(f'son kalan nokta: {last_pos}')
+                    console_count = 0
+
+                    runs.append(Run(tuple(scaffs), sloped=False))
+
+                if key == 'L':
+                    # hedef: L cephesinde -Y yönüne doğru ilerliyoruz
+                    last_y = total_length - pos - total_cumulative_outset
+                    pos = abs(last_y - last_pos[1])
+
+                    packing = pack_bays(pos, close_leftover=(1, 80))
+                    big_parts, after_gap = packing.big, packing.small
+                    leftover, overshoot = packing.leftover, packing.overshoot
+
+                    # L'de çizim -Y yönünde: overshoot varsa başlangıcı +Y'ye kaydırmalıyız
+                    if depth <= 80 and overshoot:
+                        last_y = last_pos[1] - pos
+                        last_pos = (last_pos[0], last_pos[1] + overshoot)
+                    else:
+                        if leftover <= 80:
+                            d.print(f'lasty değeri: {last_y}')
+                            # L'de burada - değil + olmalı (R ile ters)
+                            last_pos = (last_pos[0], last_pos[1] + leftover + gap)
+
+                    new_x = last_pos[0] - (console_count * 35 + gap) if console_count != 0 else last_pos[0]
+                    last_pos = (new_x, last_pos[1])
+
+                    scaffs = []
+
+                    for b_part in range(big_parts):
+                        last_pos = (last_pos[0], last_pos[1] - 250)
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.RIGHT, console_count))
+
+                    for s_part in range(after_gap):
+                        last_pos = (last_pos[0], last_pos[1] - 150)
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.RIGHT, console_count))
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_y == 0:
+                        last_y = last_pos[1]
+
+                    start_y_for_depth = last_y - gap
+                    last_pos = (last_pos[0], start_y_for_depth)
+
+                    runs.append(Run(tuple(scaffs), sloped=False))
+                    scaffs = []
+
+                    d.print(f'depth posu: {last_pos}')
+
+                    # inset L'de içeri dönüş +X yönüne olmalı
+                    for b_part in range(depth_big_parts):
+                        last_pos = (last_pos[0] + 250, last_pos[1])
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.FRONT, console_count))
+
+                    for s_part in range(depth_after_gap):
+                        last_pos = (last_pos[0] + 150, last_pos[1])
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.FRONT, console_count))
+
+                    last_pos = (last_pos[0], last_pos[1] + console_count * 35 - 70)
+                    last_y = 0
+                    d.print(f'son kalan nokta: {last_pos}')
+                    console_count = 0
+                    runs.append(Run(tuple(scaffs), sloped=True))
+
+            elif func == 'outset' and pos != 0:
+                if key == 'F':
+                    last_x = pos
+                    pos = abs(pos - last_pos[0])
+
+                    packing = pack_bays(pos)
+                    big_parts, after_gap = packing.big, packing.small
+
+                    scaffs = []
+
+                    for b_part in range(big_parts):
+                        last_pos = (last_pos[0] + 250, last_pos[1])  # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.FRONT, console_count))
+
+                    for s_part in range(after_gap):
+                        last_pos = (last_pos[0] + 150, last_pos[1])  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.FRONT, console_count))
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_x == 0:
+                        last_x = last_pos[0]
+
+                    start_x_for_depth = last_x - gap
+                    last_pos = (start_x_for_depth, last_pos[1])
+
+                    runs.append(Run(tuple(scaffs), sloped=True))
+                    scaffs = []
+
+                    for b_part in range(depth_big_parts):
+                        last_pos = (last_pos[0], last_pos[1] - 250)  # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.RIGHT, console_count))
+
+                    for s_part in range(depth_after_gap):
+                        last_pos = (last_pos[0], last_pos[1] - 150)  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.RIGHT, console_count))
+
+                    last_pos = (last_pos[0] - (console_count + 1) * 35 + gap, last_pos[1])
+                    runs.append(Run(tuple(scaffs), sloped=False))
+
+                if key == 'R':
+                    last_y = pos
+
+                    d.print(f"r pos before: {pos}")
+                    pos = abs(pos - last_pos[1] + total_cumulative_outset)
+
+                    d.print(f"r pos after: {pos}")
+
+                    packing = pack_bays(pos, close_leftover=(1, 80))
+                    big_parts, after_gap = packing.big, packing.small
+                    leftover, overshoot = packing.leftover, packing.overshoot
+
+                    if depth <= 80 and overshoot:
+                        last_y = pos + last_pos[1]
+                        last_pos = (last_pos[0], last_pos[1] - overshoot)
+
+                    else:
+                        if leftover <= 80:
+                            d.print(f'lasty değeri: {last_y}')
+
+                            # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                            # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                            last_pos = (last_pos[0], last_pos[1] - (leftover + 70 + gap) + 70)
+
+                    new_x = last_pos[0] - (console_count * 35 + gap) if console_count!=0 else last_pos[0]
+                    last_pos = (new_x, last_pos[1])
+
+                    scaffs = []
+
+                    for b_part in range(big_parts):
+                        last_pos = (last_pos[0], last_pos[1] + 250) # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.LEFT, console_count))
+
+                    for s_part in range(after_gap):
+                        last_pos = (last_pos[0], last_pos[1] + 150)  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.LEFT, console_count))
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_y == 0:
+                        last_y = last_pos[1]
+
+                    start_y_for_depth = last_y - gap
+                    last_pos = (last_pos[0], start_y_for_depth)
+
+                    runs.append(Run(tuple(scaffs), sloped=False))
+                    scaffs = []
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        last_pos = (last_pos[0] + 250, last_pos[1]) # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.FRONT, console_count))
+
+                    for s_part in range(depth_after_gap):
+                        last_pos = (last_pos[0] + 150, last_pos[1])  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.FRONT, console_count))
+
+                    # kendisi default 70 cm her bir console 35 cm
+                    last_pos = (last_pos[0], last_pos[1]  + console_count * 35 + 70)
+                    runs.append(Run(tuple(scaffs), sloped=True))
+
+                if key == 'B':
+                    last_x = last_pos[0] - pos - 70
+
+                    packing = pack_bays(pos, close_leftover=(1, 80))
+                    big_parts, after_gap = packing.big, packing.small
+                    leftover, overshoot = packing.leftover, packing.overshoot
+
+                    if depth <= 80 and overshoot:
+                        last_x = pos + last_pos[0]
+                        last_pos = (last_pos[0] + overshoot, last_pos[1])
+
+                    else:
+                        if leftover <= 80:
+                            d.print(f'lastx değeri: {last_x}')
+
+                            # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                            # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                            last_pos = (last_pos[0] - (leftover + 70 + gap) + 70, last_pos[1])
+
+                    new_y = last_pos[1] - (console_count * 35 + gap) if console_count!=0 else last_pos[1]
+                    last_pos = (last_pos[0], new_y)
+
+                    scaffs = []
+
+                    for b_part in range(big_parts):
+                        last_pos = (last_pos[0] - 250, last_pos[1]) # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.BACK, console_count))
+
+                    for s_part in range(after_gap):
+                        last_pos = (last_pos[0] - 150, last_pos[1])  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.BACK, console_count))
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_x == 0:
+                        last_x = last_pos[0]
+
+                    start_x_for_depth = last_x - gap * 2 + 70
+                    last_pos = (start_x_for_depth, last_pos[1])
+
+                    runs.append(Run(tuple(scaffs), sloped=True))
+                    scaffs = []
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        last_pos = (last_pos[0], last_pos[1] - 250) # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.RIGHT, console_count))
+
+                    for s_part in range(depth_after_gap):
+                        last_pos = (last_pos[0], last_pos[1] - 150)  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.RIGHT, console_count))
+
+                    # kendisi default 70 cm her bir console 35 cm
+                    last_pos = (last_pos[0] + console_count * 35 - 70, last_pos[1])
+                    last_x = 0
+                    d.print(f'son kalan nokta: {last_pos}')
+                    console_count = 0
+                    runs.append(Run(tuple(scaffs), sloped=False))
+
+                if key == 'L':
+                    last_y = total_length - pos - total_cumulative_outset + gap * 2
+                    pos = abs(last_y - last_pos[1])
+
+                    packing = pack_bays(pos)
+                    big_parts, after_gap = packing.big, packing.small
+
+                    new_x = last_pos[0] - (console_count * 35 + gap) if console_count != 0 else last_pos[0]
+                    last_pos = (new_x, last_pos[1])
+
+                    scaffs = []
+
+                    for b_part in range(big_parts):
+                        last_pos = (last_pos[0], last_pos[1] - 250)  # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.RIGHT, console_count))
+
+                    for s_part in range(after_gap):
+                        last_pos = (last_pos[0], last_pos[1] - 150)  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.RIGHT, console_count))
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_y == 0:
+                        last_y = last_pos[1]
+
+                    start_y_for_depth = last_y - gap
+                    last_pos = (last_pos[0], start_y_for_depth)
+
+                    runs.append(Run(tuple(scaffs), sloped=False))
+                    scaffs = []
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        last_pos = (last_pos[0] - 250, last_pos[1])  # length of scaffold
+                        scaffs.append(Bay(last_pos, 250, ScaffoldSide.BACK, console_count))
+
+                    for s_part in range(depth_after_gap):
+                        last_pos = (last_pos[0] - 150, last_pos[1])  # length of scaffold
+                        scaffs.append(Bay(last_pos, 150, ScaffoldSide.BACK, console_count))
+
+                    # kendisi default 70 cm her bir console 35 cm
+                    last_pos = (last_pos[0], last_pos[1] + console_count * 35 - 70)
+                    d.print(f'L -> Kaldığı {last_pos}')
+
+                    runs.append(Run(tuple(scaffs), sloped=True))
+
+        if key == 'F':
+            pos = abs(total_length - last_pos[0] - total_cumulative_outset)
+
+            packing = pack_bays(pos, close_leftover=(20, 150))
+            big_parts, after_gap = packing.big, packing.small
+
+            scaffs = []
+
+            for b_part in range(big_parts):
+                last_pos = (last_pos[0] + 250, last_pos[1])  # length of scaffold
+                scaffs.append(Bay(last_pos, 250, ScaffoldSide.FRONT, console_count))
+
+            for s_part in range(after_gap):
+                last_pos = (last_pos[0] + 150, last_pos[1])  # length of scaffold
+                scaffs.append(Bay(last_pos, 150, ScaffoldSide.FRONT, console_count))
+
+            last_x = total_length - total_cumulative_outset
+            last_y = last_pos[1]
+
+            runs.append(Run(tuple(scaffs), sloped=True))
+
+        if key == 'R':
+            pos = total_length - last_pos[1] - total_cumulative_outset
+
+            packing = pack_bays(pos, close_leftover=(20, 150))
+            big_parts, after_gap = packing.big, packing.small
+
+            scaffs = []
+
+            for b_part in range(big_parts):
+                last_pos = (last_pos[0], last_pos[1] + 250)  # length of scaffold
+                scaffs.append(Bay(last_pos, 250, ScaffoldSide.LEFT, console_count))
+
+            for s_part in range(after_gap):
+                last_pos = (last_pos[0], last_pos[1] + 150)  # length of scaffold
+                scaffs.append(Bay(last_pos, 150, ScaffoldSide.LEFT, console_count))
+
+            last_x = last_pos[0]
+            last_y = total_length - total_cumulative_outset
+
+            runs.append(Run(tuple(scaffs), sloped=False))
+
+        if key == 'B':
+            last_pos = (last_pos[0], last_pos[1])
+            pos = total_length - (total_length - last_pos[0])
+
+            packing = pack_bays(pos, close_leftover=(20, 150))
+            big_parts, after_gap = packing.big, packing.small
+
+            scaffs = []
+
+            for b_part in range(big_parts):
+                last_pos = (last_pos[0] - 250, last_pos[1])  # length of scaffold
+                scaffs.append(Bay(last_pos, 250, ScaffoldSide.BACK, console_count))
+
+            for s_part in range(after_gap):
+                last_pos = (last_pos[0] - 150, last_pos[1])  # length of scaffold
+                scaffs.append(Bay(last_pos, 150, ScaffoldSide.BACK, console_count))
+
+            d.print(f'B SON : {last_pos}')
+            last_x = 0
+            last_y = last_pos[1] - gap
+            runs.append(Run(tuple(scaffs), sloped=True))
+
+        if key == 'L':
+            last_pos = (last_pos[0], last_pos[1] + 70 + gap)
+            pos = total_length - (total_length - last_pos[1])
+
+            packing = pack_bays(pos)
+            big_parts, after_gap = packing.big, packing.small
+
+            scaffs = []
+
+            for b_part in range(big_parts):
+                last_pos = (last_pos[0], last_pos[1] - 250)  # length of scaffold
+                scaffs.append(Bay(last_pos, 250, ScaffoldSide.RIGHT, console_count))
+
+            for s_part in range(after_gap):
+                last_pos = (last_pos[0], last_pos[1] - 150)  # length of scaffold
+                scaffs.append(Bay(last_pos, 150, ScaffoldSide.RIGHT, console_count))
+
+            last_x = last_pos[0]
+            last_y = total_length - total_cumulative_outset
+            runs.append(Run(tuple(scaffs), sloped=False))
+
+    return runs
+
+
+def drawing_bays(facades: FacadeSet, d: DebugPrinter, gap: int = 25) -> list[Bay]:
+    bays = []
+
+    facade_keys = ['F', 'R', 'B', 'L'] # it is the order don't touch
+
+    last_x = 0
+    last_y = 0
+    for key in facade_keys:
+        if len(facades[key]) <= 0:
+            continue
+
+        last_pos = (last_x, last_y)
+
+        if key == 'F':
+            add_gap_value = (0, -gap)
+        elif key == 'R':
+            add_gap_value = (gap, 0)
+        elif key == 'B':
+            add_gap_value = (0, gap)
+        else: # key == 'L'
+            add_gap_value = (-gap, 0)
+
+        last_pos = (last_pos[0] + add_gap_value[0], last_pos[1] + add_gap_value[1])
+
+        total_length = facades.length(key)
+        total_cumulative_outset = facades.cumulative_outsets[key]
+        console_count = 0
+        for item in facades[key]:
+            func = item.kind
+            pos = item.start
+            depth = item.depth
+
+            d.print(f'pos: {pos}')
+            d.print(f'depth: {depth}')
+
+            if func == 'inset' and pos != 0:
+                if key == 'F':
+                    last_x = pos
+                    pos = abs(pos - last_pos[0])
+
+                    big_parts = pos // 250  # count of big part
+                    leftover = pos % 250
+                    after_gap = 0
+
+                    if leftover <= 180:
+                        # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                        # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                        big_parts += 1
+                        last_pos = (last_pos[0] - (leftover + 70 + gap) + 70, last_pos[1])
+                    else:
+                        after_gap = 1
+                        overshoot = 150 - leftover
+                        last_pos = (last_pos[0] - (overshoot + 70 + gap) + 70, last_pos[1])
+
+                    new_y = last_pos[1] - (console_count * 35 + gap) if console_count!=0 else last_pos[1]
+                    last_pos = (last_pos[0], new_y)
+
+                    for b_part in range(big_parts):
+                        bays.append(Bay((last_pos[0] + 250, last_pos[1]), 250, ScaffoldSide.FRONT, console_count))
+
+                        last_pos = (last_pos[0] + 250, last_pos[1]) # length of scaffold
+
+                    for s_part in range(after_gap):
+                        bays.append(Bay((last_pos[0] + 150, last_pos[1]), 150, ScaffoldSide.FRONT, console_count))
+
+                        last_pos = (last_pos[0] + 150, last_pos[1])  # length of scaffold
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_x == 0:
+                        last_x = last_pos[0]
+
+                    start_x_for_depth = last_x + gap
+                    last_pos = (start_x_for_depth, last_pos[1])
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        bays.append(Bay((last_pos[0], last_pos[1] + 250), 250, ScaffoldSide.LEFT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] + 250) # length of scaffold
+
+                    for s_part in range(depth_after_gap):
+                        bays.append(Bay((last_pos[0], last_pos[1] + 150), 150, ScaffoldSide.LEFT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] + 150)  # length of scaffold
+
+                    # kendisi default 70 cm her bir console 35 cm
+                    last_pos = (last_pos[0] + console_count * 35 + 70, last_pos[1])
+                    last_x = 0
+                    d.print(f'son kalan nokta: {last_pos}')
+                    console_count = 0
+
+                if key == 'R':
+                    last_y = pos
+                    pos = abs(pos - last_pos[1] + total_cumulative_outset)
+
+                    packing = pack_bays(pos, close_leftover=(1, 80))
+                    big_parts, after_gap = packing.big, packing.small
+                    leftover, overshoot = packing.leftover, packing.overshoot
+
+                    if depth <= 80 and overshoot:
+                        last_y = pos + last_pos[1]
+                        last_pos = (last_pos[0], last_pos[1] - overshoot)
+
+                    else:
+                        if leftover <= 80:
+                            d.print(f'lasty değeri: {last_y}')
+
+                            # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                            # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                            last_pos = (last_pos[0], last_pos[1] - (leftover + 70 + gap) + 70)
+
+                    new_x = last_pos[0] - (console_count * 35 + gap) if console_count!=0 else last_pos[0]
+                    last_pos = (new_x, last_pos[1])
+
+                    for b_part in range(big_parts):
+                        bays.append(Bay((last_pos[0], last_pos[1] + 250), 250, ScaffoldSide.LEFT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] + 250) # length of scaffold
+
+                    for s_part in range(after_gap):
+                        bays.append(Bay((last_pos[0], last_pos[1] + 150), 150, ScaffoldSide.LEFT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] + 150)  # length of scaffold
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_y == 0:
+                        last_y = last_pos[1]
+
+                    start_y_for_depth = last_y + gap
+                    last_pos = (last_pos[0], start_y_for_depth)
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        bays.append(Bay((last_pos[0] - 250, last_pos[1]), 250, ScaffoldSide.BACK, console_count))
+
+                        last_pos = (last_pos[0] - 250, last_pos[1]) # length of scaffold
+
+                    for s_part in range(depth_after_gap):
+                        bays.append(Bay((last_pos[0] - 150, last_pos[1]), 150, ScaffoldSide.BACK, console_count))
+
+                        last_pos = (last_pos[0] - 150, last_pos[1])  # length of scaffold
+
+                    # kendisi default 70 cm her bir console 35 cm
+                    last_pos = (last_pos[0], last_pos[1]  + console_count * 35 + 70)
+                    last_y = 0
+                    d.print(f'son kalan nokta: {last_pos}')
+                    console_count = 0
+
+                if key == 'B':
+                    last_pos = (last_pos[0] - 70 - gap, last_pos[1])
+
+                    big_parts = pos // 250  # count of big part
+                    leftover = pos % 250
+                    after_gap = 0
+
+                    if leftover <= 180:
+                        # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                        # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                        big_parts += 1
+                        last_pos = (last_pos[0] + (leftover + gap), last_pos[1])
+                    else:
+                        after_gap = 1
+                        overshoot = 150 - leftover
+                        last_pos = (last_pos[0] + (overshoot + gap), last_pos[1])
+
+                    new_y = last_pos[1] - (console_count * 35 + gap) if console_count!=0 else last_pos[1]
+                    last_pos = (last_pos[0], new_y)
+
+                    for b_part in range(big_parts):
+                        bays.append(Bay((last_pos[0] - 250, last_pos[1]), 250, ScaffoldSide.BACK, console_count))
+
+                        last_pos = (last_pos[0] - 250, last_pos[1]) # length of scaffold
+
+                    for s_part in range(after_gap):
+                        bays.append(Bay((last_pos[0] - 150, last_pos[1]), 150, ScaffoldSide.BACK, console_count))
+
+                        last_pos = (last_pos[0] - 150, last_pos[1])  # length of scaffold
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    last_x = last_pos[0] - 35
+
+                    start_x_for_depth = last_x - gap * 2 + 70
+                    last_pos = (start_x_for_depth, last_pos[1])
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        bays.append(Bay((last_pos[0], last_pos[1] - 250), 250, ScaffoldSide.RIGHT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] - 250) # length of scaffold
+
+                    for s_part in range(depth_after_gap):
+                        bays.append(Bay((last_pos[0], last_pos[1] - 150), 150, ScaffoldSide.RIGHT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] - 150)  # length of scaffold
+
+                    last_pos = (last_pos[0] - console_count * 35 - 70, last_pos[1])
+                    last_x = 0
+                    d.print(f'son kalan nokta: {last_pos}')
+                    console_count = 0
+
+                if key == 'L':
+                    # hedef: L cephesinde -Y yönüne doğru ilerliyoruz
+                    last_y = total_length - pos - total_cumulative_outset
+                    pos = abs(last_y - last_pos[1])
+
+                    big_parts = pos // 250
+                    leftover = pos % 250
+                    after_gap = 0
+
+                    if leftover <= 180:
+                        # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                        # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                        big_parts += 1
+                        last_pos = (last_pos[0] , last_pos[1] + leftover, last_pos[1])
+                    else:
+                        after_gap = 1
+                        overshoot = 150 - leftover
+                        last_pos = (last_pos[0], last_pos[1] - (overshoot + 70 + gap) + 70)
+
+                    new_x = last_pos[0] - (console_count * 35 + gap) if console_count != 0 else last_pos[0]
+                    last_pos = (new_x, last_pos[1])
+
+                    for b_part in range(big_parts):
+                        bays.append(Bay((last_pos[0], last_pos[1] - 250), 250, ScaffoldSide.RIGHT, console_count))
+                        last_pos = (last_pos[0], last_pos[1] - 250)
+
+                    for s_part in range(after_gap):
+                        bays.append(Bay((last_pos[0], last_pos[1] - 150), 150, ScaffoldSide.RIGHT, console_count))
+                        last_pos = (last_pos[0], last_pos[1] - 150)
+
+                    depth_big_parts = depth // 250
+                    depth_left_over = depth % 250
+                    depth_after_gap = 0
+
+                    if depth_left_over > 100:
+                        depth_big_parts += 1
+                        # TODO BURADAKİ 75 ŞAŞIRABİLİR
+                        last_pos = (last_pos[0] - (depth_left_over + gap) + 75, last_pos[1])
+
+                    if last_y == 0:
+                        last_y = last_pos[1]
+
+                    start_y_for_depth = last_y - gap
+                    last_pos = (last_pos[0], start_y_for_depth)
+
+                    d.print(f'depth posu: {last_pos}')
+
+                    # inset L'de içeri dönüş +X yönüne olmalı
+                    for b_part in range(depth_big_parts):
+                        bays.append(Bay((last_pos[0] + 250, last_pos[1]), 250, ScaffoldSide.FRONT, console_count))
+                        last_pos = (last_pos[0] + 250, last_pos[1])
+
+                    for s_part in range(depth_after_gap):
+                        bays.append(Bay((last_pos[0] + 150, last_pos[1]), 150, ScaffoldSide.FRONT, console_count))
+                        last_pos = (last_pos[0] + 150, last_pos[1])
+
+                    last_pos = (last_pos[0], last_pos[1] + console_count * 35 - 70)
+                    last_y = 0
+                    d.print(f'son kalan nokta: {last_pos}')
+                    console_count = 0
+            elif func == 'outset' and pos != 0:
+                if key == 'F':
+                    last_x = pos
+                    pos = abs(pos - last_pos[0])
+
+                    big_parts = pos // 250  # count of big part
+                    leftover = pos % 250
+                    after_gap = 0
+
+                    d.print(f"Front pos {pos}")
+                    d.print(f"Front leftover {leftover}")
+                    if (pos - 70 - gap) <= 250:
+                        after_gap = 1
+                        big_parts = 0
+                    elif leftover <= 180:
+                        # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                        # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                        big_parts += 1
+                        last_pos = (last_pos[0] - (leftover + 70 + gap) + 70, last_pos[1])
+                    else:
+                        after_gap = 1
+                        overshoot = 150 - leftover
+                        last_pos = (last_pos[0] - (overshoot + 70 + gap) + 70, last_pos[1])
+
+                    for b_part in range(big_parts):
+                        bays.append(Bay((last_pos[0] + 250, last_pos[1]), 250, ScaffoldSide.FRONT, console_count))
+
+                        last_pos = (last_pos[0] + 250, last_pos[1])  # length of scaffold
+
+                    for s_part in range(after_gap):
+                        bays.append(Bay((last_pos[0] + 150, last_pos[1]), 150, ScaffoldSide.FRONT, console_count))
+
+                        last_pos = (last_pos[0] + 150, last_pos[1])  # length of scaffold
+
+                    depth_big_parts = depth // 250  # count of big part
+                    depth_left_over = depth % 250
+                    depth_after_gap = 0
+
+                    if gap < depth_left_over <= 180:
+                        depth_big_parts += 1
+
+                    if last_x == 0:
+                        last_x = last_pos[0]
+
+                    start_x_for_depth = last_x - gap
+                    last_pos = (start_x_for_depth, last_pos[1])
+
+                    for b_part in range(depth_big_parts):
+                        bays.append(Bay((last_pos[0], last_pos[1] - 250), 250, ScaffoldSide.RIGHT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] - 250)  # length of scaffold
+
+                    for s_part in range(depth_after_gap):
+                        bays.append(Bay((last_pos[0], last_pos[1] - 150), 150, ScaffoldSide.RIGHT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] - 150)  # length of scaffold
+
+                    last_pos = (last_pos[0] - (console_count + 1) * 35 + gap, last_pos[1])
+                if key == 'R':
+                    last_y = pos
+
+                    d.print(f"r pos before: {pos}")
+                    pos = abs(pos - last_pos[1] + total_cumulative_outset)
+
+                    d.print(f"r pos after: {pos}")
+
+                    packing = pack_bays(pos, close_leftover=(1, 80))
+                    big_parts, after_gap = packing.big, packing.small
+                    leftover, overshoot = packing.leftover, packing.overshoot
+
+                    if depth <= 80 and overshoot:
+                        last_y = pos + last_pos[1]
+                        last_pos = (last_pos[0], last_pos[1] - overshoot)
+
+                    else:
+                        if leftover <= 80:
+                            d.print(f'lasty değeri: {last_y}')
+
+                            # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                            # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                            last_pos = (last_pos[0], last_pos[1] - (leftover + 70 + gap) + 70)
+
+                    new_x = last_pos[0] - (console_count * 35 + gap) if console_count!=0 else last_pos[0]
+                    last_pos = (new_x, last_pos[1])
+
+                    for b_part in range(big_parts):
+                        bays.append(Bay((last_pos[0], last_pos[1] + 250), 250, ScaffoldSide.LEFT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] + 250) # length of scaffold
+
+                    for s_part in range(after_gap):
+                        bays.append(Bay((last_pos[0], last_pos[1] + 150), 150, ScaffoldSide.LEFT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] + 150)  # length of scaffold
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_y == 0:
+                        last_y = last_pos[1]
+
+                    start_y_for_depth = last_y - gap
+                    last_pos = (last_pos[0], start_y_for_depth)
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        bays.append(Bay((last_pos[0] + 250, last_pos[1]), 250, ScaffoldSide.FRONT, console_count))
+
+                        last_pos = (last_pos[0] + 250, last_pos[1]) # length of scaffold
+
+                    for s_part in range(depth_after_gap):
+                        bays.append(Bay((last_pos[0] + 150, last_pos[1]), 150, ScaffoldSide.FRONT, console_count))
+
+                        last_pos = (last_pos[0] + 150, last_pos[1])  # length of scaffold
+
+                    # kendisi default 70 cm her bir console 35 cm
+                    last_pos = (last_pos[0], last_pos[1]  + console_count * 35 + 70)
+
+                if key == 'B':
+                    last_x = last_pos[0] - pos - 70
+
+                    big_parts = pos // 250  # count of big part
+                    leftover = pos % 250
+                    after_gap = 0
+
+                    d.print(f"Back pos {pos}")
+                    d.print(f"Back leftover {leftover}")
+                    if (pos - 70 - gap) <= 250:
+                        after_gap = 1
+                        big_parts = 0
+                    elif leftover <= 180:
+                        # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                        # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                        big_parts += 1
+                        last_pos = (last_pos[0] + (leftover + 70 + gap) - 70, last_pos[1])
+                    else:
+                        after_gap = 1
+                        overshoot = 150 - leftover
+                        last_pos = (last_pos[0] + (overshoot + 70 + gap) - 70, last_pos[1])
+
+                    for b_part in range(big_parts):
+                        bays.append(Bay((last_pos[0] + 250, last_pos[1]), 250, ScaffoldSide.FRONT, console_count))
+
+                        last_pos = (last_pos[0] + 250, last_pos[1])  # length of scaffold
+
+                    new_y = last_pos[1] - (console_count * 35 + gap) if console_count!=0 else last_pos[1]
+                    last_pos = (last_pos[0], new_y)
+
+                    for b_part in range(big_parts):
+                        bays.append(Bay((last_pos[0] - 250, last_pos[1]), 250, ScaffoldSide.BACK, console_count))
+
+                        last_pos = (last_pos[0] - 250, last_pos[1]) # length of scaffold
+
+                    for s_part in range(after_gap):
+                        bays.append(Bay((last_pos[0] - 150, last_pos[1]), 150, ScaffoldSide.BACK, console_count))
+
+                        last_pos = (last_pos[0] - 150, last_pos[1])  # length of scaffold
+
+                    depth_packing = pack_bays(depth)
+                    depth_big_parts, depth_after_gap = depth_packing.big, depth_packing.small
+
+                    if last_x == 0:
+                        last_x = last_pos[0]
+
+                    start_x_for_depth = last_x - gap * 2 + 70
+                    last_pos = (start_x_for_depth, last_pos[1])
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        bays.append(Bay((last_pos[0], last_pos[1] - 250), 250, ScaffoldSide.RIGHT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] - 250) # length of scaffold
+
+                    for s_part in range(depth_after_gap):
+                        bays.append(Bay((last_pos[0], last_pos[1] - 150), 150, ScaffoldSide.RIGHT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] - 150)  # length of scaffold
+
+                    # kendisi default 70 cm her bir console 35 cm
+                    last_pos = (last_pos[0] + console_count * 35 - 70, last_pos[1])
+                    last_x = 0
+                    d.print(f'son kalan nokta: {last_pos}')
+                    console_count = 0
+                if key == 'L':
+                    last_y = total_length - pos - total_cumulative_outset + gap * 2
+                    pos = abs(last_y - last_pos[1])
+
+                    big_parts = pos // 250  # count of big part
+                    leftover = pos % 250
+                    after_gap = 0
+
+                    d.print(f"Left pos {pos}")
+                    d.print(f"Left leftover {leftover}")
+                    if gap < (pos - 70 - gap):
+                        if (pos - 70 - gap) <= 250:
+                            after_gap = 1
+                            big_parts = 0
+                        elif leftover <= 180:
+                            # sonda 70 ekliyoruz çünkü döndükten sonraki parça 70 cm ekleyecek
+                            # gap da ekliyoruz çünkü köşeden gap boşluğu var
+                            big_parts += 1
+                            last_pos = (last_pos[0] - (leftover + 70 + gap) + 70, last_pos[1])
+                        else:
+                            after_gap = 1
+                            overshoot = 150 - leftover
+                            last_pos = (last_pos[0] - (overshoot + 70 + gap) + 70, last_pos[1])
+
+                    new_x = last_pos[0] - (console_count * 35 + gap) if console_count != 0 else last_pos[0]
+                    last_pos = (new_x, last_pos[1])
+
+                    for b_part in range(big_parts):
+                        bays.append(Bay((last_pos[0], last_pos[1] - 250), 250, ScaffoldSide.RIGHT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] - 250)  # length of scaffold
+
+                    for s_part in range(after_gap):
+                        bays.append(Bay((last_pos[0], last_pos[1] - 150), 150, ScaffoldSide.RIGHT, console_count))
+
+                        last_pos = (last_pos[0], last_pos[1] - 150)  # length of scaffold
+
+                    depth_big_parts = depth // 250  # count of big part
+                    depth_left_over = depth % 250
+                    depth_after_gap = 0
+
+                    if depth_left_over > 100:
+                        depth_big_parts += 1
+
+                    if last_y == 0:
+                        last_y = last_pos[1]
+
+                    start_y_for_depth = last_y - gap
+                    last_pos = (last_pos[0], start_y_for_depth)
+
+                    d.print(f'depth posu: {last_pos}')
+                    for b_part in range(depth_big_parts):
+                        bays.append(Bay((last_pos[0] - 250, last_pos[1]), 250, ScaffoldSide.BACK, console_count))
+
+                        last_pos = (last_pos[0] - 250, last_pos[1])  # length of scaffold
+
+                    for s_part in range(depth_after_gap):
+                        bays.append(Bay((last_pos[0] - 150, last_pos[1]), 150, ScaffoldSide.BACK, console_count))
+
+                        last_pos = (last_pos[0] - 150, last_pos[1])  # length of scaffold
+
+                    # kendisi default 70 cm her bir console 35 cm
+                    last_pos = (last_pos[0], last_pos[1] + console_count * 35 - 70)
+                    d.print(f'L -> Kaldığı {last_pos}')
+
+        if key == 'F':
+            pos = abs(total_length - last_pos[0] - total_cumulative_outset)
+
+            big_parts = pos // 250  # count of big part
+            leftover = pos % 250
+
+            if leftover > 90:
+                big_parts += 1
+
+            for b_part in range(big_parts):
+                bays.append(Bay((last_pos[0] + 250, last_pos[1]), 250, ScaffoldSide.FRONT, console_count))
+
+                last_pos = (last_pos[0] + 250, last_pos[1])  # length of scaffold
+
+            last_x = total_length - total_cumulative_outset
+            last_y = last_pos[1] + gap
+
+        if key == 'R':
+            pos = total_length - last_pos[1] - total_cumulative_outset
+
+            big_parts = pos // 250  # count of big part
+            leftover = pos % 250
+
+            if leftover > 90:
+                big_parts += 1
+
+            for b_part in range(big_parts):
+                bays.append(Bay((last_pos[0], last_pos[1] + 250), 250, ScaffoldSide.LEFT, console_count))
+
+                last_pos = (last_pos[0], last_pos[1] + 250)  # length of scaffold
+
+            last_x = last_pos[0] - gap
+            last_y = total_length - total_cumulative_outset
+
+        if key == 'B':
+            last_pos = (last_pos[0], last_pos[1])
+            pos = total_length - (total_length - last_pos[0])
+
+            big_parts = pos // 250  # count of big part
+            leftover = pos % 250
+
+            if leftover > 180:
+                big_parts += 1
+
+            for b_part in range(big_parts):
+                bays.append(Bay((last_pos[0] - 250, last_pos[1]), 250, ScaffoldSide.BACK, console_count))
+
+                last_pos = (last_pos[0] - 250, last_pos[1])  # length of scaffold
+
+            d.print(f'B SON : {last_pos}')
+            last_x = 0
+            last_y = last_pos[1] - gap
+
+        if key == 'L':
+            last_pos = (last_pos[0], last_pos[1] + 70 + gap)
+            pos = total_length - (total_length - last_pos[1])
+
+            big_parts = pos // 250  # count of big part
+
+            for b_part in range(big_parts):
+                bays.append(Bay((last_pos[0], last_pos[1] - 250), 250, ScaffoldSide.RIGHT, console_count))
+
+                last_pos = (last_pos[0], last_pos[1] - 250)  # length of scaffold
+
+            last_x = last_pos[0]
+            last_y = total_length - total_cumulative_outset
+
+    return bays
@@ -0,0 +1,69 @@
+from drawscaffold.calculate_top_down import MaterialCounterTopDown, segment_materials
+from drawscaffold.calculator.price_calculator import calculate_price
+from drawscaffold.layout_top_down import quote_runs
+from drawscaffold.utils.debug_printer import DebugPrinter
+from drawscaffold.utils.facades import Facade, facade_set_of
+
+
+class QuoteSession:
+    """One top-down quote kept between edits of its facades.
+
+    After an edit the facades are walked again and only the runs whose lengths came out different are counted, the
+    materials of the others come from the segment cache shared with top_down_calc.
+    """
+
+    def __init__(self, facades: list[str], h: float, slope: float, toe_board: bool = False,
+                 use_x_pattern: bool = False, use_zigzag_pattern: bool = False, gap: int = 25):
+        self.h = h
+        self.slope = slope
+        self.toe_board = toe_board
+        self.use_x_pattern = use_x_pattern
+        self.use_zigzag_pattern = use_zigzag_pattern
+        self.gap = gap
+
+        self._facades = [Facade.parse(facade) for facade in facades]
+        self._texts = [str(facade) for facade in facades]
+        self._runs = set() # (lengths, slope) of the runs of the last update
+        self.materials = {}
+        self.recounted = 0 # runs counted by the last update
+        self._update()
+
+    @property
+    def facades(self) -> list[str]:
+        return list(self._texts)
+
+    def add_facade(self, facade: str) -> dict:
+        self._facades.append(Facade.parse(facade))
+        self._texts.append(str(facade))
+        return self._update()
+
+    def set_facade(self, index: int, facade: str) -> dict:
+        self._facades[index] = Facade.parse(facade)
+        self._texts[index] = str(facade)
+        return self._update()
+
+    def remove_facade(self, index: int) -> dict:
+        del self._facades[index]
+        del self._texts[index]
+        return self._update()
+
+    def quote(self) -> dict:
+        price, currency, symbol = calculate_price(self.materials)
+        return {"materials": dict(self.materials), "price": {"price": price, "currency": currency, "symbol": symbol}}
+
+    def _update(self) -> dict:
+        walked = quote_runs(facade_set_of(self._facades), DebugPrinter(False), self.gap)
+        runs = [(tuple(run.lengths), self.slope if run.sloped else 0) for run in walked]
+        self.recounted = len(set(runs) - self._runs)
+        self._runs = set(runs)
+
+        # summed in run order, the totals come out in the order top_down_calc adds them
+        material_counter = MaterialCounterTopDown()
+        for lengths, slope in runs:
+            segment = segment_materials(list(lengths), self.h, slope, self.toe_board, self.use_x_pattern,
+                                        self.use_zigzag_pattern)
+            for material_id, count in segment:
+                material_counter.add_many(material_id, count)
+        self.materials = material_counter.counter_dict
+
+        return self.quote()
@@ -0,0 +1,180 @@
+import base64
+import itertools
+import json
+import os
+import sys
+from collections import OrderedDict
+from contextlib import redirect_stdout
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+from drawscaffold.calculate import material_calculator2D
+from drawscaffold.calculate_top_down import top_down_calc
+from drawscaffold.calculator.price_calculator import calculate_price
+from drawscaffold.quote_session import QuoteSession
+from drawscaffold.utils.debug_printer import DebugPrinter
+from drawscaffold.utils.facades import build_facade_set
+
+
+def _facades_arg(args: dict) -> dict:
+    facades = args["facades"]
+    if isinstance(facades, list):
+        args["facades"] = build_facade_set(facades)
+    return args
+
+
+def _top_down_calc(args: dict):
+    args.setdefault("verbose", False)
+    return top_down_calc(**_facades_arg(args))
+
+
+def _material_calculator2D(args: dict):
+    args.setdefault("verbose", False)
+    return material_calculator2D(**args)
+
+
+def _calculate_price(args: dict):
+    ans = calculate_price(args["materials"])
+    if type(ans) is not tuple:
+        return {"data": ans}
+
+    price, currency, symbol = ans
+    return {"price": price, "currency": currency, "symbol": symbol}
+
+
+def _top_down_drawer(args: dict):
+    from drawscaffold.drawer_top_down import top_down_drawer
+
+    args.setdefault("verbose", False)
+    return top_down_drawer(**_facades_arg(args))
+
+
+def _two_d_drawer(args: dict):
+    from drawscaffold.drawer import two_d_drawer
+
+    args.setdefault("verbose", False)
+    return two_d_drawer(**args)
+
+
+# open quote sessions by id, kept until quote_close; clients that never close theirs lose the least recently used
+# ones first
+QUOTE_SESSIONS_MAX = int(os.environ.get("DRAWSCAFFOLD_QUOTE_SESSIONS_MAX", 256))
+
+_quote_sessions = OrderedDict()
+_quote_ids = itertools.count(1)
+
+
+def _quote_open(args: dict):
+    session_id = next(_quote_ids)
+    _quote_sessions[session_id] = session = QuoteSession(**args)
+    while len(_quote_sessions) > QUOTE_SESSIONS_MAX:
+        _quote_sessions.popitem(last=False)
+    return {"session": session_id, **session.quote()}
+
+
+def _quote_edit(args: dict):
+    session = _quote_sessions[args["session"]]
+    _quote_sessions.move_to_end(args["session"])
+    if "add" in args:
+        return session.add_facade(args["add"])
+    if "facade" in args:
+        return session.set_facade(args["index"], args["facade"])
+    return session.remove_facade(args["index"])
+
+
+def _quote_close(args: dict):
+    return {"closed": _quote_sessions.pop(args["session"], None) is not None}
+
+
+OPERATIONS = {
+    "top_down_calc": _top_down_calc,
+    "material_calculator2D": _material_calculator2D,
+    "calculate_price": _calculate_price,
+    "top_down_drawer": _top_down_drawer,
+    "two_d_drawer": _two_d_drawer,
+    "quote_open": _quote_open,
+    "quote_edit": _quote_edit,
+    "quote_close": _quote_close,
+}
+
+
+def _to_json(result):
+    # drawers called with return_bytes hand back raw file contents
+    if isinstance(result, dict):
+        return {key: base64.b64encode(value).decode("ascii") if isinstance(value, bytes) else value
+                for key, value in result.items()}
+    return result
+
+
+def warm_up():
+    """Loads the drawing stack and font metrics once so requests don't pay for it."""
+    from drawscaffold import drawer, drawer_top_down
+    from drawscaffold.shapes.text_fit import _measure_width_precise
+
+    _measure_width_precise("250cm", 10.0)
+
+
+def handle_request(request: dict) -> dict:
+    request_id = request.get("id")
+    op = request.get("op")
+
+    if op not in OPERATIONS:
+        return {"id": request_id, "ok": False, "error": f"unknown op: {op}"}
+
+    try:
+        result = OPERATIONS[op](dict(request.get("args", {})))
+    except Exception as e:
+        return {"id": request_id, "ok": False, "error": f"{type(e).__name__}: {e}"}
+
+    return {"id": request_id, "ok": True, "result": _to_json(result)}
+
+
+def serve_stdio(stdin=sys.stdin, stdout=sys.stdout, d: DebugPrinter = DebugPrinter(False)):
+    for line in stdin:
+        if not line.strip():
+            continue
+
+        try:
+            request = json.loads(line)
+        except json.JSONDecodeError as e:
+            response = {"id": None, "ok": False, "error": f"invalid json: {e}"}
+        else:
+            # anything the calculators print must not end up in the protocol stream
+            with redirect_stdout(sys.stderr):
+                response = handle_request(request)
+
+        d.print(f'{response.get("id")} -> ok: {response["ok"]}')
+        stdout.write(json.dumps(response) + "\n")
+        stdout.flush()
+
+
+class _RequestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length", 0))
+
+        try:
+            request = json.loads(self.rfile.read(length))
+        except json.JSONDecodeError as e:
+            response = {"id": None, "ok": False, "error": f"invalid json: {e}"}
+        else:
+            response = handle_request(request)
+
+        body = json.dumps(response).encode("utf-8")
+        self.send_response(200 if response["ok"] else 400)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        self.server.debug_printer.print(format % args)
+
+
+def serve_http(host: str, port: int, d: DebugPrinter = DebugPrinter(False)):
+    server = HTTPServer((host, port), _RequestHandler)
+    server.debug_printer = d
+    d.print(f'listening on http://{host}:{server.server_port}')
+
+    try:
+        server.serve_forever()
+    finally:
+        server.server_close()
@@ -0,0 +1,156 @@
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, Callable
+
+import ezdxf
+from ezdxf.layouts import BlockLayout
+
+# built templates kept per process, the least recently used go first; every sign text is a block of its own
+BLOCK_TEMPLATE_CACHE_SIZE = 512
+
+# table resources an entity in a block may point at by name
+_RESOURCES = (("layer", "layers"), ("linetype", "linetypes"), ("style", "styles"))
+
+
+def _table_attribs(entry) -> dict:
+    # handles only mean something in the document the entry comes from
+    return {key: value for key, value in entry.dxfattribs().items()
+            if key not in ("handle", "owner", "name") and not key.endswith("_handle")}
+
+
+class BlockLibrary:
+    """Process wide templates of the drawing blocks.
+
+    Every block is built once into a private template document, new documents get a copy of its entities instead
+    of running the builder again. At most `max_built` built templates are kept. Templates can also be preloaded from
+    a DXF file, its blocks then replace the built ones with the same name and are always kept.
+    """
+
+    def __init__(self, template_file: str | None = None, max_built: int = BLOCK_TEMPLATE_CACHE_SIZE):
+        self.template_file = template_file
+        self.max_built = max_built
+        self._lock = threading.RLock()
+        self._doc = None
+        self._templates: Dict[str, BlockLayout] = {}
+        self._built = OrderedDict() # names of the built templates, least recently used first
+
+    def _template_doc(self):
+        if self._doc is None:
+            self._doc = ezdxf.new("R2018")
+            if self.template_file:
+                self.load(self.template_file)
+        return self._doc
+
+    def load(self, path: str):
+        """Registers every named block of the DXF file at `path` as a template."""
+        source = ezdxf.readfile(path)
+        with self._lock:
+            for blk in source.blocks:
+                if blk.is_any_layout or blk.name.startswith("*"):
+                    continue
+                self._templates[blk.name] = blk
+                self._built.pop(blk.name, None)
+
+    def template(self, name: str, builder: Callable[[BlockLayout], None], base_point=(0.0, 0.0)) -> BlockLayout:
+        with self._lock:
+            doc = self._template_doc()
+            blk = self._templates.get(name)
+            if blk is None:
+                blk = doc.blocks.new(name=name, base_point=base_point)
+                builder(blk)
+                self._templates[name] = blk
+                self._built[name] = None
+                self._evict()
+            elif name in self._built:
+                self._built.move_to_end(name)
+            return blk
+
+    def _evict(self):
+        while len(self._built) > self.max_built:
+            name, _ = self._built.popitem(last=False)
+            del self._templates[name]
+            self._doc.blocks.delete_block(name, safe=False)
+
+    def clone_into(self, doc, name: str, builder: Callable[[BlockLayout], None], base_point=(0.0, 0.0)) -> BlockLayout:
+        with self._lock:
+            return self._copy(self.template(name, builder, base_point), doc)
+
+    def _copy(self, template: BlockLayout, doc, anonymous: bool = False) -> BlockLayout:
+        base_point = template.block.dxf.base_point
+        if anonymous:
+            blk = doc.blocks.new_anonymous_block(type_char=template.name[1], base_point=base_point)
+        else:
+            blk = doc.blocks.new(name=template.name, base_point=base_point)
+
+        for entity in template:
+            copy = entity.copy()
+            # blocks from a template file may nest other blocks of the same file
+            if entity.dxftype() == "INSERT":
+                name = self._nested(entity.dxf.name, template.doc, doc)
+                if name is None:
+                    continue # points at a block its own file does not have
+                copy.dxf.name = name
+
+            self._copy_resources(entity, template.doc, doc)
+            blk.add_entity(copy)
+
+        return blk
+
+    def _nested(self, name: str, source_doc, doc) -> str | None:
+        """Name the block of an INSERT copied from `source_doc` has in `doc`, copied over when needed."""
+        if name.startswith("*"):
+            # anonymous blocks are not templates and their names are only unique within their own document
+            source = source_doc.blocks.get(name)
+            return None if source is None else self._copy(source, doc, anonymous=True).name
+
+        if name not in doc.blocks:
+            source = self._templates.get(name) or source_doc.blocks.get(name)
+            if source is None:
+                return None
+            self._copy(source, doc)
+        return name
+
+    def _copy_resources(self, entity, source_doc, doc):
+        for attrib, table_name in _RESOURCES:
+            if not entity.dxf.hasattr(attrib):
+                continue
+
+            name = entity.dxf.get(attrib)
+            table = getattr(doc, table_name)
+            source_table = getattr(source_doc, table_name)
+            if name in table or name not in source_table:
+                continue
+
+            attribs = _table_attribs(source_table.get(name))
+            if attribs.get("linetype", "Continuous") not in doc.linetypes:
+                attribs.pop("linetype")
+            table.new(name, dxfattribs=attribs)
+
+    def clear(self):
+        with self._lock:
+            self._doc = None
+            self._templates.clear()
+            self._built.clear()
+
+
+BLOCK_LIBRARY = BlockLibrary(os.environ.get("DRAWSCAFFOLD_BLOCK_TEMPLATES"))
+
+
+class BlockCache:
+    """The blocks of one document, copied from the library the first time a document needs them."""
+
+    def __init__(self, doc, library: BlockLibrary = BLOCK_LIBRARY):
+        self.doc = doc
+        self.library = library
+        self._cache: Dict[str, BlockLayout] = {}
+
+    def ensure(self, name: str, builder: Callable[[BlockLayout], None], base_point=(0.0, 0.0)) -> BlockLayout:
+        if name in self._cache:
+            return self._cache[name]
+        if name in self.doc.blocks:
+            blk = self.doc.blocks.get(name)
+        else:
+            blk = self.library.clone_into(self.doc, name, builder, base_point)
+        self._cache[name] = blk
+        return blk
@@ -0,0 +1,185 @@
+import atexit
+import hashlib
+import json
+import os
+import string
+from pathlib import Path
+
+import ezdxf
+from ezdxf.addons import text2path
+from ezdxf.fonts import fonts
+from ezdxf.fonts.ttfonts import KerningTable
+
+from drawscaffold.utils.cache_dir import cache_dir
+
+# measured up front, anything else is measured the first time it shows up
+_PRELOAD_GLYPHS = string.printable.strip() + " çğıöşüÇĞİÖŞÜ"
+
+
+def _font_key(font_name: str) -> str:
+    # the bytes of the font file ezdxf resolves the name to, so a font replaced under the same name is measured
+    # again, and the ezdxf version measuring it
+    digest = hashlib.sha256(ezdxf.__version__.encode("utf-8"))
+    try:
+        file_name = fonts.find_font_file_name(fonts.FontFace(family=font_name))
+        # the font manager reads the whole file into memory, the same bytes text2path measures
+        digest.update(fonts.font_manager.get_ttf_font(file_name).reader.file.getvalue())
+    except Exception:
+        digest.update(font_name.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class FontMetrics:
+    """Per glyph advance, ink extent and kerning of a TrueType font, in raw font units.
+
+    Strings are measured arithmetically the same way text2path lays out the glyphs, so the width matches the
+    bounding box of the rendered paths without rendering them.
+    """
+
+    def __init__(self, font_name: str = "Arial", path: Path | None = None):
+        self.font_name = font_name
+        self.path = path
+        self._face = fonts.FontFace(family=font_name)
+        self._glyph_cache = None
+        self._dirty = False # measured since the last save
+
+        self.cap_height = 0.0
+        self.kerning = False
+        self.glyphs = dict() # char -> (advance, ink_xmin, ink_xmax), blank glyphs only have the advance
+        self.kerns = dict() # char pair -> kerning
+
+        if not self._load():
+            glyph_cache = self._renderer()
+            self.cap_height = glyph_cache.font_measurements.cap_height
+            self.kerning = isinstance(glyph_cache.kerning, KerningTable)
+            for char in _PRELOAD_GLYPHS:
+                self._measure_glyph(char)
+            self._save()
+
+    def _renderer(self):
+        if self._glyph_cache is None:
+            self._glyph_cache = text2path.get_font(self._face).glyph_cache
+        return self._glyph_cache
+
+    def _load(self) -> bool:
+        if self.path is None:
+            return False
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return False
+
+        self.cap_height = data["cap_height"]
+        self.kerning = data["kerning"]
+        self.glyphs = {char: tuple(values) for char, values in data["glyphs"].items()}
+        self.kerns = data["kerns"]
+        return True
+
+    def _save(self):
+        if self.path is None:
+            return
+
+        data = {
+            "font": self.font_name,
+            "cap_height": self.cap_height,
+            "kerning": self.kerning,
+            "glyphs": self.glyphs,
+            "kerns": self.kerns,
+        }
+        self._dirty = False
+        try:
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps(data), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass # a read only cache only costs the measuring
+
+    def save_if_changed(self):
+        if self._dirty:
+            self._save()
+
+    def _measure_glyph(self, char: str) -> tuple:
+        glyph_cache = self._renderer()
+        advance = glyph_cache.get_glyph_width(char)
+        glyph_path = glyph_cache.get_glyph_path(char)
+
+        if len(glyph_path):
+            xs = [v.x for v in glyph_path.control_vertices()]
+            glyph = (advance, min(xs), max(xs))
+        else:
+            glyph = (advance,)
+
+        self.glyphs[char] = glyph
+        return glyph
+
+    def glyph(self, char: str) -> tuple:
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            glyph = self._measure_glyph(char)
+            self._dirty = True
+        return glyph
+
+    def kern(self, c0: str, c1: str) -> float:
+        if not self.kerning:
+            return 0.0
+
+        pair = c0 + c1
+        value = self.kerns.get(pair)
+        if value is None:
+            value = self.kerns[pair] = self._renderer().kerning.get(c0, c1)
+            self._dirty = True
+        return value
+
+    def text_width(self, text: str, char_height: float) -> float:
+        """Ink width of `text` at cap height `char_height`."""
+        x_factor = 1.0 / self.cap_height * char_height
+
+        xmin = float("inf")
+        xmax = float("-inf")
+        x_offset = 0.0
+        prev_char = ""
+        for char in text:
+            if self.kerning:
+                x_offset += self.kern(prev_char, char) * x_factor
+
+            glyph = self.glyph(char)
+            if len(glyph) == 3:
+                x0 = glyph[1] * x_factor + x_offset
+                x1 = glyph[2] * x_factor + x_offset
+                if x0 < xmin: xmin = x0
+                if x1 > xmax: xmax = x1
+
+            x_offset += glyph[0] * x_factor
+            prev_char = char
+
+        # new glyphs and pairs of the whole string are saved in one write
+        self.save_if_changed()
+        return max(0.0, xmax - xmin) if xmax >= xmin else 0.0
+
+
+_metrics: dict[str, FontMetrics] = dict()
+
+
+def get_font_metrics(font_name: str = "Arial") -> FontMetrics:
+    metrics = _metrics.get(font_name)
+    if metrics is None:
+        try:
+            path = cache_dir("font_metrics") / f"{_font_key(font_name)}.json"
+        except OSError:
+            path = None
+
+        metrics = _metrics[font_name] = FontMetrics(font_name, path)
+    return metrics
+
+
+def measure_text_width(text: str, char_height: float, font_name: str = "Arial") -> float:
+    if not text:
+        return 0.0
+    return get_font_metrics(font_name).text_width(text, char_height)
+
+
+@atexit.register
+def _save_metrics():
+    for metrics in _metrics.values():
+        metrics.save_if_changed()
@@ -1,9 +1,7 @@
 import math
-from typing import Sequence, Dict, Callable, List
+from typing import Sequence
 
-from ezdxf.addons import text2path
-from ezdxf.fonts import fonts
-from ezdxf.layouts import Modelspace, BlockLayout
+from ezdxf.layouts import Modelspace
 
 from drawscaffold.const.conts import (
     VERTICAL_PART, HALF_VERTICAL_PART, VERTICAL_COLOR,
@@ -11,160 +9,22 @@ from drawscaffold.const.conts import (
     FOOT_PART, HALF_FOOT_PART, COMPLETE_FOOT_PART,
     SURFACE_COLOR, FOOT_COLOR, ADJUSTMENT_COLOR, DIAGONAL_COLOR, DIAGONAL_PART, TEXT_COLOR,
 )
+from drawscaffold.shapes.block_library import BlockCache
+from drawscaffold.shapes.text_fit import fit_text_to_box
 
-class _BlockCache:
-    def __init__(self, doc):
-        self.doc = doc
-        self._cache: Dict[str, BlockLayout] = {}
-
-    def ensure(self, name: str, builder: Callable[[BlockLayout], None], base_point=(0.0, 0.0)) -> BlockLayout:
-        if name in self._cache:
-            return self._cache[name]
-        if name in self.doc.blocks:
-            blk = self.doc.blocks.get(name)
-        else:
-            blk = self.doc.blocks.new(name=name, base_point=base_point)
-            builder(blk)
-        self._cache[name] = blk
-        return blk
-
-def _measure_width_precise(text: str, char_height: float, font_name: str = "Arial") -> float:
-    if not text:
-        return 0.0
-
-    face = fonts.FontFace(family=font_name)
-    paths = text2path.make_paths_from_str(text, font=face, size=char_height)
-    if not paths:
-        return 0.0
-
-    xmin = ymin = float("inf")
-    xmax = ymax = float("-inf")
-
-    for p in paths:
-        bb = p.bbox()
-        try:
-            x0, y0, x1, y1 = bb
-        except Exception:
-            if hasattr(bb, "extmin"):
-                x0, y0 = float(bb.extmin.x), float(bb.extmin.y)
-                x1, y1 = float(bb.extmax.x), float(bb.extmax.y)
-            else:
-                extmin, extmax = bb
-                x0, y0 = float(extmin[0]), float(extmin[1])
-                x1, y1 = float(extmax[0]), float(extmax[1])
-
-        if x0 < xmin: xmin = x0
-        if y0 < ymin: ymin = y0
-        if x1 > xmax: xmax = x1
-        if y1 > ymax: ymax = y1
-
-    return max(0.0, xmax - xmin)
-
-def _wrap_text_to_width(text: str, char_height: float, max_width: float,
-                        font_name: str = "Arial", hard_wrap: bool = False) -> List[str]:
-    words = text.split()
-    lines: List[str] = []
-    cur: List[str] = []
-
-    def line_width(parts: List[str]) -> float:
-        s = " ".join(parts)
-        return _measure_width_precise(s, char_height, font_name)
-
-    for w in words:
-        if not cur:
-            cur = [w]
-            continue
-        if line_width(cur + [w]) <= max_width:
-            cur.append(w)
-        else:
-            lines.append(" ".join(cur))
-            cur = [w]
-    if cur:
-        lines.append(" ".join(cur))
-
-    if hard_wrap and len(lines) == 1 and " " not in text and _measure_width_precise(text, char_height, font_name) > max_width:
-        cur = []
-        lines = []
-        buf = ""
-        for ch in text:
-            test = buf + ch
-            if _measure_width_precise(test, char_height, font_name) <= max_width:
-                buf = test
-            else:
-                if buf:
-                    lines.append(buf)
-                buf = ch
-        if buf:
-            lines.append(buf)
-
-    return lines
-
-def _fit_text_to_box(
-    text: str,
-    box_w: float,
-    box_h: float,
-    font_name: str = "Arial",
-    line_spacing: float = 1.2,
-    h_min: float = 2.0,
-    h_max: float = 26.0,
-    max_lines: int = 3,
-    hard_wrap_long_words: bool = True,
-):
-    lo, hi = h_min, h_max
-    best_h = lo
-    best_lines = [text]
-
-    for _ in range(30):
-        mid = (lo + hi) / 2.0
-        lines = _wrap_text_to_width(
-            text, mid, box_w,
-            font_name=font_name,
-            hard_wrap=hard_wrap_long_words
-        )
-        total_h = len(lines) * mid * line_spacing
-        fits = (total_h <= box_h) and (len(lines) <= max_lines)
-
-        if fits:
-            best_h, best_lines = mid, lines
-            lo = mid
-        else:
-            if len(lines) > max_lines or total_h > box_h:
-                hi = mid
-            else:
-                lo = mid
-
-        if hi - lo < 1e-3:
-            break
-
-    if len(best_lines) > max_lines:
-        h = best_h
-        for _ in range(30):
-            h = max(h_min, h * 0.9)
-            lines = _wrap_text_to_width(
-                text, h, box_w,
-                font_name=font_name,
-                hard_wrap=hard_wrap_long_words
-            )
-            if len(lines) <= max_lines and (len(lines)*h*line_spacing) <= box_h:
-                best_h, best_lines = h, lines
-                break
-        else:
-            tiny = _wrap_text_to_width(
-                text, h_min, box_w,
-                font_name=font_name,
-                hard_wrap=True
-            )
-            merged = tiny[:max_lines-1]
-            merged.append(" ".join(tiny[max_lines-1:]))
-            best_h, best_lines = h_min, merged
+# the blocks are shared process wide through the block library, so every parameter shaping a block is in its name;
+# the defaults keep the plain names
+SIGN_FONT = "Arial"
+SIGN_LINE_SPACING = 1.2
+DIAGONAL_THICKNESS = 2.0
+DIAGONAL_END_RADIUS = 1.0
 
-    return best_h, best_lines
 
 class Drawer2D:
     def __init__(self, msp: Modelspace, doc):
         self.msp = msp
         self.doc = doc
-        self._blocks = _BlockCache(doc)
+        self._blocks = BlockCache(doc)
 
     def _ensure_lock_block(self):
         name = "LOCK_STD"
@@ -338,9 +198,12 @@ class Drawer2D:
         self.msp.add_blockref(lock_blk.name, insert=(x, lock_cy))
         return (x, lock_cy)
 
-    def _ensure_diagonal_body_fixed(self, length: float, thickness: float = 2.0, end_radius: float = 1.0):
+    def _ensure_diagonal_body_fixed(self, length: float, thickness: float = DIAGONAL_THICKNESS,
+                                    end_radius: float = DIAGONAL_END_RADIUS):
         L = round(float(length), 2)
         name = f"DIAG_BODY_FIXED_{L:g}"
+        if (thickness, end_radius) != (DIAGONAL_THICKNESS, DIAGONAL_END_RADIUS):
+            name += f"_T{thickness:g}_R{end_radius:g}"
 
         def build(blk):
             half = L / 2.0
@@ -368,7 +231,8 @@ class Drawer2D:
 
         return self._blocks.ensure(name, build, base_point=(0.0, 0.0))
 
-    def draw_diagonal(self, start_point: Sequence[float], end_point: Sequence[float], end_circle_radius: float = 1.0):
+    def draw_diagonal(self, start_point: Sequence[float], end_point: Sequence[float],
+                      end_circle_radius: float = DIAGONAL_END_RADIUS):
         x1, y1 = start_point
         x2, y2 = end_point
 
@@ -384,14 +248,17 @@ class Drawer2D:
         self.msp.add_blockref(circ_blk.name, insert=(x1, y1))
         self.msp.add_blockref(circ_blk.name, insert=(x2, y2))
 
-        body_blk = self._ensure_diagonal_body_fixed(DIAGONAL_PART, thickness=2.0, end_radius=end_circle_radius)
+        body_blk = self._ensure_diagonal_body_fixed(DIAGONAL_PART, thickness=DIAGONAL_THICKNESS,
+                                                    end_radius=end_circle_radius)
         ins = self.msp.add_blockref(body_blk.name, insert=(mx, my))
         ins.dxf.rotation = angle_deg
 
     def draw_sign(self, start_point: Sequence[float], text: str,
-                  font_name: str = "Arial", line_spacing: float = 1.2):
+                  font_name: str = SIGN_FONT, line_spacing: float = SIGN_LINE_SPACING):
         x1, y1 = start_point
         name = f"SIGN_{text}"
+        if (font_name, line_spacing) != (SIGN_FONT, SIGN_LINE_SPACING):
+            name += f"@{font_name}@{line_spacing:g}"
 
         def build(blk):
             pts = [
@@ -409,7 +276,7 @@ class Drawer2D:
             box_w = (x_right - x_left)
             box_h = (y_top - y_bot)
 
-            char_h, lines = _fit_text_to_box(
+            char_h, lines = fit_text_to_box(
                 text=text,
                 box_w=box_w,
                 box_h=box_h,
@@ -431,8 +298,10 @@ class Drawer2D:
             m.dxf.width = 0.0
             m.dxf.color = TEXT_COLOR
 
-            style = self.doc.styles.new("BOLD_ARIAL", dxfattribs={"font": "arialbd.ttf"})
-            style.dxf.oblique = 25
+            # the block is built into the library's template document, signs with other texts share the style
+            if "BOLD_ARIAL" not in blk.doc.styles:
+                style = blk.doc.styles.new("BOLD_ARIAL", dxfattribs={"font": "arialbd.ttf"})
+                style.dxf.oblique = 25
             m.dxf.style = "BOLD_ARIAL"
 
         blk = self._blocks.ensure(name, build)
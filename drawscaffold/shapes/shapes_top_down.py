@@ -1,149 +1,18 @@
 import math
-from typing import Sequence, Dict, Callable, List
+from typing import Sequence
 
-from ezdxf.addons import text2path
-from ezdxf.fonts import fonts
-from ezdxf.layouts import Modelspace, BlockLayout
+from ezdxf.layouts import Modelspace
 
 from drawscaffold.const.conts import (
     HORIZONTAL_PART, TEXT_COLOR, SMALL_HORIZONTAL_PART,
     TOP_CIRCLE_COLOR, TOP_VERTICAL_COLOR, TOP_PLATFORM_COLOR, TOP_INNER_HORIZONTAL_COLOR, TOP_OUTER_HORIZONTAL_COLOR,
 )
 from drawscaffold.const.top_down_enum import ScaffoldSide
+from drawscaffold.shapes.block_library import BlockCache
+from drawscaffold.shapes.text_fit import fit_text_to_box
+from drawscaffold.utils.facades import FacadeSet
 
 
-def _measure_width_precise(text: str, char_height: float, font_name: str = "Arial") -> float:
-    if not text:
-        return 0.0
-
-    face = fonts.FontFace(family=font_name)
-    paths = text2path.make_paths_from_str(text, font=face, size=char_height)
-    if not paths:
-        return 0.0
-
-    xmin = ymin = float("inf")
-    xmax = ymax = float("-inf")
-
-    for p in paths:
-        bb = p.bbox()
-        try:
-            x0, y0, x1, y1 = bb
-        except Exception:
-            if hasattr(bb, "extmin"):
-                x0, y0 = float(bb.extmin.x), float(bb.extmin.y)
-                x1, y1 = float(bb.extmax.x), float(bb.extmax.y)
-            else:
-                extmin, extmax = bb
-                x0, y0 = float(extmin[0]), float(extmin[1])
-                x1, y1 = float(extmax[0]), float(extmax[1])
-
-        if x0 < xmin: xmin = x0
-        if y0 < ymin: ymin = y0
-        if x1 > xmax: xmax = x1
-        if y1 > ymax: ymax = y1
-
-    return max(0.0, xmax - xmin)
-
-def _wrap_text_to_width(text: str, char_height: float, max_width: float,
-                        font_name: str = "Arial", hard_wrap: bool = False) -> List[str]:
-    words = text.split()
-    lines: List[str] = []
-    cur: List[str] = []
-
-    def line_width(parts: List[str]) -> float:
-        s = " ".join(parts)
-        return _measure_width_precise(s, char_height, font_name)
-
-    for w in words:
-        if not cur:
-            cur = [w]
-            continue
-        if line_width(cur + [w]) <= max_width:
-            cur.append(w)
-        else:
-            lines.append(" ".join(cur))
-            cur = [w]
-    if cur:
-        lines.append(" ".join(cur))
-
-    if hard_wrap and len(lines) == 1 and " " not in text and _measure_width_precise(text, char_height, font_name) > max_width:
-        cur = []
-        lines = []
-        buf = ""
-        for ch in text:
-            test = buf + ch
-            if _measure_width_precise(test, char_height, font_name) <= max_width:
-                buf = test
-            else:
-                if buf:
-                    lines.append(buf)
-                buf = ch
-        if buf:
-            lines.append(buf)
-
-    return lines
-
-def _fit_text_to_box(
-    text: str,
-    box_w: float,
-    box_h: float,
-    font_name: str = "Arial",
-    line_spacing: float = 1.2,
-    h_min: float = 2.0,
-    h_max: float = 26.0,
-    max_lines: int = 3,
-    hard_wrap_long_words: bool = True,
-):
-    lo, hi = h_min, h_max
-    best_h = lo
-    best_lines = [text]
-
-    for _ in range(30):
-        mid = (lo + hi) / 2.0
-        lines = _wrap_text_to_width(
-            text, mid, box_w,
-            font_name=font_name,
-            hard_wrap=hard_wrap_long_words
-        )
-        total_h = len(lines) * mid * line_spacing
-        fits = (total_h <= box_h) and (len(lines) <= max_lines)
-
-        if fits:
-            best_h, best_lines = mid, lines
-            lo = mid
-        else:
-            if len(lines) > max_lines or total_h > box_h:
-                hi = mid
-            else:
-                lo = mid
-
-        if hi - lo < 1e-3:
-            break
-
-    if len(best_lines) > max_lines:
-        h = best_h
-        for _ in range(30):
-            h = max(h_min, h * 0.9)
-            lines = _wrap_text_to_width(
-                text, h, box_w,
-                font_name=font_name,
-                hard_wrap=hard_wrap_long_words
-            )
-            if len(lines) <= max_lines and (len(lines)*h*line_spacing) <= box_h:
-                best_h, best_lines = h, lines
-                break
-        else:
-            tiny = _wrap_text_to_width(
-                text, h_min, box_w,
-                font_name=font_name,
-                hard_wrap=True
-            )
-            merged = tiny[:max_lines-1]
-            merged.append(" ".join(tiny[max_lines-1:]))
-            best_h, best_lines = h_min, merged
-
-    return best_h, best_lines
-
 def _net_perp_offset(points, direction: str) -> float:
     if not points or len(points) < 2:
         return 0.0
@@ -157,29 +26,13 @@ def _apply_length_correction(base_len: int, prev_points, prev_dir: str) -> int:
     corr = abs(_net_perp_offset(prev_points, prev_dir))
     return int(round(base_len - corr))
 
-class _BlockCache:
-    def __init__(self, doc):
-        self.doc = doc
-        self._cache: Dict[str, BlockLayout] = {}
-
-    def ensure(self, name: str, builder: Callable[[BlockLayout], None], base_point=(0.0, 0.0)) -> BlockLayout:
-        if name in self._cache:
-            return self._cache[name]
-        if name in self.doc.blocks:
-            blk = self.doc.blocks.get(name)
-        else:
-            blk = self.doc.blocks.new(name=name, base_point=base_point)
-            builder(blk)
-        self._cache[name] = blk
-        return blk
-
 class DrawerTopView:
     def __init__(self, msp: Modelspace, doc):
         self.msp = msp
         self.doc = doc
-        self._blocks = _BlockCache(doc)
+        self._blocks = BlockCache(doc)
 
-    def line_building(self, facades: dict):
+    def line_building(self, facades: FacadeSet):
         front_cmds = self._parse_facade_commands(facades, 'f')
         right_cmds = self._parse_facade_commands(facades, 'r')
         back_cmds = self._parse_facade_commands(facades, 'b')
@@ -190,41 +43,42 @@ class DrawerTopView:
         all_points = []
 
         front_points = right_points = back_points = left_points = None
+        side_outset = facades.outset_totals['L'] + facades.outset_totals['R']
 
         if front_cmds and facades.get('F'):
-            front_len = int(facades['F'][-1].split(',')[2])
-            front_points = self._calculate_facade_points(start_x, start_y, front_cmds, efficient_cmds=[facades['L'], facades['R']], length=front_len, direction='h')
+            front_len = facades.length('F')
+            front_points = self._calculate_facade_points(start_x, start_y, front_cmds, outset=side_outset, length=front_len, direction='h')
             all_points += front_points[1:] if all_points else front_points
             if front_points:
                 start_x, start_y = front_points[-1]
 
         if right_cmds and facades.get('R'):
-            right_len = int(facades['R'][-1].split(',')[2])
+            right_len = facades.length('R')
             if front_points:
                 right_len = _apply_length_correction(right_len, front_points, 'h')
 
-            right_points = self._calculate_facade_points(start_x, start_y, right_cmds, efficient_cmds=[facades['F'], facades['B']], length=right_len, direction='v')
+            right_points = self._calculate_facade_points(start_x, start_y, right_cmds, length=right_len, direction='v')
             all_points += right_points[1:]
             if right_points:
                 start_x, start_y = right_points[-1]
 
         if back_cmds and facades.get('B'):
-            back_len = int(facades['B'][-1].split(',')[2])
+            back_len = facades.length('B')
             if right_points:
                 back_len = _apply_length_correction(back_len, right_points, 'v')
 
-            back_points = self._calculate_facade_points(start_x, start_y, back_cmds, efficient_cmds=[facades['L'], facades['R']], direction='h', length=back_len,
+            back_points = self._calculate_facade_points(start_x, start_y, back_cmds, outset=side_outset, direction='h', length=back_len,
                                                         reverse=True)
             all_points += back_points[1:]
             if back_points:
                 start_x, start_y = back_points[-1]
 
         if left_cmds and facades.get('L'):
-            left_len = int(facades['L'][-1].split(',')[2])
+            left_len = facades.length('L')
             if back_points:
                 left_len = _apply_length_correction(left_len, back_points, 'h')
 
-            left_points = self._calculate_facade_points(start_x, start_y, left_cmds, efficient_cmds=[facades['F'], facades['B']], direction='v', length=left_len,
+            left_points = self._calculate_facade_points(start_x, start_y, left_cmds, direction='v', length=left_len,
                                                         reverse=True)
             all_points += left_points[1:]
 
@@ -263,9 +117,7 @@ class DrawerTopView:
         # Çizgiyi çiz
         self.msp.add_lwpolyline(points, close=False)
 
-    def _parse_facade_commands(self, facades: dict, side_char: str):
-        commands = []
-
+    def _parse_facade_commands(self, facades: FacadeSet, side_char: str):
         if side_char in ['f', 'l']:
             inset_sign = 1
             outset_sign = -1
@@ -273,22 +125,8 @@ class DrawerTopView:
             inset_sign = -1
             outset_sign = 1
 
-        for key in facades.keys():
-            for item in facades[key]:
-                values = str(item).split(',')
-                if len(values) < 5:
-                    continue
-                try:
-                    func = str(values[0]).lower()
-                    pos = int(values[1])
-                    depth = int(values[3])
-                    side = str(values[4]).lower()
-                except Exception:
-                    continue
-
-                if side == side_char:
-                    signed_depth = depth * (outset_sign if func == 'outset' else inset_sign)
-                    commands.append((pos, signed_depth))
+        commands = [(item.start, item.depth * (outset_sign if item.kind == 'outset' else inset_sign))
+                    for item in facades[side_char.upper()]]
 
         if not commands:
             return []
@@ -297,20 +135,12 @@ class DrawerTopView:
         return commands
 
     def _calculate_facade_points(self, start_x: float, start_y: float,
-                                 commands: list, efficient_cmds: list[list], direction: str, length: int, reverse: bool = False):
+                                 commands: list, direction: str, length: int, reverse: bool = False, outset: int = 0):
         if not commands:
             return []
 
-        if efficient_cmds and direction=='h':
-            total_cumulative_outset = 0
-            for cmds in efficient_cmds:
-                for cmd in cmds:
-                    split_data = str(cmd).split(',')
-
-                    if split_data[0] == 'outset':
-                        total_cumulative_outset += int(split_data[-2])
-
-            length -= total_cumulative_outset
+        if direction=='h':
+            length -= outset
 
         points = []
         current_depth = 0
@@ -390,7 +220,7 @@ class DrawerTopView:
                 box_w = (text_x_right - text_x_left)
                 box_h = (text_y_top - text_y_bot)
 
-                char_h, lines = _fit_text_to_box(
+                char_h, lines = fit_text_to_box(
                     text=f"{height}cm",
                     box_w=box_h,
                     box_h=box_w,
@@ -413,11 +243,11 @@ class DrawerTopView:
                 m.dxf.color = TEXT_COLOR
 
                 STYLE_NAME = "BOLD_ARIAL"
-                if STYLE_NAME not in self.doc.styles:
-                    style = self.doc.styles.new(STYLE_NAME, dxfattribs={"font": "arialbd.ttf"})
+                if STYLE_NAME not in blk.doc.styles:
+                    style = blk.doc.styles.new(STYLE_NAME, dxfattribs={"font": "arialbd.ttf"})
                     style.dxf.oblique = 25
                 else:
-                    style = self.doc.styles.get(STYLE_NAME)
+                    style = blk.doc.styles.get(STYLE_NAME)
                     style.dxf.oblique = 25
 
                 m.dxf.style = "BOLD_ARIAL"
@@ -0,0 +1,245 @@
+import atexit
+import json
+import os
+from functools import lru_cache
+from typing import List
+
+from drawscaffold.shapes.font_metrics import get_font_metrics, measure_text_width
+from drawscaffold.utils.cache_dir import cache_dir
+
+TEXT_FIT_CACHE_SIZE = 2048
+# layouts kept on disk per font, the oldest written go first
+TEXT_FIT_STORE_SIZE = 4096
+# new layouts written to disk together
+TEXT_FIT_FLUSH_EVERY = 64
+# bump when the fitting below changes, older layouts on disk are dropped
+_LAYOUT_VERSION = 1
+
+
+def _measure_width_precise(text: str, char_height: float, font_name: str = "Arial") -> float:
+    # glyph metrics are cached per font, the string is measured without rendering it
+    return measure_text_width(text, char_height, font_name)
+
+
+def _wrap_text_to_width(text: str, char_height: float, max_width: float,
+                        font_name: str = "Arial", hard_wrap: bool = False) -> List[str]:
+    words = text.split()
+    lines: List[str] = []
+    cur: List[str] = []
+
+    def line_width(parts: List[str]) -> float:
+        s = " ".join(parts)
+        return _measure_width_precise(s, char_height, font_name)
+
+    for w in words:
+        if not cur:
+            cur = [w]
+            continue
+        if line_width(cur + [w]) <= max_width:
+            cur.append(w)
+        else:
+            lines.append(" ".join(cur))
+            cur = [w]
+    if cur:
+        lines.append(" ".join(cur))
+
+    if hard_wrap and len(lines) == 1 and " " not in text and _measure_width_precise(text, char_height, font_name) > max_width:
+        cur = []
+        lines = []
+        buf = ""
+        for ch in text:
+            test = buf + ch
+            if _measure_width_precise(test, char_height, font_name) <= max_width:
+                buf = test
+            else:
+                if buf:
+                    lines.append(buf)
+                buf = ch
+        if buf:
+            lines.append(buf)
+
+    return lines
+
+
+def _fit_text_to_box(
+    text: str,
+    box_w: float,
+    box_h: float,
+    font_name: str = "Arial",
+    line_spacing: float = 1.2,
+    h_min: float = 2.0,
+    h_max: float = 26.0,
+    max_lines: int = 3,
+    hard_wrap_long_words: bool = True,
+):
+    lo, hi = h_min, h_max
+    best_h = lo
+    best_lines = [text]
+
+    for _ in range(30):
+        mid = (lo + hi) / 2.0
+        lines = _wrap_text_to_width(
+            text, mid, box_w,
+            font_name=font_name,
+            hard_wrap=hard_wrap_long_words
+        )
+        total_h = len(lines) * mid * line_spacing
+        fits = (total_h <= box_h) and (len(lines) <= max_lines)
+
+        if fits:
+            best_h, best_lines = mid, lines
+            lo = mid
+        else:
+            if len(lines) > max_lines or total_h > box_h:
+                hi = mid
+            else:
+                lo = mid
+
+        if hi - lo < 1e-3:
+            break
+
+    if len(best_lines) > max_lines:
+        h = best_h
+        for _ in range(30):
+            h = max(h_min, h * 0.9)
+            lines = _wrap_text_to_width(
+                text, h, box_w,
+                font_name=font_name,
+                hard_wrap=hard_wrap_long_words
+            )
+            if len(lines) <= max_lines and (len(lines)*h*line_spacing) <= box_h:
+                best_h, best_lines = h, lines
+                break
+        else:
+            tiny = _wrap_text_to_width(
+                text, h_min, box_w,
+                font_name=font_name,
+                hard_wrap=True
+            )
+            merged = tiny[:max_lines-1]
+            merged.append(" ".join(tiny[max_lines-1:]))
+            best_h, best_lines = h_min, merged
+
+    return best_h, best_lines
+
+
+class _FitStore:
+    """Text layouts of one font file kept on disk between runs.
+
+    New layouts are written every TEXT_FIT_FLUSH_EVERY additions and at exit, merged into what other processes
+    wrote meanwhile, and the file is capped at TEXT_FIT_STORE_SIZE layouts.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.entries = self._read()
+        self.added = dict()
+
+    def _read(self) -> dict:
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return dict()
+        return data["entries"] if data.get("version") == _LAYOUT_VERSION else dict()
+
+    def add(self, key: str, char_height: float, lines: List[str]):
+        self.entries[key] = self.added[key] = [char_height, lines]
+        if len(self.added) >= TEXT_FIT_FLUSH_EVERY:
+            self.flush()
+
+    def flush(self):
+        if not self.added:
+            return
+
+        entries = self._read()
+        for key in self.added:
+            entries.pop(key, None) # moved to the end, the newest
+        entries.update(self.added)
+        if len(entries) > TEXT_FIT_STORE_SIZE:
+            entries = dict(list(entries.items())[-TEXT_FIT_STORE_SIZE:])
+
+        self.entries = entries
+        self.added = dict()
+        try:
+            tmp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+            tmp_path.write_text(json.dumps({"version": _LAYOUT_VERSION, "entries": entries}), encoding="utf-8")
+            os.replace(tmp_path, self.path)
+        except OSError:
+            pass # a read only cache only costs the fitting
+
+
+_stores: dict[str, _FitStore | None] = dict()
+_disk_cache = True
+
+
+def use_disk_cache(enabled: bool = True):
+    """Turns the on-disk layout cache on or off, the in-memory cache is always used."""
+    global _disk_cache
+    _disk_cache = enabled
+    clear_text_fit_cache()
+
+
+def _store(font_name: str) -> _FitStore | None:
+    if font_name not in _stores:
+        # layouts are only valid for the font file they were measured with, the metrics are keyed the same way
+        metrics_path = get_font_metrics(font_name).path
+        try:
+            _stores[font_name] = _FitStore(cache_dir("text_fit") / metrics_path.name) if metrics_path else None
+        except OSError:
+            _stores[font_name] = None
+    return _stores[font_name]
+
+
+@lru_cache(maxsize=TEXT_FIT_CACHE_SIZE)
+def _cached_fit(text: str, box_w: float, box_h: float, font_name: str, line_spacing: float,
+                h_min: float, h_max: float, max_lines: int, hard_wrap_long_words: bool) -> tuple[float, tuple[str, ...]]:
+    store = _store(font_name) if _disk_cache else None
+    key = json.dumps([text, box_w, box_h, line_spacing, h_min, h_max, max_lines, hard_wrap_long_words])
+
+    if store is not None and key in store.entries:
+        char_height, lines = store.entries[key]
+        return char_height, tuple(lines)
+
+    char_height, lines = _fit_text_to_box(text, box_w, box_h, font_name, line_spacing,
+                                          h_min, h_max, max_lines, hard_wrap_long_words)
+    if store is not None:
+        store.add(key, char_height, lines)
+    return char_height, tuple(lines)
+
+
+def fit_text_to_box(
+    text: str,
+    box_w: float,
+    box_h: float,
+    font_name: str = "Arial",
+    line_spacing: float = 1.2,
+    h_min: float = 2.0,
+    h_max: float = 26.0,
+    max_lines: int = 3,
+    hard_wrap_long_words: bool = True,
+):
+    """Largest char height and the wrapped lines of `text` that fit the box, computed once per unique label."""
+    char_height, lines = _cached_fit(text, float(box_w), float(box_h), font_name, float(line_spacing),
+                                     float(h_min), float(h_max), max_lines, hard_wrap_long_words)
+    return char_height, list(lines)
+
+
+def text_fit_cache_info():
+    """Hit/miss statistics of the in-memory text layout cache."""
+    return _cached_fit.cache_info()
+
+
+def flush_text_fit_store():
+    """Writes the layouts not on disk yet."""
+    for store in _stores.values():
+        if store is not None:
+            store.flush()
+
+
+atexit.register(flush_text_fit_store)
+
+
+def clear_text_fit_cache():
+    flush_text_fit_store()
+    _cached_fit.cache_clear()
+    _stores.clear()
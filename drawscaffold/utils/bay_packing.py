@@ -0,0 +1,92 @@
+from dataclasses import dataclass
+from functools import lru_cache
+from math import gcd
+
+from drawscaffold.const.conts import HORIZONTAL_PART, SMALL_HORIZONTAL_PART
+
+BAY_PACKING_CACHE_SIZE = 4096
+
+_STEP = gcd(HORIZONTAL_PART, SMALL_HORIZONTAL_PART)
+
+
+@dataclass(frozen=True, slots=True)
+class BayPacking:
+    big: int            # 250 cm bays
+    small: int          # 150 cm bays, the closing one included
+    leftover: int = 0   # end of the run the bays stop short of, before the closing bay
+    overshoot: int = 0  # how far the closing bay passes the end of the run
+
+    @property
+    def count(self) -> int:
+        return self.big + self.small
+
+    @property
+    def uncovered(self) -> int:
+        # a closing bay covers the leftover
+        return 0 if self.overshoot else self.leftover
+
+
+# fewest (big, small) bays adding up to exactly i * _STEP cm, None when no mix does; grown on demand
+_exact = [(0, 0)]
+
+
+def _exact_bays(total: int) -> tuple[int, int] | None:
+    while len(_exact) * _STEP <= total:
+        length = len(_exact) * _STEP
+        best = None
+        for size, add in ((HORIZONTAL_PART, (1, 0)), (SMALL_HORIZONTAL_PART, (0, 1))):
+            prev = _exact[(length - size) // _STEP] if length >= size else None
+            if prev is None:
+                continue
+            mix = (prev[0] + add[0], prev[1] + add[1])
+            # fewest bays, then the most big ones
+            if best is None or (sum(mix), -mix[0]) < (sum(best), -best[0]):
+                best = mix
+        _exact.append(best)
+
+    return _exact[total // _STEP]
+
+
+@lru_cache(maxsize=BAY_PACKING_CACHE_SIZE)
+def pack_bays(length: int, close_leftover: tuple[int, int] | None = None) -> BayPacking:
+    """Bays covering a run of `length` cm.
+
+    Runs without `close_leftover` get the plain big/small division; the walks advance their cursor by it, so every
+    later corner depends on it staying put. On a closed run the bays stop less than a small bay short of the end,
+    and a leftover within `close_leftover` (inclusive) gets one more small bay reaching past it. Of the mixes that
+    do, the one leaving the least of the run uncovered wins, then the one with the fewest bays, then the least
+    overshoot. The plain division is one of the mixes, so the run is never left barer than dividing it would.
+    """
+    if length < 0 or not close_leftover:
+        # open runs, and runs that came out negative, keep the division the walks always made
+        return _divided(length, close_leftover)
+
+    best, best_key = None, None
+    for leftover in range(length % _STEP, min(SMALL_HORIZONTAL_PART, length + 1), _STEP):
+        mix = _exact_bays(length - leftover)
+        if mix is None:
+            continue
+
+        big, small = mix
+        overshoot = 0
+        if close_leftover and leftover and close_leftover[0] <= leftover <= close_leftover[1]:
+            small += 1
+            overshoot = SMALL_HORIZONTAL_PART - leftover
+
+        packing = BayPacking(big, small, leftover, overshoot)
+        key = (packing.uncovered, packing.count, overshoot, -big)
+        if best_key is None or key < best_key:
+            best, best_key = packing, key
+
+    return best
+
+
+def _divided(length: int, close_leftover: tuple[int, int] | None) -> BayPacking:
+    big, rest = divmod(length, HORIZONTAL_PART)
+    small, leftover = divmod(rest, SMALL_HORIZONTAL_PART)
+
+    overshoot = 0
+    if close_leftover and leftover and close_leftover[0] <= leftover <= close_leftover[1]:
+        small += 1
+        overshoot = SMALL_HORIZONTAL_PART - leftover
+    return BayPacking(big, small, leftover, overshoot)
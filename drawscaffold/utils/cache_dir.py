@@ -0,0 +1,11 @@
+import os
+from pathlib import Path
+
+
+def cache_dir(*parts: str) -> Path:
+    """Directory for the on-disk caches, $DRAWSCAFFOLD_CACHE_DIR or ~/.cache/drawscaffold."""
+    root = os.environ.get("DRAWSCAFFOLD_CACHE_DIR")
+    path = Path(root) if root else Path.home() / ".cache" / "drawscaffold"
+    path = path.joinpath(*parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
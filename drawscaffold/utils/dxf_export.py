@@ -0,0 +1,172 @@
+import gzip
+import io
+import threading
+from collections import OrderedDict
+
+from ezdxf import bbox
+from ezdxf.addons import MTextExplode, text2path
+from ezdxf.math import Vec3
+
+# bytes buffered between writes to the output file
+DXF_WRITE_BUFFER = 1 << 20
+
+# output format -> file extension
+DXF_FORMATS = {"ascii": ".dxf", "binary": ".dxf", "gzip": ".dxf.gz", "zstd": ".dxf.zst"}
+DXF_GZIP_LEVEL = 6
+DXF_ZSTD_LEVEL = 3
+
+# outline entities of the distinct texts seen by this process, the same labels repeat in every drawing;
+# the least recently used ones go first, like the segment cache
+DXF_OUTLINE_CACHE_SIZE = 2048
+
+_outlines = OrderedDict()
+_outlines_lock = threading.Lock()
+
+
+def _text_key(doc, entity) -> tuple:
+    style = doc.styles.get(entity.dxf.get("style", "Standard"))
+    font = style.dxf.get("font", "") if style is not None else ""
+    attribs = tuple(sorted((key, str(value)) for key, value in entity.dxfattribs().items()
+                           if key not in ("handle", "owner")))
+    text = entity.text if entity.dxftype() == "MTEXT" else entity.dxf.text
+    return entity.dxftype(), text, font, attribs
+
+
+def _outline(doc, entity) -> list:
+    if entity.dxftype() == "TEXT":
+        return list(text2path.virtual_entities(entity))
+
+    # MTEXT is broken into TEXT lines in a scratch block first, like the modelspace explode did
+    scratch = doc.blocks.new_anonymous_block()
+    try:
+        with MTextExplode(scratch, doc) as xpl:
+            xpl.explode(entity, destroy=False)
+
+        outline = []
+        for part in scratch:
+            if part.dxftype() == "TEXT":
+                outline.extend(text2path.virtual_entities(part))
+            else:
+                outline.append(part.copy())
+        return outline
+    finally:
+        doc.blocks.delete_block(scratch.name, safe=False)
+
+
+def _cached_outline(key: tuple) -> list | None:
+    with _outlines_lock:
+        outline = _outlines.get(key)
+        if outline is not None:
+            _outlines.move_to_end(key)
+        return outline
+
+
+def _cache_outline(key: tuple, outline: list):
+    with _outlines_lock:
+        _outlines[key] = outline
+        while len(_outlines) > DXF_OUTLINE_CACHE_SIZE:
+            _outlines.popitem(last=False)
+
+
+def text_to_paths(doc) -> int:
+    """Replaces the MTEXT and TEXT of the block definitions and the modelspace with filled outlines.
+
+    Text is converted where it is defined, not per insert, and each distinct text once per process. Returns the
+    number of texts replaced.
+    """
+    layouts = [doc.modelspace(), *(block for block in doc.blocks if not block.is_any_layout)]
+
+    replaced = 0
+    for layout in layouts:
+        for entity in list(layout.query("MTEXT TEXT")):
+            key = _text_key(doc, entity)
+            outline = _cached_outline(key)
+            if outline is None:
+                outline = _outline(doc, entity)
+                _cache_outline(key, outline)
+
+            for part in outline:
+                layout.add_entity(part.copy())
+            layout.delete_entity(entity)
+            replaced += 1
+
+    return replaced
+
+
+def prepare_dxf(doc, msp, text_paths: bool = False):
+    """Stores the drawing extents in the header and turns the text into outlines, as the saved DXF carries them."""
+    ext = bbox.extents(msp)
+    if ext is not None:
+        (xmin, ymin, _), (xmax, ymax, _) = ext.extmin, ext.extmax
+        msp.dxf_layout.dxf.extmin = Vec3(xmin, ymin, 0)
+        msp.dxf_layout.dxf.extmax = Vec3(xmax, ymax, 0)
+        doc.header["$EXTMIN"] = msp.dxf_layout.dxf.extmin
+        doc.header["$EXTMAX"] = msp.dxf_layout.dxf.extmax
+
+    if text_paths:
+        # the labels live in the block definitions, convert them there once instead of per insert
+        text_to_paths(doc)
+        return
+
+    with MTextExplode(msp) as xpl:
+        for m in list(msp.query("MTEXT")):
+            xpl.explode(m)
+
+    for t in list(msp.query("TEXT")):
+        text2path.explode(t, target=msp)
+
+
+def dxf_extension(output_format: str = "ascii") -> str:
+    if output_format not in DXF_FORMATS:
+        raise ValueError(f"unknown DXF output format: {output_format!r}, expected one of {', '.join(DXF_FORMATS)}")
+    return DXF_FORMATS[output_format]
+
+
+def write_dxf(doc, target, output_format: str = "ascii"):
+    """Writes `doc` to a path or a binary file object, streamed through a large write buffer.
+
+    `output_format` is one of DXF_FORMATS: ASCII or binary DXF, or ASCII DXF compressed with gzip or zstd (the
+    latter needs the optional zstandard package).
+    """
+    dxf_extension(output_format)
+
+    if isinstance(target, (str, bytes)) or hasattr(target, "__fspath__"):
+        with open(target, "wb", buffering=DXF_WRITE_BUFFER) as stream:
+            # same line endings as doc.saveas
+            _write(doc, stream, output_format, newline=None)
+        return
+
+    # bytes go straight into the caller's file object, no str copy of the whole drawing
+    _write(doc, target, output_format, newline="")
+
+
+def _write(doc, stream, output_format: str, newline):
+    if output_format == "binary":
+        doc.write(stream, fmt="bin")
+    elif output_format == "gzip":
+        # no timestamp in the gzip header, the same drawing compresses to the same bytes
+        with gzip.GzipFile(filename="", mode="wb", fileobj=stream, compresslevel=DXF_GZIP_LEVEL, mtime=0) as packed:
+            _write_ascii(doc, packed, newline)
+    elif output_format == "zstd":
+        compressor = _zstandard().ZstdCompressor(level=DXF_ZSTD_LEVEL)
+        with compressor.stream_writer(stream, closefd=False) as packed:
+            _write_ascii(doc, packed, newline)
+    else:
+        _write_ascii(doc, stream, newline)
+
+
+def _write_ascii(doc, stream, newline):
+    text = io.TextIOWrapper(stream, encoding=doc.output_encoding, errors="dxfreplace", newline=newline)
+    try:
+        doc.write(text)
+        text.flush()
+    finally:
+        text.detach()
+
+
+def _zstandard():
+    try:
+        import zstandard
+    except ImportError as e:
+        raise ImportError("zstd DXF output needs the zstandard package") from e
+    return zstandard
@@ -0,0 +1,94 @@
+from dataclasses import dataclass
+
+FACADE_SIDES = ('F', 'R', 'L', 'B')
+FACADE_KINDS = ('inset', 'outset')
+
+# outsets on these sides shift where the walk around the building reaches the corner of a side
+_CUMULATIVE_SIDES = {
+    'F': ('R', 'L'),
+    'R': ('B',),
+    'B': ('L',),
+    'L': ('B', 'F'),
+}
+
+
+@dataclass(frozen=True, slots=True)
+class Facade:
+    kind: str
+    start: int
+    length: int
+    depth: int
+    side: str
+
+    @classmethod
+    def parse(cls, text: str) -> 'Facade':
+        values = [value.strip() for value in str(text).split(',')]
+        if len(values) == 4:
+            # inset/outset is optional on the command line
+            values.insert(0, 'inset')
+        if len(values) != 5:
+            raise ValueError(f'facade needs the fields [inset/outset,]start,length,depth,side: {text!r}')
+
+        kind = values[0].lower()
+        side = values[4].upper()
+        if kind not in FACADE_KINDS:
+            raise ValueError(f'facade kind must be inset or outset: {text!r}')
+        if side not in FACADE_SIDES:
+            raise ValueError(f'facade side must be one of {", ".join(FACADE_SIDES)}: {text!r}')
+
+        try:
+            start, length, depth = int(values[1]), int(values[2]), int(values[3])
+        except ValueError:
+            raise ValueError(f'facade start, length and depth must be integers: {text!r}') from None
+
+        return cls(kind, start, length, depth, side)
+
+
+@dataclass(frozen=True, slots=True)
+class FacadeSet:
+    sides: dict[str, tuple[Facade, ...]]
+    outset_totals: dict[str, int]
+    cumulative_outsets: dict[str, int]
+
+    @classmethod
+    def from_sides(cls, sides: dict[str, list[Facade]]) -> 'FacadeSet':
+        sides = {key: tuple(sides.get(key, ())) for key in FACADE_SIDES}
+        outset_totals = {key: sum(f.depth for f in items if f.kind == 'outset') for key, items in sides.items()}
+        cumulative_outsets = {key: sum(outset_totals[other] for other in others)
+                              for key, others in _CUMULATIVE_SIDES.items()}
+
+        return cls(sides, outset_totals, cumulative_outsets)
+
+    def __getitem__(self, key: str) -> tuple[Facade, ...]:
+        return self.sides[key]
+
+    def get(self, key: str, default=None):
+        return self.sides.get(key, default)
+
+    def length(self, key: str) -> int:
+        # the last definition of a side carries its total length
+        return self.sides[key][-1].length
+
+
+def build_facade_set(facades: list[str]) -> FacadeSet:
+    return facade_set_of([Facade.parse(facade) for facade in facades])
+
+
+def facade_set_of(parsed: list[Facade]) -> FacadeSet:
+    sides = {key: [f for f in parsed if f.side == key] for key in FACADE_SIDES}
+
+    # a missing side mirrors the length of its opposite side
+    for key, opposite in (('F', 'B'), ('B', 'F'), ('R', 'L'), ('L', 'R')):
+        if not sides[key] and sides[opposite]:
+            sides[key].append(Facade('inset', 0, sides[opposite][-1].length, 0, key))
+
+    return FacadeSet.from_sides(sides)
+
+
+def as_facade_set(facades) -> FacadeSet:
+    """Accepts a FacadeSet, a list of --facade strings or a dict of them per side."""
+    if isinstance(facades, FacadeSet):
+        return facades
+    if isinstance(facades, dict):
+        return FacadeSet.from_sides({key: [Facade.parse(item) for item in items] for key, items in facades.items()})
+    return build_facade_set(facades)
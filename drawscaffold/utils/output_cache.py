@@ -0,0 +1,167 @@
+import hashlib
+import json
+import os
+import shutil
+import time
+from functools import lru_cache
+from pathlib import Path
+
+import drawscaffold
+from drawscaffold import __version__
+from drawscaffold.utils.cache_dir import cache_dir
+
+# eviction policy, overridable per process through the environment
+OUTPUT_CACHE_MAX_MB = float(os.environ.get("DRAWSCAFFOLD_OUTPUT_CACHE_MAX_MB", 512))
+OUTPUT_CACHE_MAX_AGE_DAYS = float(os.environ.get("DRAWSCAFFOLD_OUTPUT_CACHE_MAX_AGE_DAYS", 30))
+
+_MANIFEST = "manifest.json"
+
+
+def _canonical(value):
+    # FacadeSet and friends hash by their fields, not their repr
+    if hasattr(value, "sides"):
+        return {side: [[f.kind, f.start, f.length, f.depth, f.side] for f in facades]
+                for side, facades in value.sides.items()}
+    raise TypeError(f"cannot hash {type(value).__name__} into an output key")
+
+
+@lru_cache(maxsize=1)
+def code_revision() -> str:
+    """Hash of the drawscaffold sources, so an edited layout or drawer does not hit drawings of the old code."""
+    digest = hashlib.sha256()
+    root = Path(drawscaffold.__file__).parent
+    for source in sorted(root.rglob("*.py")):
+        digest.update(source.relative_to(root).as_posix().encode("utf-8"))
+        digest.update(source.read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def _file_hash(path) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def output_key(drawer: str, **inputs) -> str:
+    """Hash of everything that shapes the drawings of one drawer call, and of the library code drawing them."""
+    payload = json.dumps({"drawer": drawer, "version": __version__, "revision": code_revision(), "inputs": inputs},
+                         sort_keys=True, separators=(",", ":"), default=_canonical)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class OutputCache:
+    """Drawings already exported, one directory per output key holding a copy of every artifact.
+
+    Entries older than `max_age_days` since their last use are dropped, then the least recently used ones until the
+    cache fits in `max_mb`.
+    """
+
+    def __init__(self, root=None, max_mb: float = OUTPUT_CACHE_MAX_MB, max_age_days: float = OUTPUT_CACHE_MAX_AGE_DAYS):
+        self.root = root if root is not None else cache_dir("outputs")
+        self.max_bytes = max_mb * (1 << 20)
+        self.max_age = max_age_days * 86400
+
+    def restore(self, key: str, outputs, paths: dict[str, str], reuse_paths: bool = False) -> bool:
+        """Hands the cached artifacts of `key` to `outputs`, False when there are none for every one of `paths`.
+
+        Written out to `paths`, or with `reuse_paths` to the files the entry was last written to while they sit in
+        the directories of `paths` and still hold the cached content, so timestamped names do not pile up copies of
+        the same drawing. Files another directory owns are never handed out.
+        """
+        entry = self.root / key
+        try:
+            manifest = json.loads((entry / _MANIFEST).read_text(encoding="utf-8"))
+            files = {kind: entry / name for kind, name in manifest["files"].items()}
+            if set(files) != set(paths):
+                return False
+
+            if outputs.return_bytes:
+                for kind in paths:
+                    outputs.data[kind] = files[kind].read_bytes()
+            else:
+                last = manifest.get("paths") or {}
+                hashes = manifest["hashes"]
+                if reuse_paths and set(last) == set(paths) and all(
+                        os.path.dirname(last[kind]) == os.path.dirname(paths[kind])
+                        and os.path.isfile(last[kind]) and os.path.getsize(last[kind]) == files[kind].stat().st_size
+                        and _file_hash(last[kind]) == hashes[kind]
+                        for kind in paths):
+                    paths = last
+                else:
+                    for kind, path in paths.items():
+                        shutil.copyfile(files[kind], path)
+                    manifest["paths"] = paths
+                    (entry / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+
+                for kind in paths:
+                    outputs.files[kind] = paths[kind]
+
+            os.utime(entry / _MANIFEST) # last use, for the eviction
+        except (OSError, ValueError, KeyError):
+            return False
+        return True
+
+    def store(self, key: str, outputs):
+        """Keeps a copy of what `outputs` exported under `key`."""
+        entry = self.root / key
+        tmp_entry = self.root / f"{key}.{os.getpid()}.tmp"
+        try:
+            tmp_entry.mkdir(parents=True, exist_ok=True)
+            files = {}
+            if outputs.return_bytes:
+                for kind, data in outputs.data.items():
+                    files[kind] = kind
+                    (tmp_entry / kind).write_bytes(data)
+            else:
+                for kind, path in outputs.files.items():
+                    files[kind] = kind
+                    shutil.copyfile(path, tmp_entry / kind)
+            hashes = {kind: _file_hash(tmp_entry / name) for kind, name in files.items()}
+
+            manifest = {"files": files, "hashes": hashes,
+                        "paths": None if outputs.return_bytes else dict(outputs.files)}
+            (tmp_entry / _MANIFEST).write_text(json.dumps(manifest), encoding="utf-8")
+
+            shutil.rmtree(entry, ignore_errors=True)
+            os.replace(tmp_entry, entry)
+        except OSError:
+            pass # a read only cache only costs the rendering
+        finally:
+            shutil.rmtree(tmp_entry, ignore_errors=True)
+
+        self.evict()
+
+    def evict(self):
+        entries = []
+        now = time.time()
+        try:
+            for entry in self.root.iterdir():
+                manifest = entry / _MANIFEST
+                if not manifest.is_file():
+                    continue
+                used = manifest.stat().st_mtime
+                if now - used > self.max_age:
+                    shutil.rmtree(entry, ignore_errors=True)
+                    continue
+                entries.append((used, sum(f.stat().st_size for f in entry.iterdir()), entry))
+        except OSError:
+            return
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, entry in sorted(entries, key=lambda item: item[0]):
+            if total <= self.max_bytes:
+                break
+            shutil.rmtree(entry, ignore_errors=True)
+            total -= size
+
+
+def output_cache(enabled: bool = True) -> OutputCache | None:
+    """The on-disk output cache, None when it is turned off or cannot be created."""
+    if not enabled:
+        return None
+    try:
+        return OutputCache()
+    except OSError:
+        return None
@@ -0,0 +1,37 @@
+from typing import NamedTuple
+
+MM_PER_INCH = 25.4
+
+
+class PreviewProfile(NamedTuple):
+    """How the JPEG thumbnail of a drawing is rasterized."""
+    dpi: int
+    max_px: int | None = None   # longest side of the thumbnail, the page is rasterized at this size directly
+    quality: int = 75           # JPEG quality, 75 is the Pillow default
+
+
+PREVIEW_PROFILES = {
+    "full": PreviewProfile(300),
+    "screen": PreviewProfile(150, quality=85),
+    "draft": PreviewProfile(72, quality=70),
+    "web": PreviewProfile(72, max_px=400, quality=80),
+}
+DEFAULT_PREVIEW = "full"
+
+
+def preview_profile(preview: str | PreviewProfile = DEFAULT_PREVIEW) -> PreviewProfile:
+    if isinstance(preview, PreviewProfile):
+        return preview
+    if isinstance(preview, (tuple, list)):
+        return PreviewProfile(*preview)
+    if preview not in PREVIEW_PROFILES:
+        raise ValueError(f"unknown preview profile: {preview!r}, expected one of {', '.join(PREVIEW_PROFILES)}")
+    return PREVIEW_PROFILES[preview]
+
+
+def raster_size(width_mm: float, height_mm: float, dpi: int, max_px: int | None = None) -> tuple[int, int]:
+    """Pixel size of a page rasterized at `dpi`, scaled down so its longest side is at most `max_px`."""
+    scale = dpi / MM_PER_INCH
+    if max_px is not None:
+        scale = min(scale, max_px / max(width_mm, height_mm))
+    return max(1, round(width_mm * scale)), max(1, round(height_mm * scale))
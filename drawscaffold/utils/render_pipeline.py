@@ -0,0 +1,146 @@
+import io
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from ezdxf.addons.drawing import RenderContext, Frontend, layout
+from ezdxf.addons.drawing.config import ColorPolicy
+from ezdxf.addons.drawing.pipeline import apply_color_policy
+from ezdxf.addons.drawing.properties import BackendProperties
+from ezdxf.addons.drawing.recorder import Recorder, Override
+from ezdxf.addons.drawing.svg import SVGBackend
+
+from drawscaffold.utils.dxf_export import write_dxf
+from drawscaffold.utils.preview import DEFAULT_PREVIEW, PreviewProfile, preview_profile, raster_size
+
+# order the drawers hand back their outputs in
+OUTPUT_KINDS = ("png", "svg", "dxf", "jpg")
+
+
+def _swap_bw(properties: BackendProperties) -> Override:
+    # same mapping the frontend applies for ColorPolicy.COLOR_SWAP_BW
+    color = apply_color_policy(properties.color, ColorPolicy.COLOR_SWAP_BW, properties.color)
+    return Override(properties._replace(color=color))
+
+
+class RenderPipeline:
+    """Walks the modelspace once and derives every raster/vector output from that recording."""
+
+    def __init__(self, doc, msp):
+        recorder = Recorder()
+        Frontend(RenderContext(doc), recorder).draw_layout(msp, finalize=True)
+
+        self._player = recorder.player()
+        self._page = layout.Page(210, 297, layout.Units.mm, margins=layout.Margins.all(20))
+        self._svg_strings = {}
+        self._png_bytes = {}
+        # the exports run on threads, each output is made once while the others wait for it
+        self._locks = {}
+        self._locks_lock = threading.Lock()
+
+    def _once(self, cache: dict, key, make):
+        with self._locks_lock:
+            lock = self._locks.setdefault((id(cache), key), threading.Lock())
+        with lock:
+            if key not in cache:
+                cache[key] = make()
+        return cache[key]
+
+    def svg_string(self, color_swap: bool = False) -> str:
+        def make():
+            backend = SVGBackend()
+            # the svg backend transforms the replayed paths inplace, keep the recording intact
+            self._player.copy().replay(backend, override=_swap_bw if color_swap else None)
+            return backend.get_string(self._page)
+
+        return self._once(self._svg_strings, color_swap, make)
+
+    def svg_bytes(self, color_swap: bool = False) -> bytes:
+        return self.svg_string(color_swap).encode("utf-8")
+
+    def png_bytes(self, dpi: int = 300, max_px: int | None = None) -> bytes:
+        def make():
+            import cairosvg
+
+            if max_px is None:
+                return cairosvg.svg2png(bytestring=self.svg_bytes(), dpi=dpi)
+
+            # rasterized at the target size, not downscaled from a full size render
+            width, height = raster_size(self._page.width_in_mm, self._page.height_in_mm, dpi, max_px)
+            return cairosvg.svg2png(bytestring=self.svg_bytes(), dpi=dpi, output_width=width, output_height=height)
+
+        return self._once(self._png_bytes, (dpi, max_px), make)
+
+    def jpg_bytes(self, dpi: int = 300, max_px: int | None = None, quality: int = 75) -> bytes:
+        from PIL import Image
+
+        with Image.open(io.BytesIO(self.png_bytes(dpi, max_px))) as png_image:
+            rgb_im = png_image.convert("RGB")
+
+        buffer = io.BytesIO()
+        rgb_im.save(buffer, format="JPEG", quality=quality)
+        return buffer.getvalue()
+
+    def thumbnail_bytes(self, preview: str | PreviewProfile = DEFAULT_PREVIEW) -> bytes:
+        profile = preview_profile(preview)
+        return self.jpg_bytes(profile.dpi, profile.max_px, profile.quality)
+
+
+class OutputCollector:
+    """Writes exported artifacts to their paths or keeps the bytes for the caller."""
+
+    def __init__(self, return_bytes: bool = False):
+        self.return_bytes = return_bytes
+        self.files = {} # kind -> path written
+        self.data = {}
+
+    def add(self, key: str, path: str, data: bytes):
+        if self.return_bytes:
+            self.data[key] = data
+            return
+
+        with open(path, "wb") as f:
+            f.write(data)
+        self.files[key] = path
+
+    def add_dxf(self, path: str, doc, output_format: str = "ascii"):
+        if self.return_bytes:
+            buffer = io.BytesIO()
+            write_dxf(doc, buffer, output_format)
+            self.data["dxf"] = buffer.getvalue()
+            return
+
+        write_dxf(doc, path, output_format)
+        self.files["dxf"] = path
+
+    def result(self):
+        # the exports finish in any order, the caller gets them in OUTPUT_KINDS order
+        if self.return_bytes:
+            return {kind: self.data[kind] for kind in OUTPUT_KINDS if kind in self.data}
+        return [self.files[kind] for kind in OUTPUT_KINDS if kind in self.files]
+
+
+def run_exports(exports: dict, d=None):
+    """Runs the export callables of `exports` (kind -> callable) side by side on a thread pool.
+
+    The recording is shared, so the raster, svg and dxf outputs only wait on what they are made from. With a
+    DebugPrinter `d` the time of every export and when it was ready after the start are printed.
+    """
+    start = time.perf_counter()
+
+    def timed(kind, export):
+        began = time.perf_counter()
+        export()
+        done = time.perf_counter()
+        return kind, done - began, done - start
+
+    with ThreadPoolExecutor(max_workers=max(1, len(exports))) as pool:
+        futures = [pool.submit(timed, kind, export) for kind, export in exports.items()]
+        # printed here as they finish, the worker threads would interleave their lines
+        for future in as_completed(futures):
+            kind, elapsed, ready = future.result()
+            if d is not None:
+                d.print(f"export {kind}: {elapsed * 1000:.1f} ms, ready after {ready * 1000:.1f} ms")
+
+    if d is not None:
+        d.print(f"export total: {(time.perf_counter() - start) * 1000:.1f} ms")
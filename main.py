@@ -3,7 +3,7 @@ import json
 
 from drawscaffold.calculate import material_calculator2D
 from drawscaffold.calculator.price_calculator import calculate_price
-from drawscaffold.drawer import two_d_drawer
+from drawscaffold.utils.preview import DEFAULT_PREVIEW, PREVIEW_PROFILES
 
 parser = argparse.ArgumentParser(description='Draw scaffolds professionally')
 parser.add_argument("--verbose", action="store_true", help="gives outputs for debug")
@@ -23,6 +23,11 @@ pattern_group.add_argument("--best-pattern", action="store_true", help="choose b
 parser.add_argument("--image", action="store_true", help="get the drawing and image of it")
 parser.add_argument("--svg", action="store_true", help="get the drawing and svg of it")
 parser.add_argument("--dxf", action="store_true", help="get the drawing and dxf of it")
+parser.add_argument("--dxf-text-paths", action="store_true", help="convert the dxf labels to outlines once per block")
+parser.add_argument("--dxf-format", choices=["ascii", "binary", "gzip", "zstd"], default="ascii", help="dxf file format, gzip and zstd compress the ascii dxf")
+parser.add_argument("--no-cache", action="store_true", help="render the drawings even if the same ones are in the output cache")
+parser.add_argument("--image-dpi", type=int, default=300, help="resolution of the png image")
+parser.add_argument("--preview", choices=list(PREVIEW_PROFILES), default=DEFAULT_PREVIEW, help="thumbnail profile: full (300 dpi), screen (150 dpi), draft (72 dpi) or web (400 px)")
 
 parser.add_argument("--calculate", action="store_true", help="calculate the material count for the scaffold")
 parser.add_argument("--calculate-price", action="store_true", help="calculate the material rent price for scaffold")
@@ -63,8 +68,13 @@ elif args.calculate_price:
         price, currency, symbol = ans
         print(json.dumps({"price": price, "currency": currency, "symbol": symbol}))
 else:
+    # the drawer brings in ezdxf, cairosvg and Pillow; only load them when drawing
+    from drawscaffold.drawer import two_d_drawer
+
     paths = two_d_drawer(verbose=args.verbose, h=args.height_in_cm, w=args.width_in_cm, slope=args.surface_slope,
                      toe_text=toeText, r_diagonal=args.start_with_right_diagonal, surface_line=args.draw_surface_line,
                      biggest_surface_line=args.biggest_surface_line, use_x_pattern=args.use_x_pattern, use_zigzag_pattern=args.use_zigzag_pattern,
-                     use_best_pattern=args.best_pattern, image=args.image, svg=args.svg, dxf=args.dxf, project_name=args.project_name)
+                     use_best_pattern=args.best_pattern, image=args.image, svg=args.svg, dxf=args.dxf, project_name=args.project_name,
+                     dxf_text_paths=args.dxf_text_paths, dxf_format=args.dxf_format,
+                     use_cache=not args.no_cache, image_dpi=args.image_dpi, preview=args.preview)
     print(json.dumps({"paths": paths}))
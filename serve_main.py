@@ -0,0 +1,20 @@
+import argparse
+
+from drawscaffold.service import serve_http, serve_stdio, warm_up
+from drawscaffold.utils.debug_printer import DebugPrinter
+
+parser = argparse.ArgumentParser(description='Serve scaffold calculations and drawings from a warm process')
+parser.add_argument("--http", type=int, default=None, help="listen on this local port instead of stdin/stdout JSON lines")
+parser.add_argument("--host", type=str, default="127.0.0.1", help="address for the http server")
+parser.add_argument("--no-warm-up", action="store_true", help="skip preloading ezdxf, the drawers and font metrics")
+parser.add_argument("--verbose", action="store_true", help="gives outputs for debug (on stderr for stdio mode)")
+
+args = parser.parse_args()
+
+if not args.no_warm_up:
+    warm_up()
+
+if args.http is not None:
+    serve_http(args.host, args.http, DebugPrinter(args.verbose))
+else:
+    serve_stdio(d=DebugPrinter(args.verbose))
@@ -0,0 +1,38 @@
+import io
+import json
+
+from drawscaffold.batch import run_batch
+from drawscaffold.calculate_top_down import top_down_calc
+from drawscaffold.calculator.price_calculator import calculate_price
+from drawscaffold.utils.facades import build_facade_set
+
+FACADES = ['inset,300,2000,250,F', 'outset,700,2000,250,F', 'outset,350,1200,400,R', 'inset,600,1200,400,R']
+
+
+def test_batch_streams_one_result_per_job_and_isolates_failures():
+    jobs = [
+        {"id": "a", "facades": FACADES, "height_in_cm": 2000, "surface_slope": 12, "use_zigzag_pattern": True},
+        {"id": "b", "facades": FACADES, "surface_slope": 12},
+        {"id": "c", "facades": FACADES[:2], "height_in_cm": 900, "surface_slope": 0, "calculate_price": False},
+    ]
+    lines = [json.dumps(job) + "\n" for job in jobs] + ["\n", "not json\n"]
+    out = io.StringIO()
+
+    failed = run_batch(lines, out, workers=2)
+
+    results = {r["id"]: r for r in map(json.loads, out.getvalue().splitlines())}
+    assert failed == 2
+    assert set(results) == {"a", "b", "c", None}
+
+    materials = top_down_calc(False, build_facade_set(FACADES), 2000, 12, False, False, True)
+    price, currency, symbol = calculate_price(materials)
+    assert results["a"]["ok"]
+    assert results["a"]["materials"] == materials
+    assert results["a"]["price"] == {"price": price, "currency": currency, "symbol": symbol}
+
+    assert results["b"]["ok"] is False
+    assert "height_in_cm" in results["b"]["error"]
+
+    assert results["c"]["ok"]
+    assert "price" not in results["c"]
+    assert results[None]["line"] == 5
@@ -0,0 +1,47 @@
+from drawscaffold.utils.bay_packing import BayPacking, pack_bays
+
+
+def _divided(length, close_leftover=None):
+    big, small, leftover = length // 250, (length % 250) // 150, (length % 250) % 150
+    overshoot = 0
+    if close_leftover and leftover and close_leftover[0] <= leftover <= close_leftover[1]:
+        small, overshoot = small + 1, 150 - leftover
+    return BayPacking(big, small, leftover, overshoot)
+
+
+def test_exact_mix_replaces_a_closing_bay():
+    # 250 + a closing 150 runs 100 past 300, two 150 bays end on it
+    assert pack_bays(300, close_leftover=(1, 80)) == BayPacking(0, 2, 0, 0)
+    assert pack_bays(550, close_leftover=(1, 80)) == BayPacking(1, 2, 0, 0)
+
+
+def test_closed_runs_are_not_left_barer():
+    # the fewest bays would stop 101 and 130 cm short, the division closes both runs
+    assert pack_bays(251, close_leftover=(1, 80)) == BayPacking(1, 1, 1, 149)
+    assert pack_bays(530, close_leftover=(1, 80)) == BayPacking(2, 1, 30, 120)
+
+
+def test_open_runs_keep_the_division():
+    # depth and outset runs move every later corner with them
+    assert pack_bays(560) == BayPacking(2, 0, 60, 0)
+    for length in range(-400, 6000):
+        assert pack_bays(length) == _divided(length)
+
+
+def test_never_worse_than_dividing():
+    for close_leftover in ((1, 80), (20, 150)):
+        for length in range(0, 6000):
+            packing = pack_bays(length, close_leftover)
+            divided = _divided(length, close_leftover)
+
+            covered = length + packing.overshoot if packing.overshoot else length - packing.leftover
+            assert 250 * packing.big + 150 * packing.small == covered
+            assert packing.leftover < 150
+            assert packing.uncovered <= divided.uncovered
+            if packing.uncovered == divided.uncovered:
+                assert (packing.count, packing.overshoot) <= (divided.count, divided.overshoot)
+
+
+def test_negative_runs_keep_the_division():
+    for length in (-340, -100, -1):
+        assert pack_bays(length, close_leftover=(1, 80)) == _divided(length, (1, 80))
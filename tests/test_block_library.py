@@ -0,0 +1,101 @@
+import ezdxf
+
+from drawscaffold.shapes.block_library import BlockCache, BlockLibrary
+from drawscaffold.shapes.shapes_2d import Drawer2D
+
+
+def _build_sign(calls):
+    def build(blk):
+        calls.append(blk.name)
+        blk.add_lwpolyline([(0, 0), (10, 0), (10, 5)], close=True)
+        if "BOLD_ARIAL" not in blk.doc.styles:
+            style = blk.doc.styles.new("BOLD_ARIAL", dxfattribs={"font": "arialbd.ttf"})
+            style.dxf.oblique = 25
+        m = blk.add_mtext("250cm")
+        m.dxf.style = "BOLD_ARIAL"
+    return build
+
+
+def test_blocks_are_built_once_per_process():
+    library = BlockLibrary()
+    calls = []
+
+    docs = [ezdxf.new("R2018") for _ in range(3)]
+    for doc in docs:
+        cache = BlockCache(doc, library)
+        cache.ensure("SIGN_250cm", _build_sign(calls))
+        cache.ensure("SIGN_250cm", _build_sign(calls))
+
+    assert calls == ["SIGN_250cm"]
+    for doc in docs:
+        blk = doc.blocks.get("SIGN_250cm")
+        assert [e.dxftype() for e in blk] == ["LWPOLYLINE", "MTEXT"]
+        # the text style lives in the template document and is carried over
+        assert doc.styles.get("BOLD_ARIAL").dxf.oblique == 25
+        assert not doc.audit().has_errors
+
+
+def test_template_file_replaces_the_builders(tmp_path):
+    source = ezdxf.new("R2018")
+    source.layers.add("LOCKS", color=3)
+    lock = source.blocks.new("LOCK_STD")
+    lock.add_circle((0, 0), 2, dxfattribs={"layer": "LOCKS"})
+    foot = source.blocks.new("FOOT_STD")
+    foot.add_line((0, 0), (0, 10))
+    foot.add_blockref("LOCK_STD", (0, 10))
+    path = tmp_path / "templates.dxf"
+    source.saveas(path)
+
+    library = BlockLibrary(str(path))
+    calls = []
+    doc = ezdxf.new("R2018")
+    BlockCache(doc, library).ensure("FOOT_STD", _build_sign(calls))
+
+    assert calls == []
+    assert [e.dxftype() for e in doc.blocks.get("FOOT_STD")] == ["LINE", "INSERT"]
+    assert [e.dxftype() for e in doc.blocks.get("LOCK_STD")] == ["CIRCLE"]
+    assert doc.layers.get("LOCKS").dxf.color == 3
+    assert not doc.audit().has_errors
+
+
+def test_nested_anonymous_blocks_are_copied(tmp_path):
+    source = ezdxf.new("R2018")
+    arrow = source.blocks.new_anonymous_block()
+    arrow.add_line((0, 0), (5, 5))
+    sign = source.blocks.new("SIGN_STD")
+    sign.add_blockref(arrow.name, (0, 0))
+    path = tmp_path / "templates.dxf"
+    source.saveas(path)
+
+    library = BlockLibrary(str(path))
+    doc = ezdxf.new("R2018")
+    taken = doc.blocks.new_anonymous_block()
+    BlockCache(doc, library).ensure("SIGN_STD", _build_sign([]))
+
+    name = doc.blocks.get("SIGN_STD").query("INSERT")[0].dxf.name
+    assert name.startswith("*U") and name != taken.name
+    assert [e.dxftype() for e in doc.blocks.get(name)] == ["LINE"]
+    assert not doc.audit().has_errors
+
+
+def test_built_templates_are_capped():
+    library = BlockLibrary(max_built=2)
+    calls = []
+    for text in ("100cm", "150cm", "100cm", "250cm", "100cm", "150cm"):
+        library.clone_into(ezdxf.new("R2018"), f"SIGN_{text}", _build_sign(calls))
+
+    # 150cm was the least recently used when 250cm came in
+    assert calls == ["SIGN_100cm", "SIGN_150cm", "SIGN_250cm", "SIGN_150cm"]
+    assert "SIGN_250cm" not in library._doc.blocks
+
+
+def test_sign_blocks_are_named_after_their_font_and_spacing():
+    signs = []
+    for font_name, line_spacing in (("Arial", 1.2), ("DejaVu Sans", 1.2), ("Arial", 1.5)):
+        doc = ezdxf.new("R2018")
+        Drawer2D(doc.modelspace(), doc).draw_sign((0, 0), "250cm", font_name=font_name, line_spacing=line_spacing)
+        insert = doc.modelspace().query("INSERT")[0]
+        mtext = doc.blocks.get(insert.dxf.name).query("MTEXT")[0]
+        signs.append((insert.dxf.name, mtext.dxf.line_spacing_factor))
+
+    assert signs == [("SIGN_250cm", 1.2), ("SIGN_250cm@DejaVu Sans@1.2", 1.2), ("SIGN_250cm@Arial@1.5", 1.5)]
@@ -0,0 +1,57 @@
+import math
+import random
+
+from drawscaffold.const.conts import DIAGONAL_PART, VERTICAL_PART
+from drawscaffold.diagonal.column_index import ColumnIndex
+
+
+def _brute_force(col, from_pt, distance, min_idx, min_dy, min_angle_deg):
+    best_j, best_err = None, float('inf')
+    for j, (x, y) in enumerate(col):
+        dy = y - from_pt[1]
+        if j <= min_idx or dy < 0 or dy < min_dy:
+            continue
+        if math.degrees(math.atan2(dy, abs(x - from_pt[0]))) < min_angle_deg:
+            continue
+        err = abs(math.hypot(x - from_pt[0], dy) - distance)
+        if err < best_err:
+            best_err, best_j = err, j
+    return best_j
+
+
+def test_top_row_is_dropped():
+    index = ColumnIndex([[(0, 0), (0, 180), (0, 360)], []], drop_top=True)
+
+    assert index[0] == [(0, 0), (0, 180)]
+    assert index[1] == []
+    assert index.nearest_at_distance(1, (0, 0), DIAGONAL_PART) is None
+
+
+def test_bisection_matches_a_full_scan():
+    rng = random.Random(3)
+
+    for _ in range(300):
+        base = rng.uniform(-100, 100)
+        col = [(250.0, base + i * (VERTICAL_PART - 20) + rng.choice([0, 0, 7])) for i in range(rng.randint(1, 40))]
+        col.sort(key=lambda p: p[1])
+        index = ColumnIndex([col])
+
+        from_pt = (0.0, rng.uniform(-200, col[-1][1]))
+        min_idx = rng.randint(-1, len(col) - 1)
+        min_dy = 0.7 * VERTICAL_PART
+
+        expected = _brute_force(col, from_pt, DIAGONAL_PART, min_idx, min_dy, 20)
+        assert index.nearest_at_distance(0, from_pt, DIAGONAL_PART, min_idx=min_idx, min_dy=min_dy,
+                                         min_angle_deg=20) == expected
+
+
+def test_distance_band_matches_a_full_scan():
+    rng = random.Random(4)
+
+    for _ in range(300):
+        col = sorted(((250.0, rng.uniform(-500, 3000)) for _ in range(rng.randint(1, 30))), key=lambda p: p[1])
+        from_pt = (0.0, rng.uniform(-500, 3000))
+        tolerance = rng.choice([5.0, 10.0, 300.0])
+
+        expected = [p for p in col if abs(math.hypot(p[0] - from_pt[0], p[1] - from_pt[1]) - DIAGONAL_PART) < tolerance]
+        assert ColumnIndex([col]).within_distance(0, from_pt, DIAGONAL_PART, tolerance) == expected
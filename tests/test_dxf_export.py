@@ -0,0 +1,97 @@
+import gzip
+import io
+import re
+
+import ezdxf
+import pytest
+
+from drawscaffold.utils import dxf_export
+from drawscaffold.utils.dxf_export import text_to_paths, write_dxf
+
+
+def _labelled_doc():
+    doc = ezdxf.new("R2018")
+    blk = doc.blocks.new("SIGN_250cm")
+    blk.add_lwpolyline([(0, 0), (10, 0), (10, 5)], close=True)
+    blk.add_mtext("250cm")
+    blk.add_text("A")
+    for x in range(3):
+        doc.modelspace().add_blockref("SIGN_250cm", (x * 20, 0))
+    return doc
+
+
+def test_block_text_becomes_outlines():
+    doc = _labelled_doc()
+
+    assert text_to_paths(doc) == 2
+
+    blk = doc.blocks.get("SIGN_250cm")
+    assert not blk.query("MTEXT TEXT")
+    assert blk.query("HATCH")
+    assert len(doc.modelspace().query("INSERT")) == 3
+    assert not [b for b in doc.blocks if b.name.startswith("*U")]
+
+
+def test_outlines_are_kept_between_documents():
+    text_to_paths(_labelled_doc())
+    cached = dict(dxf_export._outlines)
+
+    doc = _labelled_doc()
+    text_to_paths(doc)
+
+    assert dxf_export._outlines == cached
+    assert doc.blocks.get("SIGN_250cm").query("HATCH")
+
+
+def _body(data: bytes) -> list[bytes]:
+    # every write stamps a fresh GUID and save time
+    lines = data.splitlines()
+    skip = set()
+    for i, line in enumerate(lines):
+        if line.strip() in (b"$FINGERPRINTGUID", b"$VERSIONGUID", b"$TDUPDATE", b"$TDUUPDATE"):
+            skip.add(i + 2)
+        elif re.search(rb"\d{4}-\d\d-\d\dT\d\d:", line):
+            skip.add(i)
+    return [line for i, line in enumerate(lines) if i not in skip]
+
+
+def test_streamed_bytes_match_saveas(tmp_path):
+    doc = _labelled_doc()
+
+    doc.saveas(tmp_path / "saved.dxf")
+    write_dxf(doc, tmp_path / "streamed.dxf")
+    buffer = io.BytesIO()
+    write_dxf(doc, buffer)
+
+    saved = _body((tmp_path / "saved.dxf").read_bytes())
+    assert _body((tmp_path / "streamed.dxf").read_bytes()) == saved
+    assert _body(buffer.getvalue()) == saved
+    assert not buffer.closed
+
+
+def test_binary_and_compressed_formats(tmp_path):
+    doc = _labelled_doc()
+    write_dxf(doc, tmp_path / "plain.dxf")
+    plain = _body((tmp_path / "plain.dxf").read_bytes())
+
+    write_dxf(doc, tmp_path / "binary.dxf", "binary")
+    assert (tmp_path / "binary.dxf").read_bytes().startswith(b"AutoCAD Binary DXF")
+    assert len(ezdxf.readfile(tmp_path / "binary.dxf").blocks.get("SIGN_250cm")) == 3
+
+    write_dxf(doc, tmp_path / "packed.dxf.gz", "gzip")
+    assert _body(gzip.decompress((tmp_path / "packed.dxf.gz").read_bytes())) == plain
+
+
+def test_unknown_format_is_rejected():
+    with pytest.raises(ValueError):
+        write_dxf(_labelled_doc(), io.BytesIO(), "dwg")
+
+
+def test_outline_cache_is_bounded(monkeypatch):
+    monkeypatch.setattr(dxf_export, "DXF_OUTLINE_CACHE_SIZE", 1)
+    monkeypatch.setattr(dxf_export, "_outlines", type(dxf_export._outlines)())
+
+    assert text_to_paths(_labelled_doc()) == 2
+
+    assert len(dxf_export._outlines) == 1
+    assert next(iter(dxf_export._outlines))[:2] == ("TEXT", "A")
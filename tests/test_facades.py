@@ -0,0 +1,32 @@
+import pytest
+
+from drawscaffold.utils.facades import Facade, FacadeSet, as_facade_set, build_facade_set
+
+FACADES = ['inset,300,2000,250,F', 'outset,700,2000,250,F', 'outset,350,1200,400,R', 'inset,600,1200,400,R',
+           'outset,600,1200,500,L']
+
+
+def test_parse_facade():
+    assert Facade.parse(' Outset, 700,2000 ,250,f') == Facade('outset', 700, 2000, 250, 'F')
+    assert Facade.parse('300,2000,250,B') == Facade('inset', 300, 2000, 250, 'B')
+
+
+@pytest.mark.parametrize('text', ['inset,300,2000,F', 'inset,300,2000,250,X', 'bulge,300,2000,250,F', 'inset,a,2000,250,F'])
+def test_invalid_facades_are_rejected(text):
+    with pytest.raises(ValueError):
+        Facade.parse(text)
+
+
+def test_facade_set_mirrors_missing_sides_and_sums_outsets():
+    facades = build_facade_set(FACADES)
+
+    assert facades['B'] == (Facade('inset', 0, 2000, 0, 'B'),)
+    assert facades.length('R') == 1200
+    assert facades.outset_totals == {'F': 250, 'R': 400, 'L': 500, 'B': 0}
+    assert facades.cumulative_outsets == {'F': 900, 'R': 0, 'B': 500, 'L': 250}
+
+
+def test_facade_dict_and_list_give_the_same_set():
+    per_side = {'F': FACADES[:2], 'R': FACADES[2:4], 'L': FACADES[4:], 'B': ['inset,0,2000,0,B']}
+    assert as_facade_set(per_side) == build_facade_set(FACADES)
+    assert isinstance(as_facade_set(FACADES), FacadeSet)
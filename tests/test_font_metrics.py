@@ -0,0 +1,68 @@
+import io
+import math
+from types import SimpleNamespace
+
+import pytest
+from ezdxf.addons import text2path
+from ezdxf.fonts import fonts
+
+from drawscaffold.shapes import font_metrics
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("DRAWSCAFFOLD_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(font_metrics, "_metrics", dict())
+    return tmp_path
+
+
+def _rendered_width(text, char_height, font_name="Arial"):
+    paths = text2path.make_paths_from_str(text, fonts.FontFace(family=font_name), size=char_height)
+    xs = [v.x for path in paths for v in path.control_vertices()]
+    return max(xs) - min(xs)
+
+
+@pytest.mark.parametrize("text", ["250cm", "a b", "İSKELE", "Toe Board 15cm", "L=1.09m"])
+def test_width_matches_rendered_paths(text):
+    expected = _rendered_width(text, 12)
+    assert math.isfinite(expected)
+    assert font_metrics.measure_text_width(text, 12) == pytest.approx(expected, rel=1e-9, abs=1e-9)
+
+
+def test_blank_text_has_no_width():
+    assert font_metrics.measure_text_width("", 10) == 0.0
+    assert font_metrics.measure_text_width("   ", 10) == 0.0
+
+
+def test_metrics_reload_from_disk(isolated_cache):
+    width = font_metrics.measure_text_width("Ω250", 10)
+
+    files = list((isolated_cache / "font_metrics").glob("*.json"))
+    assert len(files) == 1
+
+    font_metrics._metrics.clear()
+    metrics = font_metrics.get_font_metrics()
+    assert "Ω" in metrics.glyphs
+    assert metrics.text_width("Ω250", 10) == width
+
+
+def test_new_glyphs_are_saved_once_per_measurement(monkeypatch):
+    metrics = font_metrics.get_font_metrics()
+    saves = []
+    monkeypatch.setattr(metrics, "_save", lambda: saves.append(1) or setattr(metrics, "_dirty", False))
+
+    metrics.text_width("ΩΨΦ→", 10)
+    assert len(saves) == 1
+
+    metrics.text_width("ΩΨΦ→", 10)
+    assert len(saves) == 1
+
+
+def test_replaced_font_file_gets_its_own_metrics(monkeypatch):
+    path = font_metrics.get_font_metrics().path
+    assert font_metrics._font_key("Arial") == path.stem
+
+    replaced = SimpleNamespace(reader=SimpleNamespace(file=io.BytesIO(b"another font file")))
+    monkeypatch.setattr(fonts.font_manager, "get_ttf_font", lambda *args: replaced)
+
+    assert font_metrics._font_key("Arial") != path.stem
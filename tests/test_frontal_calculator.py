@@ -0,0 +1,52 @@
+import random
+
+import pytest
+
+from drawscaffold.calculate_top_down import MaterialCounterTopDown, clear_segment_cache, frontal_calculator2D, \
+    segment_cache_info, top_down_calc
+from drawscaffold.calculator.calculator_top_down import CalculatorTopDown
+from drawscaffold.utils.debug_printer import DebugPrinter
+from drawscaffold.utils.facades import build_facade_set
+
+
+def _count(length_list, h, slope, toe_board, use_zigzag_pattern, analytic, seed_materials):
+    material_counter = MaterialCounterTopDown()
+    for name in seed_materials:
+        material_counter.material_add(name)
+
+    frontal_calculator2D(length_list, h, slope, toe_board, False, use_zigzag_pattern,
+                         material_counter, CalculatorTopDown(), DebugPrinter(False), analytic=analytic)
+    return list(material_counter.counter_dict.items())
+
+
+@pytest.mark.parametrize('seed', range(5))
+def test_analytic_counting_matches_the_floor_walk(seed):
+    rnd = random.Random(seed)
+
+    for _ in range(60):
+        length_list = [rnd.choice([150, 250]) for _ in range(rnd.randint(0, 40))]
+        h = rnd.choice([0, 150, 250, 600, 900, 2000, rnd.uniform(0, 6000)])
+        slope = rnd.choice([0, 0, 3, 12, -8])
+        seed_materials = rnd.sample(['PLATFORM_150', 'tie', 'vert_220cm', 'FOOT_STD'], rnd.randint(0, 2))
+        args = (length_list, h, slope, rnd.random() < 0.5, rnd.random() < 0.5)
+
+        assert _count(*args, True, seed_materials) == _count(*args, False, seed_materials)
+
+
+def test_segment_cache_merges_the_same_counts(capsys):
+    facades = build_facade_set(['inset,0,2000,0,F', 'inset,0,1200,0,R'])
+    clear_segment_cache()
+
+    cached = top_down_calc(False, facades, 2000, 0, True, False, True)
+    first = segment_cache_info()
+    assert top_down_calc(False, facades, 2000, 0, True, False, True) == cached
+
+    second = segment_cache_info()
+    assert second.misses == first.misses
+    assert second.hits == first.hits + first.hits + first.misses
+
+    # verbose runs walk every segment
+    walked = top_down_calc(True, facades, 2000, 0, True, False, True)
+    capsys.readouterr()
+    assert list(walked.items()) == list(cached.items())
+    assert segment_cache_info() == second
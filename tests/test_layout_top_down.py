@@ -0,0 +1,33 @@
+from drawscaffold.const.top_down_enum import ScaffoldSide
+from drawscaffold.layout_top_down import drawing_bays, quote_runs
+from drawscaffold.utils.debug_printer import DebugPrinter
+from drawscaffold.utils.facades import build_facade_set
+
+FACADES = ['inset,300,2000,250,F', 'outset,700,2000,250,F', 'outset,350,1200,400,R', 'inset,600,1200,400,R',
+           'inset,400,2000,250,B', 'inset,400,1200,400,L', 'outset,600,1200,500,L', 'inset,850,1200,100,L']
+
+_STEP = {ScaffoldSide.FRONT: (1, 0), ScaffoldSide.BACK: (-1, 0), ScaffoldSide.LEFT: (0, 1), ScaffoldSide.RIGHT: (0, -1)}
+
+
+def test_quote_bays_are_placed_along_their_side():
+    facades = build_facade_set(FACADES)
+
+    for run in quote_runs(facades, DebugPrinter(False)):
+        for prev, bay in zip(run.bays, run.bays[1:]):
+            dx, dy = _STEP[bay.side]
+            assert bay.start_point == (prev.start_point[0] + dx * bay.length, prev.start_point[1] + dy * bay.length)
+
+    assert all(bay.length in (150, 250) for bay in drawing_bays(facades, DebugPrinter(False)))
+
+
+def test_open_depth_runs_keep_later_corners_in_place():
+    # 560 deep is two 250 bays and 60 cm open, the rest of the front continues from their end
+    facades = build_facade_set(['inset,500,2000,560,F', 'inset,0,1200,0,R'])
+
+    runs = quote_runs(facades, DebugPrinter(False))
+    assert [(bay.start_point, bay.length) for bay in runs[1].bays] == [((525, 225), 250), ((525, 475), 250)]
+    assert runs[2].bays[0].start_point == (845, 475)
+
+    bays = drawing_bays(facades, DebugPrinter(False))
+    assert [(bay.start_point, bay.length) for bay in bays[3:6]] == [((525, 225), 250), ((525, 475), 250),
+                                                                   ((845, 475), 250)]
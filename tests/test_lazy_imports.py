@@ -0,0 +1,15 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks'))
+
+from startup_benchmark import CASES, probe_entry_point
+
+
+def test_calculation_paths_skip_drawing_dependencies():
+    for name, argv in CASES.items():
+        exit_code, stdout, heavy = probe_entry_point(argv)
+        # the calculation has to have run, not stopped at argument parsing
+        assert exit_code == 0, name
+        assert stdout.strip(), name
+        assert heavy == [], name
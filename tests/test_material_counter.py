@@ -0,0 +1,40 @@
+from drawscaffold.calculator.material_counter import ArrayMaterialCounter, MaterialRegistry
+
+
+def test_counts_keep_first_added_order():
+    counter = ArrayMaterialCounter(MaterialRegistry())
+    for name in ['vert_220cm', 'tie', 'vert_220cm', 'PLATFORM_250']:
+        counter.material_add(name)
+    counter.material_add('tie', 4)
+
+    assert list(counter.counter_dict.items()) == [('vert_220cm', 2), ('tie', 5), ('PLATFORM_250', 1)]
+
+
+def test_add_many_grows_past_the_initial_size():
+    registry = MaterialRegistry()
+    counter = ArrayMaterialCounter(registry)
+
+    for i in range(100):
+        counter.add_many(registry.id(f'PART_{i}'), i)
+    counter.scale(3)
+
+    assert counter.counter_dict['PART_99'] == 297
+    assert len(counter.counter_dict) == 100
+
+
+def test_empty_counter_is_truthy():
+    # the diagonal patterns only count when they are handed a counter
+    assert ArrayMaterialCounter(MaterialRegistry())
+
+
+def test_text_materials_are_not_interned():
+    registry = MaterialRegistry()
+    counter = ArrayMaterialCounter(registry)
+    counter.material_add('tie')
+    counter.text_material_add('SIGN_ACME 250cm', 2)
+    counter.material_add('PLATFORM_250')
+    counter.text_material_add('SIGN_ACME 250cm')
+    counter.scale(2)
+
+    assert list(counter.counter_dict.items()) == [('tie', 2), ('SIGN_ACME 250cm', 6), ('PLATFORM_250', 2)]
+    assert len(registry) == 2
@@ -0,0 +1,118 @@
+import os
+import time
+
+from drawscaffold.utils import output_cache
+from drawscaffold.utils.facades import build_facade_set
+from drawscaffold.utils.output_cache import OutputCache, output_key
+from drawscaffold.utils.render_pipeline import OutputCollector
+
+FACADES = ['inset,300,2000,250,F', 'outset,350,1200,400,R']
+
+
+def _exported(tmp_path, name, return_bytes=False):
+    outputs = OutputCollector(return_bytes)
+    paths = {"dxf": str(tmp_path / f"{name}.dxf"), "jpg": str(tmp_path / f"{name}.jpg")}
+    outputs.add("dxf", paths["dxf"], b"0\nSECTION\n")
+    outputs.add("jpg", paths["jpg"], b"\xff\xd8jpeg")
+    return outputs, paths
+
+
+def test_key_follows_the_inputs_version_and_code(monkeypatch):
+    key = output_key("top_down", facades=build_facade_set(FACADES), dxf=True, dxf_format="ascii")
+
+    assert key == output_key("top_down", dxf_format="ascii", dxf=True, facades=build_facade_set(list(FACADES)))
+    assert key != output_key("top_down", facades=build_facade_set(FACADES), dxf=True, dxf_format="gzip")
+    assert key != output_key("2d", facades=build_facade_set(FACADES), dxf=True, dxf_format="ascii")
+
+    monkeypatch.setattr(output_cache, "code_revision", lambda: "edited")
+    assert key != output_key("top_down", facades=build_facade_set(FACADES), dxf=True, dxf_format="ascii")
+
+    monkeypatch.undo()
+    monkeypatch.setattr(output_cache, "__version__", "0.0.0")
+    assert key != output_key("top_down", facades=build_facade_set(FACADES), dxf=True, dxf_format="ascii")
+
+
+def test_bytes_come_back_without_rendering(tmp_path):
+    cache = OutputCache(tmp_path / "cache")
+    outputs, paths = _exported(tmp_path, "first", return_bytes=True)
+    assert not cache.restore("k", OutputCollector(True), paths)
+
+    cache.store("k", outputs)
+
+    restored = OutputCollector(True)
+    assert cache.restore("k", restored, paths)
+    assert restored.result() == outputs.result()
+    assert not cache.restore("k", OutputCollector(True), {"dxf": paths["dxf"]})
+
+
+def test_timestamped_files_are_reused(tmp_path):
+    cache = OutputCache(tmp_path / "cache")
+    outputs, first = _exported(tmp_path, "p_1")
+    cache.store("k", outputs)
+
+    restored = OutputCollector()
+    assert cache.restore("k", restored, {"dxf": str(tmp_path / "p_2.dxf"), "jpg": str(tmp_path / "p_2.jpg")},
+                         reuse_paths=True)
+    assert restored.result() == list(first.values())
+    assert not (tmp_path / "p_2.dxf").exists()
+
+    # an asked for name gets a copy
+    named = {"dxf": str(tmp_path / "p_id.dxf"), "jpg": str(tmp_path / "p_id.jpg")}
+    restored = OutputCollector()
+    assert cache.restore("k", restored, named)
+    assert restored.result() == list(named.values())
+    assert (tmp_path / "p_id.jpg").read_bytes() == b"\xff\xd8jpeg"
+
+
+def test_overwritten_files_are_not_reused(tmp_path):
+    cache = OutputCache(tmp_path / "cache")
+    outputs, first = _exported(tmp_path, "p_1")
+    cache.store("k", outputs)
+
+    # same size, other content
+    (tmp_path / "p_1.jpg").write_bytes(b"\xff\xd8JPEG")
+
+    second = {"dxf": str(tmp_path / "p_2.dxf"), "jpg": str(tmp_path / "p_2.jpg")}
+    restored = OutputCollector()
+    assert cache.restore("k", restored, second, reuse_paths=True)
+    assert restored.result() == list(second.values())
+    assert (tmp_path / "p_2.jpg").read_bytes() == b"\xff\xd8jpeg"
+
+
+def test_eviction_by_age_then_size(tmp_path):
+    cache = OutputCache(tmp_path / "cache", max_age_days=1)
+    for key in ("old", "a", "b"):
+        outputs, _ = _exported(tmp_path, key, return_bytes=True)
+        cache.store(key, outputs)
+        if key == "old":
+            os.utime(tmp_path / "cache" / "old" / "manifest.json", (time.time() - 2 * 86400,) * 2)
+        if key == "a":
+            # room for one entry, the least recently used one goes
+            entry_size = sum(f.stat().st_size for f in (tmp_path / "cache" / "a").iterdir())
+            cache.max_bytes = entry_size * 1.5
+            os.utime(tmp_path / "cache" / "a" / "manifest.json", (time.time() - 60,) * 2)
+
+    assert not (tmp_path / "cache" / "old").exists()
+    assert not (tmp_path / "cache" / "a").exists()
+    assert (tmp_path / "cache" / "b").exists()
+
+
+def test_files_of_another_directory_are_not_reused(tmp_path):
+    cache = OutputCache(tmp_path / "cache")
+    (tmp_path / "out").mkdir()
+    (tmp_path / "out2").mkdir()
+    outputs, _ = _exported(tmp_path / "out", "p_1")
+    cache.store("k", outputs)
+
+    second = {"dxf": str(tmp_path / "out2" / "p_2.dxf"), "jpg": str(tmp_path / "out2" / "p_2.jpg")}
+    restored = OutputCollector()
+    assert cache.restore("k", restored, second, reuse_paths=True)
+    assert restored.result() == list(second.values())
+    assert (tmp_path / "out2" / "p_2.jpg").read_bytes() == b"\xff\xd8jpeg"
+
+    # from then on the second directory reuses its own copy
+    restored = OutputCollector()
+    assert cache.restore("k", restored, {"dxf": str(tmp_path / "out2" / "p_3.dxf"),
+                                         "jpg": str(tmp_path / "out2" / "p_3.jpg")}, reuse_paths=True)
+    assert restored.result() == list(second.values())
+    assert (tmp_path / "out" / "p_1.jpg").read_bytes() == b"\xff\xd8jpeg"
@@ -0,0 +1,25 @@
+import pytest
+
+from drawscaffold.utils.preview import PREVIEW_PROFILES, PreviewProfile, preview_profile, raster_size
+
+
+def test_a4_sizes_per_dpi():
+    assert raster_size(210, 297, 300) == (2480, 3508)
+    assert raster_size(210, 297, 150) == (1240, 1754)
+    assert raster_size(210, 297, 72) == (595, 842)
+
+
+def test_max_px_bounds_the_longest_side():
+    assert raster_size(210, 297, 72, max_px=400) == (283, 400)
+    assert raster_size(297, 210, 300, max_px=400) == (400, 283)
+    # a bound larger than the page at that dpi leaves it as is
+    assert raster_size(210, 297, 72, max_px=5000) == (595, 842)
+
+
+def test_profiles_by_name_or_value():
+    assert preview_profile() == PreviewProfile(300)
+    assert preview_profile("web") is PREVIEW_PROFILES["web"]
+    assert preview_profile([150, 600, 90]) == PreviewProfile(150, 600, 90)
+
+    with pytest.raises(ValueError):
+        preview_profile("huge")
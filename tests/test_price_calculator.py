@@ -0,0 +1,26 @@
+from drawscaffold.calculator.price_calculator import PriceTable, calculate_price, calculate_prices
+
+
+def test_tier_boundaries():
+    assert calculate_price({}) == (5000, "TRY", "₺")
+    assert calculate_price({"vert_220cm": 19, "FOOT_STD": 500}) == (5000, "TRY", "₺")
+    assert calculate_price({"vert_220cm": 10, "l_part": 10}) == (10000, "TRY", "₺")
+    assert calculate_price({"vert_220cm": 99}) == (20000, "TRY", "₺")
+    assert calculate_price({"vert_220cm": 60, "vert_120cm": 40}) == (100 * 5 * 35, "TRY", "₺")
+    assert calculate_price({"triangle": 300}) == (300 * 5 * 30, "TRY", "₺")
+
+
+def test_batch_matches_one_by_one():
+    batch = [{"vert_220cm": n, "vert_120cm": n // 3, "tie": n} for n in range(0, 500, 7)]
+
+    assert calculate_prices(batch) == [calculate_price(materials) for materials in batch]
+
+
+def test_earliest_matching_tier_wins():
+    table = PriceTable([
+        {"start": 1, "end": 50, "price": 1, "m2": None, "currency": "A", "symbol": "a"},
+        {"start": 1, "end": 20, "price": 2, "m2": None, "currency": "B", "symbol": "b"},
+        {"start": 50, "end": 60, "price": 3, "m2": None, "currency": "C", "symbol": "c"},
+    ], ["x"])
+
+    assert table.prices([{"x": 10}, {"x": 55}, {"x": 60}]) == [(1, "A", "a"), (3, "C", "c"), (-1, "-1", "-1")]
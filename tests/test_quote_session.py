@@ -0,0 +1,69 @@
+from drawscaffold.calculate_top_down import top_down_calc
+from drawscaffold.quote_session import QuoteSession
+from drawscaffold import service
+from drawscaffold.service import handle_request
+from drawscaffold.utils.facades import build_facade_set
+
+FACADES = ['inset,300,2000,250,F', 'outset,700,2000,250,F', 'outset,350,1200,400,R', 'inset,600,1200,400,R',
+           'inset,400,2000,250,B', 'inset,400,1200,400,L', 'outset,600,1200,500,L', 'inset,850,1200,100,L']
+
+
+def _full(facades):
+    return list(top_down_calc(False, build_facade_set(facades), 2000, 12, False, False, True).items())
+
+
+def test_edits_match_a_full_recount():
+    session = QuoteSession(FACADES, 2000, 12, use_zigzag_pattern=True)
+    assert list(session.materials.items()) == _full(FACADES)
+
+    quote = session.set_facade(4, 'inset,700,2000,250,B')
+    assert list(quote["materials"].items()) == _full(session.facades)
+    assert 0 < session.recounted < len(FACADES)
+
+    session.add_facade('outset,1200,2000,100,F')
+    assert list(session.materials.items()) == _full(session.facades)
+
+    session.remove_facade(0)
+    assert list(session.materials.items()) == _full(session.facades)
+    assert session.facades[0] == 'outset,700,2000,250,F'
+
+
+def test_bad_facade_leaves_the_session_as_it_was():
+    session = QuoteSession(FACADES, 2000, 12)
+    before = session.quote()
+
+    try:
+        session.set_facade(0, 'inset,300,2000,F')
+    except ValueError:
+        pass
+
+    assert session.facades == FACADES
+    assert session.quote() == before
+
+
+def test_service_sessions():
+    opened = handle_request({"id": 1, "op": "quote_open", "args": {"facades": FACADES, "h": 2000, "slope": 12}})
+    session_id = opened["result"]["session"]
+
+    edited = handle_request({"id": 2, "op": "quote_edit", "args": {"session": session_id, "index": 7}})
+    assert edited["result"]["materials"] == dict(
+        top_down_calc(False, build_facade_set(FACADES[:7]), 2000, 12, False, False, False))
+
+    assert handle_request({"id": 3, "op": "quote_close", "args": {"session": session_id}})["result"] == {"closed": True}
+    assert handle_request({"id": 4, "op": "quote_edit", "args": {"session": session_id, "index": 0}})["ok"] is False
+
+
+def test_service_drops_the_least_recently_used_session(monkeypatch):
+    monkeypatch.setattr(service, "QUOTE_SESSIONS_MAX", 2)
+    monkeypatch.setattr(service, "_quote_sessions", type(service._quote_sessions)())
+
+    def open_session():
+        args = {"facades": FACADES[:2], "h": 2000, "slope": 12}
+        return handle_request({"id": 1, "op": "quote_open", "args": args})["result"]["session"]
+
+    first, second = open_session(), open_session()
+    assert handle_request({"id": 2, "op": "quote_edit", "args": {"session": first, "index": 1}})["ok"]
+    third = open_session()
+
+    assert list(service._quote_sessions) == [first, third]
+    assert handle_request({"id": 3, "op": "quote_edit", "args": {"session": second, "index": 0}})["ok"] is False
@@ -0,0 +1,131 @@
+import io
+import sys
+import threading
+import time
+import types
+from concurrent.futures import ThreadPoolExecutor
+
+import ezdxf
+import pytest
+from PIL import Image
+
+from drawscaffold.utils import render_pipeline
+from drawscaffold.utils.render_pipeline import OutputCollector, RenderPipeline, run_exports
+
+
+def _pipeline():
+    doc = ezdxf.new("R2018")
+    msp = doc.modelspace()
+    msp.add_line((0, 0), (100, 50))
+    return RenderPipeline(doc, msp)
+
+
+def test_modelspace_is_drawn_once(monkeypatch):
+    walks = []
+
+    class CountedFrontend(render_pipeline.Frontend):
+        def draw_layout(self, *args, **kwargs):
+            walks.append(1)
+            return super().draw_layout(*args, **kwargs)
+
+    monkeypatch.setattr(render_pipeline, "Frontend", CountedFrontend)
+    renderer = _pipeline()
+
+    plain = renderer.svg_string()
+    swapped = renderer.svg_string(color_swap=True)
+
+    assert len(walks) == 1
+    assert plain != swapped
+    assert renderer.svg_string() is plain
+
+
+def test_thumbnail_reuses_the_rasterized_page(monkeypatch):
+    rasterized = []
+
+    def svg2png(bytestring, dpi, **kwargs):
+        rasterized.append((dpi, kwargs))
+        buffer = io.BytesIO()
+        Image.new("RGBA", (20, 30), "white").save(buffer, format="PNG")
+        return buffer.getvalue()
+
+    monkeypatch.setitem(sys.modules, "cairosvg", types.SimpleNamespace(svg2png=svg2png))
+    renderer = _pipeline()
+
+    png = renderer.png_bytes(dpi=300)
+    jpg = renderer.thumbnail_bytes("full")
+
+    assert rasterized == [(300, {})]
+    assert renderer.png_bytes(dpi=300) is png
+    assert jpg.startswith(b"\xff\xd8")
+
+
+def test_collector_writes_files_or_keeps_bytes(tmp_path):
+    on_disk = OutputCollector()
+    on_disk.add("jpg", str(tmp_path / "p.jpg"), b"jpeg")
+    on_disk.add("png", str(tmp_path / "p.png"), b"png")
+
+    assert on_disk.result() == [str(tmp_path / "p.png"), str(tmp_path / "p.jpg")]
+    assert (tmp_path / "p.jpg").read_bytes() == b"jpeg"
+    assert on_disk.data == {}
+
+    in_memory = OutputCollector(return_bytes=True)
+    in_memory.add("jpg", str(tmp_path / "q.jpg"), b"jpeg")
+    in_memory.add("png", str(tmp_path / "q.png"), b"png")
+
+    assert in_memory.result() == {"png": b"png", "jpg": b"jpeg"}
+    assert not (tmp_path / "q.jpg").exists()
+
+
+def test_collector_dxf(tmp_path):
+    doc = ezdxf.new("R2018")
+    doc.modelspace().add_line((0, 0), (10, 0))
+
+    on_disk = OutputCollector()
+    on_disk.add_dxf(str(tmp_path / "p.dxf"), doc)
+    assert on_disk.result() == [str(tmp_path / "p.dxf")]
+    assert ezdxf.readfile(tmp_path / "p.dxf").modelspace().query("LINE")
+
+    in_memory = OutputCollector(return_bytes=True)
+    in_memory.add_dxf(str(tmp_path / "q.dxf"), doc)
+    assert b"LINE" in in_memory.result()["dxf"]
+    assert not (tmp_path / "q.dxf").exists()
+
+
+def test_outputs_keep_their_order_whatever_finishes_first(tmp_path):
+    outputs = OutputCollector()
+
+    def add(kind, delay):
+        def export():
+            time.sleep(delay)
+            outputs.add(kind, str(tmp_path / kind), kind.encode())
+        return export
+
+    run_exports({"png": add("png", 0.05), "dxf": add("dxf", 0.0), "jpg": add("jpg", 0.02)})
+
+    assert outputs.result() == [str(tmp_path / kind) for kind in ("png", "dxf", "jpg")]
+
+
+def test_export_errors_reach_the_caller():
+    def broken():
+        raise ValueError("no page")
+
+    with pytest.raises(ValueError):
+        run_exports({"svg": broken, "jpg": lambda: None})
+
+
+def test_shared_recording_is_rendered_once():
+    renderer = _pipeline()
+
+    calls = []
+    player_copy = renderer._player.copy
+
+    def counted_copy():
+        calls.append(threading.get_ident())
+        return player_copy()
+
+    renderer._player.copy = counted_copy
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        svgs = list(pool.map(lambda _: renderer.svg_string(), range(4)))
+
+    assert len(calls) == 1
+    assert len(set(svgs)) == 1
@@ -0,0 +1,37 @@
+import io
+import json
+
+from drawscaffold.calculate_top_down import top_down_calc
+from drawscaffold.service import handle_request, serve_stdio
+from drawscaffold.utils.facades import build_facade_set
+
+FACADES = ['inset,300,2000,250,F', 'outset,700,2000,250,F', 'outset,350,1200,400,R', 'inset,600,1200,400,R']
+
+
+def test_top_down_calc_matches_direct_call():
+    args = {"facades": FACADES, "h": 2000, "slope": 12, "toe_board": False,
+            "use_x_pattern": False, "use_zigzag_pattern": True}
+    response = handle_request({"id": 7, "op": "top_down_calc", "args": args})
+
+    assert response["id"] == 7
+    assert response["ok"]
+    assert response["result"] == top_down_calc(False, build_facade_set(FACADES), 2000, 12, False, False, True)
+
+
+def test_errors_are_reported_per_request():
+    assert handle_request({"id": 1, "op": "unknown"})["ok"] is False
+    assert handle_request({"id": 2, "op": "top_down_calc", "args": {}})["ok"] is False
+
+
+def test_stdio_protocol_is_one_json_line_per_request():
+    stdin = io.StringIO(
+        json.dumps({"id": 1, "op": "calculate_price", "args": {"materials": {"vert_220cm": 30}}}) + "\n"
+        + "\n"
+        + "not json\n"
+    )
+    stdout = io.StringIO()
+    serve_stdio(stdin, stdout)
+
+    responses = [json.loads(line) for line in stdout.getvalue().splitlines()]
+    assert responses[0] == {"id": 1, "ok": True, "result": {"price": 10000, "currency": "TRY", "symbol": "₺"}}
+    assert responses[1]["ok"] is False
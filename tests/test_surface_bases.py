@@ -0,0 +1,47 @@
+import random
+
+import pytest
+
+from drawscaffold.calculate import MaterialCounter
+from drawscaffold.calculator import surface_bases
+from drawscaffold.calculator.calculator_2d import Calculator2D
+from drawscaffold.calculator.surface_bases import select_bases, surface_start_points
+
+
+def _selection(start_points):
+    bases = select_bases(start_points)
+    counter = MaterialCounter()
+    bases.add_materials(counter, Calculator2D())
+    return list(counter.counter_dict.items()), bases.connection_centers()
+
+
+def test_flat_surface_stands_on_feet():
+    materials, centers = _selection([0.0, 0.0, 0.0])
+
+    assert materials == [("FOOT_STD", 3)]
+    assert centers == [[(0, -1.5)], [(250, -1.5)], [(500, -1.5)]]
+
+
+def test_kits_follow_the_difference():
+    # 0, under a foot, an adjustment, a half foot, a full foot, then a floor and a half below the top
+    materials, centers = _selection([0.0, -30.0, -53.0, -90.0, -150.0, -330.0])
+
+    assert materials == [("FOOT_STD", 3), ("ADJ_70", 1), ("FOOT_HALF", 1), ("FOOT_FULL", 1), ("vert_120cm", 1),
+                         ("vert_220cm", 1)]
+    assert [len(col) for col in centers] == [1, 1, 1, 1, 1, 2]
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_arrays_match_the_column_loop(seed, monkeypatch):
+    pytest.importorskip("numpy")
+    rnd = random.Random(seed)
+
+    for _ in range(60):
+        args = (rnd.randint(1, 300), rnd.uniform(100, 70000), rnd.choice([0, 3, 12, 40, -25, rnd.uniform(-60, 60)]))
+
+        monkeypatch.setattr(surface_bases, "VECTOR_MIN_COLUMNS", 10 ** 9)
+        looped = _selection(surface_start_points(*args))
+        monkeypatch.setattr(surface_bases, "VECTOR_MIN_COLUMNS", 1)
+        vectorized = _selection(surface_start_points(*args))
+
+        assert vectorized == looped
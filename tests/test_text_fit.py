@@ -0,0 +1,73 @@
+import pytest
+
+from drawscaffold.shapes import font_metrics, text_fit
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    monkeypatch.setenv("DRAWSCAFFOLD_CACHE_DIR", str(tmp_path))
+    monkeypatch.setattr(font_metrics, "_metrics", dict())
+    text_fit.clear_text_fit_cache()
+    yield tmp_path
+    text_fit.use_disk_cache(True)
+
+
+LABELS = [
+    ("250cm", 20.0, 26.0, dict(h_min=1.5, h_max=15.0)),
+    ("ScaffAI Toe Board", 241.0, 20.0, dict()),
+    ("a very long toe board text that has to wrap over more than three lines of the sign", 241.0, 20.0, dict()),
+    ("Süpürgelik", 30.0, 10.0, dict(line_spacing=1.5)),
+]
+
+
+@pytest.mark.parametrize("text,box_w,box_h,kwargs", LABELS)
+def test_cached_layout_matches_the_fitting(text, box_w, box_h, kwargs):
+    expected = text_fit._fit_text_to_box(text, box_w, box_h, **kwargs)
+
+    assert text_fit.fit_text_to_box(text, box_w, box_h, **kwargs) == expected
+    assert text_fit.fit_text_to_box(text, box_w, box_h, **kwargs) == expected
+    assert text_fit.text_fit_cache_info().hits == 1
+
+    # a fresh process only reads the layout back from disk
+    text_fit.clear_text_fit_cache()
+    assert text_fit.fit_text_to_box(text, box_w, box_h, **kwargs) == expected
+
+
+def test_callers_get_their_own_lines():
+    _, lines = text_fit.fit_text_to_box("150cm", 20, 26)
+    expected = list(lines)
+    lines.append("changed")
+
+    assert text_fit.fit_text_to_box("150cm", 20, 26)[1] == expected
+
+
+def test_disk_cache_can_be_turned_off(isolated_cache):
+    text_fit.use_disk_cache(False)
+    text_fit.fit_text_to_box("250cm", 20, 26)
+
+    assert not (isolated_cache / "text_fit").exists()
+
+
+def test_store_is_written_in_batches_and_capped(isolated_cache, monkeypatch):
+    monkeypatch.setattr(text_fit, "TEXT_FIT_FLUSH_EVERY", 4)
+    monkeypatch.setattr(text_fit, "TEXT_FIT_STORE_SIZE", 6)
+
+    for i in range(3):
+        text_fit.fit_text_to_box(f"label {i}", 241, 20)
+    store = text_fit._store("Arial")
+    assert not store.path.exists()
+
+    text_fit.fit_text_to_box("label 3", 241, 20)
+    assert len(store._read()) == 4
+
+    # another process wrote meanwhile, its layouts are kept
+    other = text_fit._FitStore(store.path)
+    other.add("other", 1.0, ["other"])
+    other.flush()
+
+    for i in range(4, 8):
+        text_fit.fit_text_to_box(f"label {i}", 241, 20)
+    entries = store._read()
+    assert len(entries) == 6
+    assert "other" in entries
+    assert all(f'"label {i}"' in " ".join(entries) for i in range(4, 8))
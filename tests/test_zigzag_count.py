@@ -0,0 +1,20 @@
+import random
+
+import pytest
+
+from drawscaffold.calculate import material_calculator2D
+
+
+@pytest.mark.parametrize('seed', range(4))
+def test_counted_diagonals_match_the_geometric_walk(seed):
+    rnd = random.Random(seed)
+
+    for _ in range(80):
+        h = rnd.choice([0, 150, 220, 400, 900, 2000, 6000, rnd.uniform(0, 20000)])
+        w = rnd.uniform(100, 8000)
+        slope = rnd.choice([0, 1, 5, 12, 25, 40, -5, -15, -40])
+        args = (False, h, w, slope, None, rnd.random() < 0.5, False, True, False, rnd.randint(1, 4))
+
+        counted = material_calculator2D(*args, analytic=True)
+        walked = material_calculator2D(*args, analytic=False)
+        assert list(counted.items()) == list(walked.items())
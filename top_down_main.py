@@ -1,19 +1,26 @@
 import argparse
 import json
+import sys
 
 from drawscaffold.calculate_top_down import top_down_calc
 from drawscaffold.calculator.price_calculator import calculate_price
-from drawscaffold.drawer_top_down import top_down_drawer
+from drawscaffold.utils.facades import build_facade_set
+from drawscaffold.utils.preview import DEFAULT_PREVIEW, PREVIEW_PROFILES
 
 parser = argparse.ArgumentParser(description='Draw scaffolds top-down professionally')
-parser.add_argument("--facade", action="append", required=True, help="facade definition: inset/outset (optional),start,length,depth,F(ront)/R(ight)/L(eft)/B(ack)")
+parser.add_argument("--facade", action="append", help="facade definition: inset/outset (optional),start,length,depth,F(ront)/R(ight)/L(eft)/B(ack)")
 
 parser.add_argument("--image", action="store_true", help="get the drawing and image of it")
 parser.add_argument("--svg", action="store_true", help="get the drawing and svg of it")
 parser.add_argument("--dxf", action="store_true", help="get the drawing and dxf of it")
-
-parser.add_argument("--height-in-cm", type=float, required=True, help="construct height in centimeter")
-parser.add_argument("--surface-slope", type=float, required=True, help="surface slope")
+parser.add_argument("--dxf-text-paths", action="store_true", help="convert the dxf labels to outlines once per block")
+parser.add_argument("--dxf-format", choices=["ascii", "binary", "gzip", "zstd"], default="ascii", help="dxf file format, gzip and zstd compress the ascii dxf")
+parser.add_argument("--no-cache", action="store_true", help="render the drawings even if the same ones are in the output cache")
+parser.add_argument("--image-dpi", type=int, default=300, help="resolution of the png image")
+parser.add_argument("--preview", choices=list(PREVIEW_PROFILES), default=DEFAULT_PREVIEW, help="thumbnail profile: full (300 dpi), screen (150 dpi), draft (72 dpi) or web (400 px)")
+
+parser.add_argument("--height-in-cm", type=float, help="construct height in centimeter")
+parser.add_argument("--surface-slope", type=float, help="surface slope")
 parser.add_argument("--toe-board-text", action="store_true", help="the text on toe board")
 
 pattern_group = parser.add_mutually_exclusive_group()
@@ -27,7 +34,28 @@ parser.add_argument("--project-name", type=str, default='project', help="The nam
 parser.add_argument("--output-id", type=str, default=None, help="Optional output id for predictable filenames")
 parser.add_argument("--verbose", action="store_true", help="gives outputs for debug")
 
+parser.add_argument("--batch", type=str, default=None, help="JSONL file of projects to run in parallel, one job per line")
+parser.add_argument("--batch-output", type=str, default=None, help="JSONL file for the batch results (default: stdout)")
+parser.add_argument("--workers", type=int, default=None, help="number of batch worker processes (default: available cores)")
+
 args = parser.parse_args()
+
+if args.batch:
+    from drawscaffold.batch import run_batch
+
+    with open(args.batch) as jobs:
+        out = open(args.batch_output, "w") if args.batch_output else sys.stdout
+        try:
+            failed = run_batch(jobs, out, args.workers)
+        finally:
+            if out is not sys.stdout:
+                out.close()
+
+    exit(1 if failed else 0)
+
+if args.facade is None or args.height_in_cm is None or args.surface_slope is None:
+    parser.error("--facade, --height-in-cm and --surface-slope are required unless --batch is given")
+
 facades = args.facade
 image = args.image
 svg = args.svg
@@ -47,46 +75,27 @@ verbose = args.verbose
 if not facades or len(facades)==0:
     exit(-1)
 
-facade_dict = {
-    'F': [],
-    'R': [],
-    'L': [],
-    'B': []
-}
-
-for facade in facades:
-    for facade_key in facade_dict.keys():
-        if facade_key in facade:
-            facade_dict[facade_key].append(facade)
-
-if len(facade_dict['F'])==0 and len(facade_dict['B'])!=0:
-    facade_length = facade_dict['B'][-1].split(',')[2]
-    default_text = f'inset,0,{facade_length},0,F'
-    facade_dict['F'].append(default_text)
-if len(facade_dict['B'])==0 and len(facade_dict['F'])!=0:
-    facade_length = facade_dict['F'][-1].split(',')[2]
-    default_text = f'inset,0,{facade_length},0,B'
-    facade_dict['B'].append(default_text)
-if len(facade_dict['R'])==0 and len(facade_dict['L'])!=0:
-    facade_length = facade_dict['L'][-1].split(',')[2]
-    default_text = f'inset,0,{facade_length},0,R'
-    facade_dict['R'].append(default_text)
-if len(facade_dict['L'])==0 and len(facade_dict['R'])!=0:
-    facade_length = facade_dict['R'][-1].split(',')[2]
-    default_text = f'inset,0,{facade_length},0,L'
-    facade_dict['L'].append(default_text)
+try:
+    facade_set = build_facade_set(facades)
+except ValueError as e:
+    parser.error(str(e))
 
 if calculate:
-    material_dict = top_down_calc(verbose, facade_dict, h, slope, toe_board, x_pattern, zigzag_pattern)
+    material_dict = top_down_calc(verbose, facade_set, h, slope, toe_board, x_pattern, zigzag_pattern)
     print(material_dict)
 
     exit(0)
 if arg_calculate_price:
-    material_dict = top_down_calc(verbose, facade_dict, h, slope, toe_board, x_pattern, zigzag_pattern)
+    material_dict = top_down_calc(verbose, facade_set, h, slope, toe_board, x_pattern, zigzag_pattern)
     price, currency, symbol = calculate_price(material_dict)
 
     print(f"{price} {symbol}({currency})")
     exit(0)
 
-file_paths = top_down_drawer(verbose, facade_dict, image, dxf, svg, project_name, output_id)
+# the drawer brings in ezdxf, cairosvg and Pillow; only load them when drawing
+from drawscaffold.drawer_top_down import top_down_drawer
+
+file_paths = top_down_drawer(verbose, facade_set, image, dxf, svg, project_name, output_id,
+                             dxf_text_paths=args.dxf_text_paths, dxf_format=args.dxf_format,
+                             use_cache=not args.no_cache, image_dpi=args.image_dpi, preview=args.preview)
 print(json.dumps({"paths": file_paths}))